@@ -0,0 +1,288 @@
+"""
+================================================================================
+XSS Scanner - 다중 대상 배치 스캔 (batch_scan.py)
+================================================================================
+
+여러 기본 URL 을 한 번에 크롤링/분석/스캔합니다. (Requests 엔진)
+
+- 모든 대상이 하나의 워커 예산(스레드 수)을 공유
+- 작업은 호스트별 큐에 쌓이고 라운드로빈으로 배분
+  (호스트당 동시 작업 수 제한 -> 느린 대상이 다른 대상을 굶기지 않음)
+- 결과는 대상별 TargetResult 로 수집 (크롤링/분석 단계 오류는 error 에 기록하고 완료 처리)
+
+전체 소요 시간은 대상 수가 아니라 전체 처리량으로 결정됩니다.
+
+사용법:
+    from batch_scan import BatchScanner, load_targets
+
+    batch = BatchScanner(load_targets("targets.txt"), workers=40, per_host=8)
+    for target in batch.run().values():
+        print(target.base_url, target.results.stats())
+================================================================================
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from config import Config
+from http_transport import HttpTransport
+from result_store import ResultStore
+from xss_engine import SiteCrawler, XSSScanner, XSS_PAYLOADS_QUICK, XSS_PAYLOADS_FULL
+
+
+def load_targets(path: str) -> List[str]:
+    """대상 파일 읽기 (한 줄에 URL 하나, 빈 줄과 # 주석 무시, 중복 제거)"""
+    targets = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            url = line.split('#', 1)[0].strip()
+            if url and url not in targets:
+                targets.append(url)
+    return targets
+
+
+# ==============================================================================
+# 라운드로빈 스케줄러
+# ==============================================================================
+
+class HostScheduler:
+    """
+    호스트별 작업 큐 + 라운드로빈 배분
+
+    워커 스레드는 run_worker() 를 실행하며, 실행 중인 작업이 새 작업을
+    submit() 할 수 있습니다. 대기/실행 중인 작업이 모두 끝나면 워커가 종료됩니다.
+    """
+
+    def __init__(self, per_host: int):
+        self.per_host = max(1, per_host)
+        self._cond = threading.Condition()
+        self._queues: 'OrderedDict[str, deque]' = OrderedDict()
+        self._inflight: Dict[str, int] = {}
+        self._pending = 0  # 대기 + 실행 중 작업 수
+        self._closed = False
+
+    def submit(self, host: str, job: Callable[[], None]) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._queues.setdefault(host, deque()).append(job)
+            self._pending += 1
+            self._cond.notify()
+
+    def close(self) -> None:
+        """대기 중인 작업을 버리고 워커 종료"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _pick(self):
+        # 큐 순서대로 돌며 여유가 있는 호스트의 작업을 꺼내고, 그 호스트를 맨 뒤로 보냄
+        for host, queue in self._queues.items():
+            if queue and self._inflight.get(host, 0) < self.per_host:
+                self._queues.move_to_end(host)
+                return host, queue.popleft()
+        return None, None
+
+    def run_worker(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed or self._pending == 0:
+                        return
+                    host, job = self._pick()
+                    if job is not None:
+                        break
+                    self._cond.wait()
+                self._inflight[host] = self._inflight.get(host, 0) + 1
+            try:
+                job()
+            except Exception:
+                pass
+            finally:
+                with self._cond:
+                    self._inflight[host] -= 1
+                    self._pending -= 1
+                    self._cond.notify_all()
+
+
+# ==============================================================================
+# 배치 스캐너
+# ==============================================================================
+
+@dataclass
+class TargetResult:
+    """대상별 스캔 결과"""
+    base_url: str
+    host: str
+    pages: list = field(default_factory=list)
+    stored_results: list = field(default_factory=list)
+    results: ResultStore = field(default_factory=ResultStore)
+    tests_total: int = 0
+    tests_done: int = 0
+    finished: bool = False
+    error: str = ""  # 크롤링/저장된 XSS 분석 단계 오류 (있으면 그 대상은 스캔하지 못함)
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    transport: Optional[HttpTransport] = field(default=None, repr=False)
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at or time.time()
+        return end - self.started_at if self.started_at else 0.0
+
+    def summary(self) -> dict:
+        return {
+            'base_url': self.base_url,
+            'pages_crawled': len(self.pages),
+            'stored_xss': len(self.stored_results),
+            'elapsed': round(self.elapsed, 1),
+            **self.results.stats(),
+            **({'error': self.error} if self.error else {}),
+        }
+
+
+class BatchScanner:
+    """여러 대상을 하나의 워커 예산으로 스캔"""
+
+    def __init__(self, targets: List[str], cookies: Dict = None, workers: int = Config.BATCH_WORKERS,
+                 per_host: int = Config.BATCH_PER_HOST, max_pages: int = Config.DEFAULT_MAX_PAGES,
+                 max_depth: int = Config.DEFAULT_MAX_DEPTH, timeout: int = Config.DEFAULT_TIMEOUT,
+                 quick_mode: bool = True, callback=None, content_analysis: str = Config.CONTENT_ANALYSIS):
+        self.targets = targets
+        self.cookies = cookies
+        self.workers = max(1, workers)
+        self.per_host = per_host
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.quick_mode = quick_mode
+        self.callback = callback
+        self.content_analysis = content_analysis
+
+        self.scheduler = HostScheduler(per_host)
+        self.results: Dict[str, TargetResult] = OrderedDict()
+        self._crawlers: List[SiteCrawler] = []
+        self._scanners: List[XSSScanner] = []
+        self._lock = threading.Lock()
+        self._finished_targets = 0
+        self.stop_flag = False
+
+    def log(self, message: str, level: str = 'info'):
+        if self.callback: self.callback(message, level)
+
+    # ----- 대상별 단계 -----
+
+    def _guarded(self, target: TargetResult, phase: str, func: Callable[[], None]):
+        """단계 작업 -> 예외가 나면 대상을 오류와 함께 완료 처리하는 작업"""
+        def job():
+            try:
+                func()
+            except Exception as e:
+                target.error = f"{phase}: {str(e)[:100]}"
+                self.log(f"  ❌ [{target.host}] {target.error}", 'danger')
+                self._finish(target)
+        return job
+
+    def _crawl_job(self, target: TargetResult):
+        def job():
+            target.started_at = time.time()
+            # 대상별 전송 계층을 크롤링/분석/스캔 단계가 공유 (서버 설정 쿠키 유지)
+            target.transport = HttpTransport(cookies=self.cookies, pool_size=self.per_host)
+            crawler = SiteCrawler(target.base_url, max_pages=self.max_pages, max_depth=self.max_depth,
+                                  timeout=self.timeout, transport=target.transport,
+                                  content_analysis=self.content_analysis)
+            with self._lock:
+                self._crawlers.append(crawler)
+            target.pages = crawler.crawl()
+            if self.stop_flag:
+                return
+            self.log(f"  🌐 [{target.host}] 크롤링 완료: {len(target.pages)}개 페이지", 'info')
+            self.scheduler.submit(target.host, self._content_job(target))
+        return self._guarded(target, '크롤링 오류', job)
+
+    def _content_job(self, target: TargetResult):
+        def job():
+            # 저장된 XSS 분석은 이 워커 안에서만 실행 (대상끼리 이미 병렬이므로 대상마다
+            # 스레드/프로세스 풀을 만들지 않음 -> 전체 동시 실행 수는 워커 예산 이내)
+            # 반사형 테스트는 아래에서 스케줄러로 배분
+            scanner = XSSScanner(timeout=self.timeout, threads=1, transport=target.transport,
+                                 analysis_workers=1, content_analysis=self.content_analysis)
+            with self._lock:
+                self._scanners.append(scanner)
+            target.stored_results = scanner.scan_page_content(target.pages)
+            if self.stop_flag:
+                return
+
+            payloads = XSS_PAYLOADS_QUICK if self.quick_mode else XSS_PAYLOADS_FULL
+            tasks = scanner.build_tasks(target.pages, payloads)
+            target.tests_total = len(tasks)
+            if not tasks:
+                self._finish(target)
+                return
+            for _key, func, args in tasks:
+                self.scheduler.submit(target.host, self._test_job(target, func, args))
+        return self._guarded(target, '저장된 XSS 분석 오류', job)
+
+    def _test_job(self, target: TargetResult, func, args):
+        def job():
+            try:
+                if not self.stop_flag:
+                    result = func(*args)
+                    if result is not None:
+                        target.results.add(result)
+                        if result.vulnerable:
+                            self.log(f"  🔴 [{target.host}] 취약점! [{result.parameter}] {result.payload[:30]}...", 'danger')
+            finally:
+                with self._lock:
+                    target.tests_done += 1
+                    done = target.tests_done == target.tests_total
+                if done:
+                    self._finish(target)
+        return job
+
+    def _finish(self, target: TargetResult):
+        with self._lock:
+            if target.finished:
+                return
+            target.finished = True
+            self._finished_targets += 1
+            finished = self._finished_targets
+        target.finished_at = time.time()
+        if target.transport is not None:
+            target.transport.close()
+        stats = target.results.stats()
+        self.log(f"  ✅ [{target.host}] 완료 ({target.elapsed:.0f}초): 취약 {stats['vulnerable']}, "
+                 f"반사 {stats['reflected']}, 저장된XSS {len(target.stored_results)}, 테스트 {stats['tests']}",
+                 'success')
+        if self.callback:
+            self.callback(None, 'scan_progress', int(finished / len(self.results) * 100))
+
+    # ----- 실행 -----
+
+    def run(self) -> Dict[str, TargetResult]:
+        """모든 대상 스캔 (완료될 때까지 블록)"""
+        self.stop_flag = False
+        self.log(f"\n📚 배치 스캔 시작: 대상 {len(self.targets)}개, 워커 {self.workers}, 호스트당 최대 {self.per_host}", 'info')
+
+        for base_url in self.targets:
+            target = TargetResult(base_url=base_url, host=urlparse(SiteCrawler._normalize_url(base_url)).netloc)
+            self.results[base_url] = target
+            self.scheduler.submit(target.host, self._crawl_job(target))
+
+        threads = [threading.Thread(target=self.scheduler.run_worker, daemon=True) for _ in range(self.workers)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+
+        self.log(f"\n✅ 배치 스캔 완료: {self._finished_targets}/{len(self.targets)}개 대상", 'success')
+        return self.results
+
+    def stop(self):
+        self.stop_flag = True
+        self.scheduler.close()
+        with self._lock:
+            for crawler in self._crawlers: crawler.stop()
+            for scanner in self._scanners: scanner.stop()
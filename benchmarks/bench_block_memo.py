@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+XSS Scanner - 템플릿 블록 캐시 마이크로벤치마크
+================================================================================
+
+같은 헤더/내비게이션/사이드바/푸터를 공유하는 페이지 N개를 문서 단위로 분석할 때와
+블록 캐시(block_memo.py)로 분석할 때를 비교합니다.
+
+실행:
+    python benchmarks/bench_block_memo.py
+    python benchmarks/bench_block_memo.py --pages 500 --repeat 3
+================================================================================
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from block_memo import BlockMemo
+from stored_xss import analyze_document
+
+
+def build_site(pages: int) -> list:
+    """템플릿을 공유하는 페이지 목록 (5페이지마다 본문에 저장된 XSS 1건)"""
+    header = ('<header><nav>' + ''.join(f'<a href="/m{i}" onclick="track({i})">메뉴{i}</a>' for i in range(40))
+              + '</nav></header>\n')
+    sidebar = '<aside><ul>' + ''.join(f'<li><a href="/c{i}">분류 {i}</a></li>' for i in range(200)) + '</ul></aside>\n'
+    footer = '<footer><script>var c = document.cookie;</script>' + '<p>copyright</p>' * 100 + '</footer>'
+    site = []
+    for i in range(pages):
+        stored = f'<img src=x onerror=alert({i})>' if i % 5 == 0 else ''
+        main = f'<main><h1>글 {i}</h1>' + '<p>본문 내용</p>\n' * 300 + stored + '</main>\n'
+        site.append(f'<html><head><title>글 {i}</title></head><body><div id="wrap">'
+                    + header + sidebar + main + footer + '</div></body></html>')
+    return site
+
+
+def main():
+    parser = argparse.ArgumentParser(description='템플릿 블록 캐시 벤치마크')
+    parser.add_argument('--pages', type=int, default=200, help='페이지 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    args = parser.parse_args()
+
+    site = build_site(args.pages)
+
+    expected = [sorted(analyze_document(html)[0]) for html in site]
+    memo = BlockMemo()
+    actual = [sorted(memo.analyze(html)[0]) for html in site]
+    assert actual == expected
+    hit_rate = memo.hits / (memo.hits + memo.misses)
+
+    per_document = timeit.timeit(lambda: [analyze_document(html) for html in site], number=args.repeat) / args.repeat
+    # 반복마다 새 캐시 (스캔 한 번과 같은 조건)
+    memoized = timeit.timeit(lambda: [m.analyze(html) for m in [BlockMemo()] for html in site],
+                             number=args.repeat) / args.repeat
+
+    print(f"페이지: {len(site)}개 x {len(site[0]):,} 문자, 반복: {args.repeat}, 블록 적중률: {hit_rate:.0%}")
+    print(f"  문서 단위 분석:   {per_document * 1000:9.1f} ms")
+    print(f"  블록 캐시:        {memoized * 1000:9.1f} ms")
+    print(f"  속도 향상: {per_document / memoized:,.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+XSS Scanner - check_vulnerability 마이크로벤치마크
+================================================================================
+
+기존 방식(전체 본문에 비컴파일 정규식 9개 + 페이로드 정규식)과
+현재 방식(컴파일된 단일 alternation, 반사 위치 윈도우만 검사)을 비교합니다.
+
+실행:
+    python benchmarks/bench_check_vulnerability.py
+    python benchmarks/bench_check_vulnerability.py --size 2000000 --repeat 50
+================================================================================
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xss_engine import XSSScanner
+
+LEGACY_PATTERNS = [
+    r'<script[^>]*>', r'onerror\s*=', r'onload\s*=', r'onclick\s*=',
+    r'onmouseover\s*=', r'onfocus\s*=', r'javascript:', r'<img[^>]+onerror', r'<svg[^>]+onload'
+]
+
+
+def legacy_check_vulnerability(response_text: str, payload: str) -> bool:
+    """기존 구현 (response.text 전체 대상)"""
+    for pattern in LEGACY_PATTERNS:
+        if re.search(pattern, response_text, re.IGNORECASE):
+            if re.search(pattern, payload, re.IGNORECASE): return True
+    return False
+
+
+def build_body(size: int, payload: str) -> bytes:
+    """위험 태그가 없는 큰 페이지 중간에 페이로드가 반사된 응답"""
+    filler = b'<div class="row"><span>item</span><a href="/page">link</a></div>\n'
+    half = filler * (size // (2 * len(filler)) + 1)
+    return half + b'<p>' + payload.encode() + b'</p>' + half
+
+
+def main():
+    parser = argparse.ArgumentParser(description='check_vulnerability 벤치마크')
+    parser.add_argument('--size', type=int, default=1_000_000, help='응답 크기 (바이트)')
+    parser.add_argument('--repeat', type=int, default=20, help='반복 횟수')
+    args = parser.parse_args()
+
+    scanner = XSSScanner(threads=1)
+    # 기존 방식의 최악 경우: 앞쪽 패턴이 본문에 없어 모든 패턴이 전체 본문을 스캔
+    payload = '<svg onload=alert(1)>'
+    body = build_body(args.size, payload)
+    text = body.decode('utf-8')
+    offset = body.find(payload.encode())
+
+    assert legacy_check_vulnerability(text, payload)
+    assert scanner.check_vulnerability(body, payload, offset=offset)
+
+    legacy = timeit.timeit(lambda: legacy_check_vulnerability(text, payload), number=args.repeat) / args.repeat
+    windowed = timeit.timeit(lambda: scanner.check_vulnerability(body, payload, offset=offset), number=args.repeat) / args.repeat
+
+    print(f"응답 크기: {len(body):,} bytes, 반복: {args.repeat}")
+    print(f"  기존 (전체 본문 x 패턴): {legacy * 1000:9.3f} ms")
+    print(f"  윈도우 (단일 정규식):    {windowed * 1000:9.3f} ms")
+    print(f"  속도 향상: {legacy / windowed:,.0f}x")
+
+
+if __name__ == '__main__':
+    main()
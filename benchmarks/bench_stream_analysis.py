@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+XSS Scanner - 큰 페이지 창 단위 분석 메모리 벤치마크
+================================================================================
+
+수 MB 짜리 보고서 페이지를 문서 전체로 분석할 때(본문 문자열 + 검사용 사본)와
+본문 캐시 파일을 mmap 창 단위로 분석할 때의 최대 메모리와 시간을 비교합니다.
+
+실행:
+    python benchmarks/bench_stream_analysis.py
+    python benchmarks/bench_stream_analysis.py --size-mb 50
+================================================================================
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stored_xss import analyze_document
+from stream_analysis import analyze_file
+
+
+def build_report(size: int) -> str:
+    """관리자 보고서 같은 큰 표 (중간에 저장된 XSS 1건)"""
+    row = '<tr><td>2024-12-07</td><td><a href="/order?id=1">주문 내역</a></td><td>완료</td></tr>\n'
+    rows = row * (size // len(row.encode('utf-8')) // 2)
+    stored = '<tr><td><img src=x onerror=alert(1)></td></tr>\n'
+    return '<html><body><table>\n' + rows + stored + rows + '</table></body></html>'
+
+
+def measure(func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='창 단위 분석 메모리 벤치마크')
+    parser.add_argument('--size-mb', type=int, default=8, help='페이지 크기 (MB)')
+    args = parser.parse_args()
+
+    html = build_report(args.size_mb * 1024 * 1024)
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        f.write(html.encode('utf-8'))
+    try:
+        # 문서 전체 분석은 본문 문자열이 이미 메모리에 있는 상태에서 추가로 쓰는 메모리만 측정
+        (whole, _), whole_time, whole_peak = measure(lambda: analyze_document(html))
+        size = len(html)
+        del html
+        (streamed, _), stream_time, stream_peak = measure(lambda: analyze_file(f.name))
+    finally:
+        os.remove(f.name)
+    assert streamed == whole, (streamed, whole)
+
+    mb = 1024 * 1024
+    print(f"페이지 크기: {size / mb:.1f}M 문자, 결과: {len(whole)}건")
+    print(f"  문서 전체 분석:  {whole_time:6.2f} s, 추가 최대 메모리 {whole_peak / mb:7.1f} MB (+ 본문 {size / mb:.1f}M 문자)")
+    print(f"  창 단위 (mmap):  {stream_time:6.2f} s, 최대 메모리      {stream_peak / mb:7.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+================================================================================
+XSS Scanner - 템플릿 블록 분석 캐시 (block_memo.py)
+================================================================================
+
+대부분의 페이지는 헤더/내비게이션/사이드바/푸터 같은 같은 블록을 공유합니다.
+문서를 최상위 블록으로 나누고 블록 내용의 해시로 저장된 XSS 분석 결과를 스캔
+전체에서 캐시하여, 템플릿이 많은 사이트에서는 분석 대부분이 캐시 적중이 됩니다.
+(Requests 엔진 - 정규식 분석)
+
+블록 분할:
+- 레이아웃 요소(div, header, nav, main, section, article, aside, footer, table,
+  ul, ol, form)의 여닫는 태그만 세어 깊이를 추적 (스크립트/스타일/주석 내부 제외)
+- 닫는 태그 뒤 깊이가 D 이하가 되는 위치가 블록 경계. D 는 경계가 둘 이상 생기는
+  가장 얕은 깊이 (<div id="wrap"> 처럼 전체를 감싸는 요소 안쪽의 자식 단위)
+- BLOCK_MIN_LENGTH 보다 짧은 블록은 다음 블록과 합침
+- 매치는 블록 경계를 넘지 않음 (레이아웃 요소가 닫힌 뒤까지 이어지는 매치는
+  블록 안에서만 찾음)
+
+공유 블록의 결과는 페이지마다 같은 (패턴, 내용)으로 보고되므로 FindingIndex
+(result_store.py)에서 영향받은 페이지 목록과 함께 한 항목으로 묶입니다.
+
+사용법:
+    from block_memo import BlockMemo
+
+    memo = BlockMemo()
+    findings, partial = memo.analyze(html, budget=2.0)   # analyze_document 와 같은 형식
+    print(memo.hits, memo.misses)
+
+    # 프로세스 풀: 캐시에 없는 블록만 보냄
+    plan = memo.plan(html)
+    analyzed = pool.submit(analyze_blocks, memo.missing(plan), 2.0).result()
+    findings, partial = memo.complete(plan, analyzed)
+================================================================================
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+from line_index import LineIndex
+from stored_xss import STORED_XSS_MATCHER, DISPLAY_LENGTH
+
+
+BLOCK_MIN_LENGTH = 512          # 이보다 짧은 블록은 다음 블록과 합침 (문자 수)
+BLOCK_MAX_DEPTH = 4             # 경계를 찾을 최대 깊이
+DEFAULT_MAX_ENTRIES = 20000     # 캐시할 블록 수 (오래 사용하지 않은 블록부터 내보냄)
+
+_BLOCK_TAG_RE = re.compile(
+    r'<(?P<close>/?)(?P<tag>div|header|nav|main|section|article|aside|footer|table|ul|ol|form)(?=[\s>/])'
+    r'|<(?P<raw>script|style)(?=[\s>/])|<!--',
+    re.IGNORECASE
+)
+_RAW_END = {'script': re.compile(r'</script\s*>', re.IGNORECASE),
+            'style': re.compile(r'</style\s*>', re.IGNORECASE)}
+
+BlockMatch = Tuple[str, int, str]     # (패턴 이름, 블록 내 시작 위치, 보고 내용)
+
+
+class BlockPlan(NamedTuple):
+    """문서 하나의 블록 분할과 캐시 조회 결과"""
+    html: str
+    spans: List[Tuple[int, int]]
+    keys: List[bytes]
+    cached: List[Optional[Tuple[BlockMatch, ...]]]   # 캐시에 없으면 None
+
+
+# ==============================================================================
+# 블록 분할
+# ==============================================================================
+
+def _closing_depths(html: str) -> List[Tuple[int, int]]:
+    """레이아웃 요소 닫는 태그마다 (태그 끝 위치, 닫은 뒤 깊이)"""
+    closes = []
+    depth = 0
+    pos = 0
+    search = _BLOCK_TAG_RE.search
+    while True:
+        m = search(html, pos)
+        if m is None:
+            break
+        pos = m.end()
+        raw = m.group('raw')
+        if raw is not None:
+            end = _RAW_END[raw.lower()].search(html, pos)
+            pos = len(html) if end is None else end.end()
+        elif m.group('tag') is None:  # 주석
+            end = html.find('-->', pos)
+            pos = len(html) if end < 0 else end + 3
+        elif not m.group('close'):
+            depth += 1
+        elif depth > 0:  # 짝 없는 닫는 태그는 무시
+            depth -= 1
+            gt = html.find('>', pos)
+            closes.append((len(html) if gt < 0 else gt + 1, depth))
+    return closes
+
+
+def split_blocks(html: str, min_length: int = BLOCK_MIN_LENGTH) -> List[Tuple[int, int]]:
+    """문서를 최상위 블록 (시작, 끝) 목록으로 분할 (이어 붙이면 원문)"""
+    if not html:
+        return []
+    closes = _closing_depths(html)
+    depth_limit = 0
+    for depth_limit in range(BLOCK_MAX_DEPTH + 1):
+        if sum(1 for _end, depth in closes if depth <= depth_limit) >= 2:
+            break
+    spans = []
+    start = 0
+    for end, depth in closes:
+        if depth <= depth_limit and end - start >= min_length and end < len(html):
+            spans.append((start, end))
+            start = end
+    spans.append((start, len(html)))
+    return spans
+
+
+def block_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+
+
+# ==============================================================================
+# 분석
+# ==============================================================================
+
+def _display(text: str) -> str:
+    return text[:DISPLAY_LENGTH] + '...' if len(text) > DISPLAY_LENGTH else text
+
+
+def analyze_blocks(blocks: List[str], budget: Optional[float] = None) -> List[Optional[Tuple[BlockMatch, ...]]]:
+    """
+    블록별 매치 -> [((이름, 블록 내 시작, 보고 내용), ...), ...]
+
+    시간 예산을 넘겨 끝까지 분석하지 못한 블록은 None. 프로세스 풀에서 실행할 수
+    있도록 모듈 수준 함수이며 인자와 결과는 모두 피클 가능
+    """
+    deadline = None if budget is None else time.monotonic() + budget
+    results: List[Optional[Tuple[BlockMatch, ...]]] = []
+    for block in blocks:
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        report = STORED_XSS_MATCHER.scan(block, budget=remaining)
+        if report.partial:
+            results.append(None)
+        else:
+            results.append(tuple((m.name, m.start, _display(m.text)) for m in report.matches))
+    return results
+
+
+class BlockMemo:
+    """블록 해시 -> 분석 결과 (스캔 전체에서 공유, 스레드 안전)"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, min_length: int = BLOCK_MIN_LENGTH):
+        self.max_entries = max(0, max_entries)
+        self.min_length = min_length
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[bytes, Tuple[BlockMatch, ...]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def plan(self, html: str) -> BlockPlan:
+        spans = split_blocks(html, self.min_length)
+        keys = [block_key(html[start:end]) for start, end in spans]
+        cached = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                cached.append(entry)
+        return BlockPlan(html, spans, keys, cached)
+
+    @staticmethod
+    def missing(plan: BlockPlan) -> List[str]:
+        """캐시에 없는 블록 본문 (plan 순서)"""
+        return [plan.html[start:end] for (start, end), entry in zip(plan.spans, plan.cached) if entry is None]
+
+    def complete(self, plan: BlockPlan, analyzed) -> Tuple[List[Tuple[str, str, int]], bool]:
+        """
+        캐시 결과 + 새로 분석한 블록 결과 -> analyze_document 와 같은 형식
+
+        새로 분석한 블록은 캐시에 저장 (시간 예산 초과 블록은 저장하지 않고 partial)
+        """
+        analyzed = iter(analyzed)
+        lines = LineIndex(plan.html)
+        findings = []
+        seen = set()
+        partial = False
+        for (start, _end), key, entry in zip(plan.spans, plan.keys, plan.cached):
+            if entry is None:
+                entry = next(analyzed)
+                if entry is None:
+                    partial = True
+                    continue
+                self._store(key, entry)
+            for name, offset, display in entry:
+                if display not in seen:
+                    seen.add(display)
+                    findings.append((name, display, lines.line_of(start + offset)))
+        return findings, partial
+
+    def analyze(self, html: str, budget: Optional[float] = None) -> Tuple[List[Tuple[str, str, int]], bool]:
+        plan = self.plan(html)
+        return self.complete(plan, analyze_blocks(self.missing(plan), budget))
+
+    def _store(self, key: bytes, entry: Tuple[BlockMatch, ...]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
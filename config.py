@@ -41,16 +41,28 @@ class ScannerConfig:
     DEFAULT_TIMEOUT: int = 10
     
     # 대기 시간 (초)
-    PAGE_LOAD_WAIT: float = 2.0      # 페이지 로드 후 XSS 실행 대기
-    POLL_INTERVAL: float = 0.1       # Alert/콘솔 체크 간격
+    PAGE_LOAD_WAIT: float = 2.0      # 페이지 로드 후 XSS 실행 대기 (최대)
+    POLL_INTERVAL: float = 0.1       # Alert/콘솔 체크 간격 (실행 감지 훅을 쓸 수 없을 때)
+    EXECUTION_QUIET: float = 0.3     # 네트워크 IDLE 후 실행이 없으면 깨끗한 페이지로 판단하는 대기 시간
+    NETWORK_IDLE: float = 0.05       # 요청/짧은 타이머가 없는 상태가 이만큼 유지되면 페이지 준비 완료
+    READY_TIMEOUT: float = 5.0       # 페이지 준비 대기 최대 시간
     
     # 브라우저 설정
     DEFAULT_HEADLESS: bool = True
     DEFAULT_WINDOW_SIZE: str = "1920,1080"
+    MAX_BROWSERS: int = 4            # Selenium 스캔 브라우저 풀 최대 크기
+    BROWSER_MEMORY_MB: int = 400     # 브라우저 하나에 잡는 메모리 (풀 크기 계산)
     
     # 기본 모드
     DEFAULT_QUICK_MODE: bool = True
     DEFAULT_ALERT_MODE: bool = False
+    
+    # 저장된 XSS 분석 방식 ('regex': 원문 패턴 스캔, 'dom': 크롤링 때 파싱한 트리 순회)
+    CONTENT_ANALYSIS: str = 'regex'
+    
+    # 배치 스캔 (전체 대상이 공유하는 워커 수, 호스트당 동시 작업 수)
+    BATCH_WORKERS: int = 40
+    BATCH_PER_HOST: int = 8
 
 
 # 전역 설정 인스턴스
@@ -347,6 +359,9 @@ def validate_config() -> bool:
     if Config.PAGE_LOAD_WAIT < 0:
         errors.append("PAGE_LOAD_WAIT must be >= 0")
     
+    if Config.BATCH_WORKERS < 1 or Config.BATCH_PER_HOST < 1:
+        errors.append("BATCH_WORKERS and BATCH_PER_HOST must be >= 1")
+    
     if len(Payloads.get_payloads(quick_mode=True)) != TestConfig.EXPECTED_QUICK_PAYLOADS:
         errors.append(f"Quick payloads count mismatch")
     
@@ -0,0 +1,183 @@
+"""
+================================================================================
+XSS Scanner - DOM 트리 기반 저장된 XSS 탐지 (dom_xss.py)
+================================================================================
+
+크롤러가 parse_page 에서 만든 BeautifulSoup 트리를 한 번 순회하며 저장된 XSS
+흔적을 찾습니다. (Requests 엔진 - content_analysis='dom')
+
+- 요소마다 한 번만 방문 (soup.descendants), 문서 전체 정규식 스캔 없음
+  -> 백트래킹 위험과 분석 단계의 두 번째 전체 문서 스캔이 없음
+- 검사 항목: 이벤트 핸들러 속성(on*), javascript: URL 속성, 인라인 스크립트 본문,
+  의심스러운 iframe, 셀/목록 안의 스크립트, XSS 테스트 흔적
+- 결과 이름은 정규식 패턴(stored_xss.py)과 같은 이름을 사용하여 보고서/색인에서
+  두 분석 방식의 결과를 같은 기준으로 묶을 수 있음
+- 줄 번호는 파서가 기록한 요소 시작 줄 (Tag.sourceline, 텍스트는 부모 요소의 줄)
+
+정규식 분석과 달리 파서가 정규화한 속성 값을 보므로 따옴표/공백/대소문자 변형에
+강하지만, 보고 내용은 원문 그대로가 아니라 재구성한 여는 태그입니다.
+
+사용법:
+    from dom_xss import analyze_tree, analyze_html
+
+    findings = analyze_tree(soup)        # 이미 파싱한 트리
+    findings = analyze_html(html)        # 본문만 있을 때
+    for name, content, line in findings:
+        print(name, line, content)
+================================================================================
+"""
+
+import re
+from typing import List, Tuple
+
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString, Tag
+
+from stored_xss import DISPLAY_LENGTH
+
+
+# ==============================================================================
+# 규칙 데이터
+# ==============================================================================
+
+# 요소별 이벤트 핸들러 이름 (없으면 '<속성> 이벤트')
+ELEMENT_EVENTS = {
+    ('img', 'onerror'): 'img onerror XSS',
+    ('img', 'onload'): 'img onload XSS',
+    ('svg', 'onload'): 'svg onload XSS',
+    ('body', 'onload'): 'body onload XSS',
+    ('input', 'onfocus'): 'input onfocus XSS',
+}
+
+# javascript: 스킴을 검사할 URL 속성
+URL_ATTRIBUTES = ('href', 'src', 'action', 'formaction', 'data', 'xlink:href')
+
+# 인라인 스크립트 본문 규칙 (본문만 검사하므로 단순 패턴)
+SCRIPT_RULES = [
+    (re.compile(r'alert\s*\('), 'alert() 스크립트'),
+    (re.compile(r'console\s*\.\s*log\s*\('), 'console.log() 스크립트'),
+    (re.compile(r'document\s*\.\s*cookie'), '쿠키 접근 스크립트'),
+    (re.compile(r'document\s*\.\s*location'), '리다이렉트 스크립트'),
+    (re.compile(r'document\s*\.\s*write'), 'document.write() 스크립트'),
+    (re.compile(r'eval\s*\('), 'eval() 스크립트'),
+    (re.compile(r'window\s*\.\s*location'), 'window.location 스크립트'),
+]
+
+# 안전한 외부 스크립트 호스트 (stored_xss.SAFE_SCRIPT_PATTERNS 와 동일)
+SAFE_SCRIPT_HOSTS = ('cdn.cloudflare.com', 'cdnjs.cloudflare.com', 'code.jquery.com',
+                     'unpkg.com', 'cdn.jsdelivr.net')
+
+XSS_MARKER_RE = re.compile(r'XSS[_\-]?(ATTACK|TEST|PAYLOAD|SUCCESS)', re.IGNORECASE)
+
+# 브라우저가 URL 스킴 앞뒤에서 무시하는 문자 (제어 문자, 공백)
+_URL_JUNK_RE = re.compile(r'[\x00-\x20]+')
+
+Finding = Tuple[str, str, int]   # (이름, 보고 내용, 줄 번호)
+
+
+# ==============================================================================
+# 분석
+# ==============================================================================
+
+def _display(text: str) -> str:
+    return text[:DISPLAY_LENGTH] + '...' if len(text) > DISPLAY_LENGTH else text
+
+
+def _opening_tag(tag: Tag) -> str:
+    """보고용 여는 태그 (속성 값은 파서가 정규화한 값)"""
+    parts = [tag.name]
+    for name, value in tag.attrs.items():
+        if isinstance(value, list):
+            value = ' '.join(value)
+        parts.append(f'{name}="{value}"')
+    return '<' + ' '.join(parts) + '>'
+
+
+def _is_javascript_url(value) -> bool:
+    if not isinstance(value, str):
+        return False
+    return _URL_JUNK_RE.sub('', value)[:11].lower() == 'javascript:'
+
+
+def _is_safe_script(src: str) -> bool:
+    src = src.strip().lower()
+    for scheme in ('https://', 'http://'):
+        if src.startswith(scheme):
+            return src[len(scheme):].split('/', 1)[0] in SAFE_SCRIPT_HOSTS
+    return False
+
+
+def _inside(tag: Tag, names) -> bool:
+    return tag.find_parent(names) is not None
+
+
+def _tag_findings(tag: Tag) -> List[Tuple[str, str]]:
+    """요소 하나의 (이름, 보고 내용) 목록"""
+    found = []
+    name = tag.name
+    opening = None
+
+    for attr, value in tag.attrs.items():
+        attr = attr.lower()
+        if attr.startswith('on') and len(attr) > 2:
+            opening = opening or _opening_tag(tag)
+            found.append((ELEMENT_EVENTS.get((name, attr), f'{attr} 이벤트'), opening))
+            if attr == 'onerror' and _inside(tag, ['td', 'th']):
+                found.append(('테이블 셀 내 onerror', opening))
+        elif attr in URL_ATTRIBUTES and _is_javascript_url(value):
+            opening = opening or _opening_tag(tag)
+            found.append((f'javascript: {attr}', opening))
+        elif isinstance(value, str) and XSS_MARKER_RE.search(value):
+            found.append(('XSS 테스트 흔적', opening or _opening_tag(tag)))
+
+    if name == 'iframe':
+        src = tag.get('src')
+        if isinstance(src, str) and not src.strip().lower().startswith(('http://', 'https://')):
+            found.append(('의심스러운 iframe', opening or _opening_tag(tag)))
+
+    elif name == 'script':
+        src = tag.get('src')
+        if isinstance(src, str) and _is_safe_script(src):
+            return found
+        body = tag.string or ''
+        content = _display((opening or _opening_tag(tag)) + body.strip())
+        for rule, rule_name in SCRIPT_RULES:
+            if rule.search(body):
+                found.append((rule_name, content))
+        if _inside(tag, ['td', 'th']):
+            found.append(('테이블 셀 내 스크립트', content))
+        if _inside(tag, 'li'):
+            found.append(('리스트 내 스크립트', content))
+    return found
+
+
+def analyze_tree(soup) -> List[Finding]:
+    """
+    파싱된 트리 한 번 순회 -> [(이름, 보고 내용, 줄 번호), ...]
+
+    같은 (이름, 내용)은 한 번만 보고 (순회 순서 = 문서 순서)
+    """
+    findings: List[Finding] = []
+    seen = set()
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            line = node.sourceline or 0
+            for name, content in _tag_findings(node):
+                key = (name, content)
+                if key not in seen:
+                    seen.add(key)
+                    findings.append((name, _display(content), line))
+        elif type(node) is NavigableString:
+            # 주석/CDATA 등 하위 클래스 제외, 스크립트 본문은 요소 단계에서 검사
+            match = XSS_MARKER_RE.search(node)
+            if match and node.parent is not None and node.parent.name != 'script':
+                key = ('XSS 테스트 흔적', match.group(0))
+                if key not in seen:
+                    seen.add(key)
+                    findings.append((*key, node.parent.sourceline or 0))
+    return findings
+
+
+def analyze_html(html: str) -> List[Finding]:
+    """본문을 파싱하여 analyze_tree (크롤링 때 분석하지 않은 페이지용)"""
+    return analyze_tree(BeautifulSoup(html, 'html.parser'))
@@ -0,0 +1,254 @@
+"""
+================================================================================
+XSS Scanner - 저장된 XSS 변경 추적 (findings_db.py)
+================================================================================
+
+스캔 실행 사이의 저장된 XSS 결과를 SQLite 파일에 보관하여 새로 생긴 결과와
+사라진(해결된) 결과를 보고합니다. (Requests 엔진)
+
+- 결과 키: (대상, URL 템플릿, 패턴 이름, 내용 해시) + 처음/마지막 발견 시각
+  URL 템플릿은 숫자/해시 경로 조각과 쿼리 값을 지운 URL (/board/12?id=3 과
+  /board/57?id=9 는 같은 템플릿) -> 게시글마다 반복되는 결과를 한 항목으로 추적
+- 페이지별 본문 해시와 분석 결과를 보관하여 본문이 바뀌지 않은 페이지는 다시
+  분석하지 않고 이전 결과를 사용 (시간 예산 초과로 일부만 분석한 페이지 제외)
+- 이번 실행에서 끝까지 분석한 페이지에서 마지막으로 발견된 결과가 이번에 보이지
+  않으면 해결됨으로 표시 (크롤링 범위에서 빠진 페이지의 결과는 그대로 유지)
+- 해결된 결과가 다시 나타나면 새 결과로 보고
+- 스레드 안전 (본문 비교는 가져오기 스레드, 기록은 분석 루프에서 호출)
+
+사용법:
+    from findings_db import FindingsDB
+
+    with FindingsDB('findings.db', target='http://localhost:5000') as db:
+        results = scanner.scan_page_content(pages, findings_db=db)
+        new = [r for r in results if r.status == 'new']
+        resolved = scanner.resolved_findings      # [{'template': ..., 'pattern_name': ...}, ...]
+================================================================================
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse, parse_qsl
+
+
+Finding = Tuple[str, str, int]   # (패턴 이름, 보고 내용, 줄 번호)
+
+STATUS_NEW = 'new'
+STATUS_KNOWN = 'known'
+
+# 템플릿에서 '{id}' 로 바꿀 경로 조각 (숫자, UUID, 16진수 해시)
+_ID_SEGMENT_RE = re.compile(r'^(\d+|[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}|[0-9a-f]{16,})$', re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    target TEXT NOT NULL,
+    url TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    findings TEXT NOT NULL,
+    analyzed_at TEXT NOT NULL,
+    PRIMARY KEY (target, url)
+);
+CREATE TABLE IF NOT EXISTS findings (
+    target TEXT NOT NULL,
+    template TEXT NOT NULL,
+    pattern_name TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    matched_content TEXT NOT NULL,
+    url TEXT NOT NULL,
+    line_number INTEGER NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    resolved_at TEXT,
+    PRIMARY KEY (target, template, pattern_name, content_hash)
+);
+"""
+
+
+class PriorAnalysis(NamedTuple):
+    """본문이 바뀌지 않은 페이지의 이전 분석 결과 (analyze_document 와 같은 형식)"""
+    findings: List[Finding]
+    partial: bool = False
+
+
+# ==============================================================================
+# 키
+# ==============================================================================
+
+def url_template(url: str) -> str:
+    """URL -> 템플릿 (숫자/해시 경로 조각은 {id}, 쿼리는 정렬된 이름만)"""
+    parsed = urlparse(url)
+    path = '/'.join('{id}' if _ID_SEGMENT_RE.match(part) else part for part in parsed.path.split('/'))
+    names = sorted({name for name, _value in parse_qsl(parsed.query, keep_blank_values=True)})
+    query = '&'.join(f'{name}=' for name in names)
+    return f"{parsed.netloc.lower()}{path or '/'}" + (f'?{query}' if query else '')
+
+
+def content_hash(content: str) -> str:
+    return hashlib.blake2b(content.encode('utf-8', errors='surrogatepass'), digest_size=8).hexdigest()
+
+
+def text_digest(html: str) -> str:
+    """본문 해시 (페이지 캐시와 같은 UTF-8 인코딩 -> file_digest 와 같은 값)"""
+    return hashlib.blake2b(html.encode('utf-8', errors='surrogatepass'), digest_size=16).hexdigest()
+
+
+def file_digest(path: str, chunk_size: int = 1024 * 1024) -> Optional[str]:
+    """파일로 보관된 본문의 해시 (읽을 수 없으면 None)"""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+# ==============================================================================
+# 데이터베이스
+# ==============================================================================
+
+class FindingsDB:
+    """대상별 저장된 XSS 결과 기록 (SQLite 파일, ':memory:' 가능)"""
+
+    def __init__(self, path: str, target: str = ''):
+        self.path = path
+        self.target = target
+        if path != ':memory:':
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.run_at: Optional[str] = None
+        self._seen: set = set()      # 이번 실행에서 발견한 결과 키
+        self._new: set = set()       # 이번 실행에서 새로 생긴 결과 키
+
+    # ----- 실행 -----
+
+    def begin_run(self) -> str:
+        """스캔 실행 시작 (발견 시각 기준)"""
+        with self._lock:
+            self.run_at = _now()
+            self._seen = set()
+            self._new = set()
+        return self.run_at
+
+    def prior(self, url: str, digest: Optional[str]) -> Optional[PriorAnalysis]:
+        """본문 해시가 이전 실행과 같으면 이전 분석 결과, 아니면 None"""
+        if digest is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT digest, findings FROM pages WHERE target = ? AND url = ?',
+                (self.target, url)).fetchone()
+        if row is None or row[0] != digest:
+            return None
+        return PriorAnalysis([tuple(item) for item in json.loads(row[1])])
+
+    def record_page(self, url: str, digest: Optional[str], findings: Iterable[Finding],
+                    partial: bool = False) -> List[str]:
+        """
+        페이지 하나의 분석 결과 기록 -> 결과별 상태 ('new' / 'known')
+
+        끝까지 분석한 페이지만 본문 해시와 결과를 보관 (다음 실행에서 재사용)
+        """
+        findings = list(findings)
+        run_at = self.run_at or self.begin_run()
+        template = url_template(url)
+        statuses = []
+        with self._lock, self._conn:
+            for name, content, line in findings:
+                key = (template, name, content_hash(content))
+                row = self._conn.execute(
+                    'SELECT resolved_at FROM findings WHERE target = ? AND template = ? '
+                    'AND pattern_name = ? AND content_hash = ?', (self.target, *key)).fetchone()
+                if row is None:
+                    self._conn.execute(
+                        'INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)',
+                        (self.target, *key, content, url, line, run_at, run_at))
+                    self._new.add(key)
+                else:
+                    if row[0] is not None:  # 해결됐던 결과가 다시 나타남
+                        self._new.add(key)
+                    self._conn.execute(
+                        'UPDATE findings SET url = ?, line_number = ?, last_seen = ?, resolved_at = NULL '
+                        'WHERE target = ? AND template = ? AND pattern_name = ? AND content_hash = ?',
+                        (url, line, run_at, self.target, *key))
+                self._seen.add(key)
+                statuses.append(STATUS_NEW if key in self._new else STATUS_KNOWN)
+            if digest is not None and not partial:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)',
+                    (self.target, url, digest, json.dumps(findings, ensure_ascii=False), run_at))
+        return statuses
+
+    def finish_run(self, analyzed_urls: Iterable[str]) -> List[dict]:
+        """
+        실행 종료 -> 이번에 해결된 결과 목록
+
+        analyzed_urls: 이번 실행에서 끝까지 분석한 페이지. 결과가 마지막으로 발견된
+        페이지가 여기 있는데 이번에 발견되지 않았으면 해결됨
+        """
+        analyzed = set(analyzed_urls)
+        run_at = self.run_at or _now()
+        resolved = []
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                'SELECT template, pattern_name, content_hash, matched_content, url, line_number, '
+                'first_seen, last_seen FROM findings WHERE target = ? AND resolved_at IS NULL',
+                (self.target,)).fetchall()
+            for template, name, digest, content, url, line, first_seen, last_seen in rows:
+                if (template, name, digest) in self._seen or url not in analyzed:
+                    continue
+                self._conn.execute(
+                    'UPDATE findings SET resolved_at = ? WHERE target = ? AND template = ? '
+                    'AND pattern_name = ? AND content_hash = ?', (run_at, self.target, template, name, digest))
+                resolved.append({
+                    'template': template, 'url': url, 'pattern_name': name,
+                    'matched_content': content, 'line_number': line,
+                    'first_seen': first_seen, 'last_seen': last_seen, 'resolved_at': run_at,
+                })
+        return resolved
+
+    # ----- 조회 -----
+
+    def findings(self, include_resolved: bool = False) -> List[dict]:
+        """대상의 결과 목록 (처음 발견 순)"""
+        query = ('SELECT template, pattern_name, matched_content, url, line_number, first_seen, '
+                 'last_seen, resolved_at FROM findings WHERE target = ?')
+        if not include_resolved:
+            query += ' AND resolved_at IS NULL'
+        with self._lock:
+            rows = self._conn.execute(query + ' ORDER BY first_seen, rowid', (self.target,)).fetchall()
+        keys = ('template', 'pattern_name', 'matched_content', 'url', 'line_number',
+                'first_seen', 'last_seen', 'resolved_at')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """이번 실행의 새 결과 / 이미 알던 결과 수"""
+        with self._lock:
+            return {'new': len(self._new), 'known': len(self._seen - self._new)}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,222 @@
+"""
+================================================================================
+XSS Scanner - HTTP 복원력 (http_resilience.py)
+================================================================================
+
+응답하지 않는 호스트에 스레드가 timeout 만큼씩 묶이지 않도록 합니다.
+
+- CircuitBreaker: 연속 실패가 임계값에 도달하면 열림(OPEN) -> 요청 즉시 실패
+  reset_timeout 이 지나면 반열림(HALF_OPEN) 상태에서 탐색 요청 1개만 허용,
+  성공하면 닫힘(CLOSED), 실패하면 다시 열림
+- BreakerRegistry: 호스트(netloc)별 차단기
+- retry_with_backoff: 일시적 오류(연결 오류, 429/502/503/504)에
+  상한이 있는 지수 백오프 재시도
+  타임아웃은 이미 timeout 만큼 기다렸으므로 재시도하지 않음 (차단기 실패로만 집계)
+- 시도마다 실패를 차단기에 기록 -> 재시도 사이에도 차단기가 열리면 즉시 중단
+- 멱등이 아닌 요청(POST 폼 제출)은 재시도하지 않음 (중복 제출 방지)
+
+사용법:
+    from http_resilience import BreakerRegistry, CircuitOpenError
+
+    breakers = BreakerRegistry()
+    response = breakers.call(url, lambda: session.get(url, timeout=10))
+================================================================================
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+
+FAILURE_THRESHOLD = 5       # 차단기를 여는 연속 실패 수
+RESET_TIMEOUT = 30.0        # 열린 뒤 탐색 요청을 허용하기까지 대기 (초)
+MAX_RETRIES = 2             # 일시적 오류 재시도 횟수
+BACKOFF_BASE = 0.5          # 첫 재시도 대기 (초), 이후 2배씩 증가
+BACKOFF_MAX = 4.0           # 재시도 대기 상한 (초)
+
+TRANSIENT_STATUS = frozenset({429, 502, 503, 504})
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열린 호스트로의 요청"""
+
+    def __init__(self, host: str):
+        super().__init__(f"circuit open: {host}")
+        self.host = host
+
+
+class TransientStatusError(Exception):
+    """재시도 후에도 일시적 오류 상태 코드 (429/5xx) 응답"""
+
+    def __init__(self, response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+def is_transient(exc: BaseException) -> bool:
+    return isinstance(exc, TRANSIENT_ERRORS) or isinstance(exc, TransientStatusError)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """재시도할 오류 (타임아웃은 제외 -> 응답 없는 호스트에 timeout 을 여러 번 쓰지 않음)"""
+    return is_transient(exc) and not isinstance(exc, requests.exceptions.Timeout)
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_MAX) -> float:
+    """attempt 번째 재시도 대기 시간 (지수 증가 + 지터, 상한 cap)"""
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+
+def retry_with_backoff(func: Callable, retries: int = MAX_RETRIES, base: float = BACKOFF_BASE,
+                       cap: float = BACKOFF_MAX, giveup: Optional[Callable[[], bool]] = None,
+                       sleep: Callable[[float], None] = time.sleep,
+                       on_failure: Optional[Callable[[BaseException], None]] = None):
+    """
+    func() 호출, 일시적 오류면 백오프 후 재시도
+
+    - 상태 코드가 TRANSIENT_STATUS 인 응답도 재시도, 마지막까지 실패하면 TransientStatusError
+    - 타임아웃과 일시적이지 않은 예외는 즉시 전달
+    - on_failure(예외) 는 일시적 오류가 날 때마다 호출 (재시도 여부 판단 전)
+    - giveup() 이 True 면 재시도 중단 (예: 차단기가 열림)
+    """
+    attempt = 0
+    while True:
+        try:
+            response = func()
+            if getattr(response, 'status_code', None) in TRANSIENT_STATUS:
+                raise TransientStatusError(response)
+            return response
+        except Exception as e:
+            if on_failure is not None and is_transient(e):
+                on_failure(e)
+            if not is_retryable(e) or attempt >= retries or (giveup is not None and giveup()):
+                raise
+        sleep(backoff_delay(attempt, base, cap))
+        attempt += 1
+
+
+# ==============================================================================
+# 차단기
+# ==============================================================================
+
+class CircuitBreaker:
+    """호스트 하나의 차단기 (스레드 안전)"""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def remaining(self) -> float:
+        """탐색 요청을 허용하기까지 남은 시간 (닫혀 있으면 0)"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self.clock())
+
+    def allow(self) -> bool:
+        """요청 허용 여부 (반열림 상태에서는 탐색 요청 1개만 허용)"""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._state = CLOSED
+            self._probing = False
+
+    def release(self) -> None:
+        """상태 변경 없이 탐색 요청 슬롯만 반환 (호스트 장애와 무관한 오류)"""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = self.clock()
+            self._probing = False
+
+
+class BreakerRegistry:
+    """호스트별 차단기 모음"""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT,
+                 retries: int = MAX_RETRIES, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.retries = retries
+        self.clock = clock
+        self.sleep = sleep
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> CircuitBreaker:
+        host = urlparse(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout, self.clock)
+            return breaker
+
+    def open_hosts(self) -> Dict[str, float]:
+        """열린 호스트 -> 탐색까지 남은 시간"""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: b.remaining() for host, b in breakers.items() if b.state == OPEN}
+
+    def call(self, url: str, send: Callable, idempotent: bool = True):
+        """
+        차단기 + 재시도를 거쳐 send() 호출
+
+        일시적 오류는 시도마다 차단기에 기록하고, 차단기가 열리면 남은 재시도를 중단.
+        idempotent=False (POST 폼 제출 등) 이면 재시도하지 않음
+
+        Raises:
+            CircuitOpenError: 호스트 차단기가 열려 있음 (요청하지 않음)
+            그 외: 재시도 후에도 실패한 요청의 예외
+        """
+        breaker = self.get(url)
+        if not breaker.allow():
+            raise CircuitOpenError(urlparse(url).netloc)
+        try:
+            # 일시적 오류만 호스트 장애로 간주 (잘못된 URL 등은 차단기에 반영하지 않음)
+            response = retry_with_backoff(send, self.retries if idempotent else 0,
+                                          giveup=lambda: breaker.state == OPEN, sleep=self.sleep,
+                                          on_failure=lambda e: breaker.record_failure())
+        except TransientStatusError as e:
+            return e.response
+        except Exception as e:
+            if not is_transient(e):
+                breaker.release()
+            raise
+        breaker.record_success()
+        return response
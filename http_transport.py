@@ -0,0 +1,79 @@
+"""
+================================================================================
+XSS Scanner - 공유 HTTP 전송 계층 (http_transport.py)
+================================================================================
+
+크롤링 -> 저장된 XSS 분석 -> 폼/파라미터 스캔의 세 단계가 하나의
+requests.Session 과 커넥션 풀을 공유하도록 합니다. (Requests 엔진)
+
+- keep-alive 연결과 TLS 세션을 단계 간에 재사용
+- 서버가 크롤링 중 설정한 쿠키(세션 ID 등)가 스캔 단계에도 자동으로 전달
+  (쿠키는 세션 쿠키 저장소에만 넣고 Cookie 헤더를 고정하지 않음)
+- 커넥션 풀 크기는 스캐너 스레드 수에 맞춤
+- 호스트별 차단기(BreakerRegistry)도 함께 공유
+- 크롤링 중 받은 HTML 본문 캐시(PageCache)를 공유
+  (저장된 XSS 분석 단계가 페이지를 다시 요청하지 않음)
+
+사용법:
+    from http_transport import HttpTransport
+
+    transport = HttpTransport(cookies=cookies, pool_size=20)
+    pages = SiteCrawler(url, transport=transport).crawl()
+    scanner = XSSScanner(threads=20, transport=transport)
+================================================================================
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_resilience import BreakerRegistry
+from page_cache import PageCache
+
+
+DEFAULT_POOL_SIZE = 20
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+class HttpTransport:
+    """단계 간에 공유하는 세션 + 커넥션 풀 + 호스트별 차단기 + 페이지 본문 캐시"""
+
+    def __init__(self, cookies: Optional[Dict[str, str]] = None, pool_size: int = DEFAULT_POOL_SIZE,
+                 breakers: Optional[BreakerRegistry] = None, page_cache: Optional[PageCache] = None):
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        if cookies:
+            self.session.cookies.update(cookies)
+        self.breakers = breakers if breakers is not None else BreakerRegistry()
+        self.page_cache = page_cache if page_cache is not None else PageCache()
+        self.pool_size = 0
+        self._lock = threading.Lock()
+        self.ensure_pool(pool_size)
+
+    def ensure_pool(self, size: int) -> None:
+        """커넥션 풀을 최소 size 로 맞춤 (이미 크면 기존 연결 유지)"""
+        size = max(1, size)
+        with self._lock:
+            if size <= self.pool_size:
+                return
+            adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            self.pool_size = size
+
+    @property
+    def cookies(self) -> Dict[str, str]:
+        """현재 세션 쿠키 (서버가 설정한 쿠키 포함)"""
+        return self.session.cookies.get_dict()
+
+    def close(self) -> None:
+        self.session.close()
+        self.page_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,129 @@
+"""
+================================================================================
+XSS Scanner - 하이브리드 엔진 (hybrid_engine.py)
+================================================================================
+
+Requests 엔진으로 전체 테스트를 HTTP 속도로 실행하고, 페이로드가 반사된 테스트만
+Selenium 브라우저에서 다시 실행하여 XSS 실행 여부를 확인합니다.
+
+- 크롤링/저장된 XSS 분석/스캔 계획은 Requests 엔진(XSSScanner)과 같음
+- 브라우저는 반사된 후보가 있을 때만 시작하고, 후보 수만큼만 풀을 띄움
+- 브라우저에서 실행되면 HTTP 결과 레코드에 executed=True 와 증거(alert/콘솔)를 더함
+  (실행되지 않은 후보는 HTTP 판정 그대로 보고)
+- 양성 결과는 브라우저 확인이 끝난 뒤 한 번만 콜백('scan_result')으로 보고
+- 저널을 쓰면 확인 결과도 기록 (재개 시 이미 실행이 확인된 테스트는 다시 열지 않음)
+- 브라우저를 시작할 수 없으면 HTTP 결과만 보고
+
+사용법:
+    from hybrid_engine import HybridXSSScanner
+
+    scanner = HybridXSSScanner(threads=20, transport=transport, browsers=2)
+    results = scanner.scan_pages(pages)
+    executed = [r for r in results if r.executed]
+    print(scanner.browser_tests, scanner.confirmed)   # 브라우저 테스트 수, 실행 확인 수
+================================================================================
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from result_store import ResultRecord, ResultStore
+from scan_journal import ScanJournal
+from scan_planner import ScanPlan
+from xss_engine import XSSScanner, PageInfo
+from xss_engine_selenium import BrowserSession, SeleniumXSSScanner
+
+
+def browser_test(task: tuple) -> tuple:
+    """XSSScanner 작업 (키, 함수, 인자) -> SeleniumXSSScanner 테스트 (종류, URL/action, 대상, 폼, 페이로드)"""
+    key, _func, args = task
+    if key[0].startswith('url|'):
+        url, param, payload = args
+        return ('url', url, param, None, payload)
+    form, payload, input_field = args
+    return ('form', form['action'], input_field, form, payload)
+
+
+class HybridXSSScanner(XSSScanner):
+    """HTTP 반사 사전 필터 + 브라우저 실행 확인 (XSSScanner 와 같은 인터페이스)"""
+
+    def __init__(self, timeout: int = 10, cookies: Dict = None, callback=None, threads: int = 20,
+                 headless: bool = True, browsers: Optional[int] = None, session: BrowserSession = None,
+                 **kwargs):
+        """
+        Args:
+            headless: 확인용 브라우저 숨김 여부
+            browsers: 확인용 브라우저 수 (None 이면 CPU/메모리로 결정, 후보 수보다 많이 띄우지 않음)
+            session: 브라우저 세션 (없으면 확인 단계가 끝날 때 닫음)
+            나머지 인자는 XSSScanner 와 같음
+        """
+        self.report = callback
+        super().__init__(timeout=timeout, cookies=cookies, callback=self._http_event, threads=threads, **kwargs)
+        self.confirmer = SeleniumXSSScanner(cookies=cookies, headless=headless, timeout=timeout,
+                                            callback=self._browser_event, browsers=browsers, session=session)
+        self.browser_tests = 0  # 브라우저에서 실행한 테스트 수
+        self.confirmed = 0      # 브라우저에서 실행이 확인된 테스트 수
+
+    def _http_event(self, message, level, data=None):
+        # 반사된 결과는 브라우저 확인 후 보고
+        if self.report is not None and level != 'scan_result':
+            self.report(message, level, data)
+
+    def _browser_event(self, message, level, data=None):
+        # 확인 결과는 HTTP 레코드에 합쳐 보고, 진행률은 HTTP 단계 기준
+        if self.report is not None and message:
+            self.report(message, level, data)
+
+    def _report(self, records: Iterable[ResultRecord]) -> None:
+        if self.report is not None:
+            for record in records:
+                self.report(None, 'scan_result', record)
+
+    def scan_pages(self, pages: List[PageInfo], quick_mode: bool = False, journal: ScanJournal = None,
+                   plan: ScanPlan = None) -> ResultStore:
+        """
+        반사형 XSS 스캔 - HTTP 로 전체 테스트 후 반사된 테스트만 브라우저에서 실행 확인
+
+        인자는 XSSScanner.scan_pages 와 같음
+        """
+        self.browser_tests = self.confirmed = 0
+        results = super().scan_pages(pages, quick_mode, journal, plan)
+
+        # 저널에서 이미 실행이 확인된 결과는 바로 보고
+        self._report(record for _task, record in self.reflected_tasks if record.executed)
+        pending = {}  # id(테스트) -> (저널 키, 레코드)
+        tests = []
+        for task, record in self.reflected_tasks:
+            if not record.executed:
+                test = browser_test(task)
+                pending[id(test)] = (task[0], record)
+                tests.append(test)
+        if not tests or self.stop_flag:
+            self._report(record for _key, record in pending.values())
+            return results
+
+        self.browser_tests = len(tests)
+        self.log(f"\n🌐 반사된 테스트 {len(tests)}개를 브라우저에서 확인 (전체 {results.total}개 중)", 'info')
+
+        def confirmed(test, result):
+            key, record = pending.pop(id(test))
+            if result.executed:
+                record.executed = record.vulnerable = True
+                record.console_output = result.console_output
+                self.confirmed += 1
+                if journal is not None:
+                    journal.record(key, record)
+            self._report([record])
+
+        try:
+            self.confirmer.run_tests(tests, on_result=confirmed)
+        except Exception as e:
+            self.log(f"❌ 브라우저 확인 실패 -> HTTP 결과만 보고: {e}", 'danger')
+        # 중단/실패로 확인하지 못한 후보
+        self._report(record for _key, record in pending.values())
+        self.log(f"   브라우저 실행 확인: {self.confirmed}/{self.browser_tests}개",
+                 'danger' if self.confirmed else 'info')
+        return results
+
+    def stop(self):
+        super().stop()
+        self.confirmer.stop()
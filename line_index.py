@@ -0,0 +1,52 @@
+"""
+================================================================================
+XSS Scanner - 줄 번호 색인 (line_index.py)
+================================================================================
+
+문서의 줄바꿈 위치를 한 번 기록해 두고 문자 위치 -> 줄 번호를 이진 탐색으로
+찾습니다. 줄 번호를 보고하는 모든 구성 요소가 같은 색인을 사용합니다.
+
+- 색인 생성 O(n), 조회 O(log 줄 수)
+- 매치 텍스트 검색이 아니라 매치 시작 위치로 찾으므로 같은 텍스트가 앞에
+  또 있어도 정확한 줄을 보고
+
+사용법:
+    from line_index import LineIndex
+
+    index = LineIndex(html)
+    line = index.line_of(match.start())   # 1부터 시작
+================================================================================
+"""
+
+from bisect import bisect_left
+from typing import List, Tuple
+
+
+class LineIndex:
+    """문서 하나의 줄바꿈 위치 색인"""
+
+    def __init__(self, text: str):
+        offsets: List[int] = []
+        find = text.find
+        pos = find('\n')
+        while pos >= 0:
+            offsets.append(pos)
+            pos = find('\n', pos + 1)
+        self.newlines = offsets
+
+    @property
+    def line_count(self) -> int:
+        return len(self.newlines) + 1
+
+    def line_of(self, offset: int) -> int:
+        """문자 위치가 속한 줄 번호 (1부터 시작, 줄바꿈 문자는 그 줄에 포함)"""
+        return bisect_left(self.newlines, offset) + 1
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """(줄 번호, 열 번호) - 둘 다 1부터 시작"""
+        line = self.line_of(offset)
+        return line, offset - self.line_start(line) + 1
+
+    def line_start(self, line: int) -> int:
+        """줄 번호(1부터)의 시작 문자 위치"""
+        return self.newlines[line - 2] + 1 if line > 1 else 0
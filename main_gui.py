@@ -1,13 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
+import os
 from datetime import datetime
 import json
 
+from result_store import ResultStore, FindingIndex
+from scan_journal import ScanJournal
+
+JOURNAL_DIR = "journals"
+
 # 엔진 선택 (Selenium 우선, 없으면 requests 기반)
 SELENIUM_AVAILABLE = False
 try:
-    from xss_engine_selenium import SeleniumCrawler, SeleniumXSSScanner, PageInfo, ScanResult, StoredXSSResult
+    from xss_engine_selenium import (SeleniumCrawler, SeleniumXSSScanner, PageInfo, ScanResult, StoredXSSResult,
+                                     BrowserSession)
     SiteCrawler = SeleniumCrawler
     XSSScanner = SeleniumXSSScanner
     SELENIUM_AVAILABLE = True
@@ -33,10 +40,14 @@ class XSSScannerGUI:
         self.root.configure(bg=self.colors['bg'])
         self.crawler = None
         self.scanner = None
+        self.browser_session = None  # Selenium: 크롤링~스캔 단계가 공유하는 브라우저
         self.pages = []
-        self.results = []
+        self.results = ResultStore()  # 양성 결과 + 엔드포인트별 음성 집계
         self.stored_results = []
         self.scan_start_time = None
+        self.journal = None  # 현재 스캔 저널 (일시정지/재개용)
+        self.batch = None
+        self.batch_results = {}  # 배치 스캔 대상별 결과
         
         self._setup_styles()
         self._create_widgets()
@@ -122,6 +133,11 @@ class XSSScannerGUI:
         tk.Entry(settings_frame, textvariable=self.max_depth_var, width=5,
             font=('Consolas', 10), bg=self.colors['secondary'], fg=self.colors['fg']).pack(side=tk.LEFT, padx=(5, 15))
         
+        ttk.Label(settings_frame, text="시간 예산(분):").pack(side=tk.LEFT)
+        self.budget_var = tk.StringVar(value="")  # 비워두면 예산 제한 없음
+        tk.Entry(settings_frame, textvariable=self.budget_var, width=5,
+            font=('Consolas', 10), bg=self.colors['secondary'], fg=self.colors['fg']).pack(side=tk.LEFT, padx=(5, 15))
+        
         self.quick_mode_var = tk.BooleanVar(value=True)
         tk.Checkbutton(settings_frame, text="빠른 스캔", 
             variable=self.quick_mode_var, bg=self.colors['bg'], fg=self.colors['fg'], 
@@ -153,10 +169,21 @@ class XSSScannerGUI:
         self.page_btn = ttk.Button(btn_frame, text="📄 현재 페이지만", command=self._start_page_scan, width=15)
         self.page_btn.pack(side=tk.LEFT, padx=5)
         
+        self.batch_btn = ttk.Button(btn_frame, text="📚 배치 스캔", command=self._start_batch_scan, width=12)
+        self.batch_btn.pack(side=tk.LEFT, padx=5)
+        
         self.stop_btn = ttk.Button(btn_frame, text="⏹ 중단", command=self._stop_scan, width=10, style='Danger.TButton')
         self.stop_btn.pack(side=tk.LEFT, padx=5)
         self.stop_btn.state(['disabled'])
         
+        # 스캔 저널 기반 일시정지/재개
+        self.pause_btn = ttk.Button(btn_frame, text="⏸ 일시정지", command=self._pause_scan, width=10)
+        self.pause_btn.pack(side=tk.LEFT, padx=5)
+        self.pause_btn.state(['disabled'])
+        
+        self.resume_btn = ttk.Button(btn_frame, text="▶ 재개", command=self._resume_scan, width=8)
+        self.resume_btn.pack(side=tk.LEFT, padx=5)
+        
         # 오른쪽 버튼들
         ttk.Button(btn_frame, text="💾 보고서 저장", command=self._export_report, width=12).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(btn_frame, text="🗑 초기화", command=self._clear_all, width=10).pack(side=tk.RIGHT, padx=5)
@@ -453,7 +480,10 @@ class XSSScannerGUI:
         state = ['disabled'] if scanning else ['!disabled']
         self.start_btn.state(state)
         self.page_btn.state(state)
+        self.batch_btn.state(state)
+        self.resume_btn.state(state)
         self.stop_btn.state(['!disabled'] if scanning else ['disabled'])
+        self.pause_btn.state(['!disabled'] if scanning else ['disabled'])
     
     def _get_severity(self, pattern_name: str) -> tuple:
         """위험도 판정"""
@@ -573,6 +603,18 @@ class XSSScannerGUI:
     
     # ===== 스캔 함수 =====
     
+    def _make_plan(self):
+        """시간 예산이 입력되어 있으면 스캔 계획 생성 (없으면 None -> 기존 방식)"""
+        budget = self.budget_var.get().strip()
+        if not budget:
+            return None
+        try:
+            budget_seconds = float(budget) * 60
+        except ValueError:
+            self._callback("⚠️ 시간 예산은 숫자(분)로 입력하세요. 예산 없이 스캔합니다.", 'warning')
+            return None
+        return self.scanner.plan(self.pages, quick_mode=self.quick_mode_var.get(), budget=budget_seconds)
+    
     def _start_full_scan(self):
         url = self.url_entry.get().strip()
         if not url:
@@ -590,6 +632,7 @@ class XSSScannerGUI:
         self._set_ui_scanning(True)
         self._clear_results()
         self.scan_start_time = datetime.now()
+        self.journal = None
         self.status_label.config(text="크롤링 중...")
         
         self._log("", 'info')
@@ -598,13 +641,15 @@ class XSSScannerGUI:
         self._log(f"   최대 페이지: {max_pages}, 최대 깊이: {max_depth}", 'info')
         self._log("=" * 50, 'info')
         
-        def worker():
+        def run():
             # 1단계: 크롤링
             headless = self.headless_var.get()
             
             if SELENIUM_AVAILABLE:
+                # 크롤링/분석/스캔 단계가 하나의 브라우저 세션을 공유
+                self.browser_session = session = BrowserSession(headless=headless, native_dialogs=self.alert_mode_var.get())
                 self.crawler = SiteCrawler(url, cookies=cookies, max_pages=max_pages, 
-                    max_depth=max_depth, headless=headless, callback=self._callback)
+                    max_depth=max_depth, headless=headless, callback=self._callback, session=session)
             else:
                 self.crawler = SiteCrawler(url, cookies=cookies, max_pages=max_pages, 
                     max_depth=max_depth, callback=self._callback)
@@ -614,7 +659,7 @@ class XSSScannerGUI:
             self.root.after(0, self._update_pages_tree)
             
             if self.crawler.stop_flag:
-                self.root.after(0, lambda: self._scan_complete([], []))
+                self.root.after(0, lambda: self._scan_complete(ResultStore(), []))
                 return
             
             # 2단계: 저장된 XSS 분석
@@ -623,22 +668,33 @@ class XSSScannerGUI:
             alert_mode = self.alert_mode_var.get()  # [v5.5] Alert 모드 가져오기
             
             if SELENIUM_AVAILABLE:
-                self.scanner = XSSScanner(cookies=cookies, headless=headless, callback=self._callback, alert_mode=alert_mode)
+                self.scanner = XSSScanner(cookies=cookies, headless=headless, callback=self._callback, alert_mode=alert_mode,
+                                          session=self.crawler.session)
             else:
-                self.scanner = XSSScanner(cookies=cookies, callback=self._callback)
+                # 크롤러의 세션/커넥션 풀/서버 설정 쿠키를 그대로 사용
+                self.scanner = XSSScanner(callback=self._callback, transport=self.crawler.transport)
             
             stored_results = self.scanner.scan_page_content(self.pages)
             
             if self.scanner.stop_flag:
-                self.root.after(0, lambda: self._scan_complete([], stored_results))
+                self.root.after(0, lambda: self._scan_complete(ResultStore(), stored_results))
                 return
             
-            # 3단계: 폼/파라미터 스캔
+            # 3단계: 폼/파라미터 스캔 (저널에 기록하여 일시정지/재개 지원)
             self.root.after(0, lambda: self.status_label.config(text="XSS 스캔 중..."))
-            results = self.scanner.scan_pages(self.pages, quick_mode=self.quick_mode_var.get())
+            self.journal = self._new_journal()
+            results = self.scanner.scan_pages(self.pages, quick_mode=self.quick_mode_var.get(), journal=self.journal,
+                                              plan=self._make_plan())
+            self.journal.close()
             
             self.root.after(0, lambda: self._scan_complete(results, stored_results))
         
+        def worker():
+            try:
+                run()
+            finally:
+                self._close_browser_session()
+        
         threading.Thread(target=worker, daemon=True).start()
     
     def _start_page_scan(self):
@@ -651,17 +707,19 @@ class XSSScannerGUI:
         self._set_ui_scanning(True)
         self._clear_results()
         self.scan_start_time = datetime.now()
+        self.journal = None
         self.status_label.config(text="페이지 스캔 중...")
         
         self._log("", 'info')
         self._log(f"🚀 단일 페이지 스캔: {url}", 'success')
         
-        def worker():
+        def run():
             headless = self.headless_var.get()
             
             if SELENIUM_AVAILABLE:
+                self.browser_session = session = BrowserSession(headless=headless, native_dialogs=self.alert_mode_var.get())
                 self.crawler = SiteCrawler(url, cookies=cookies, max_pages=1, max_depth=0, 
-                    headless=headless, callback=self._callback)
+                    headless=headless, callback=self._callback, session=session)
             else:
                 self.crawler = SiteCrawler(url, cookies=cookies, max_pages=1, max_depth=0, 
                     callback=self._callback)
@@ -671,21 +729,87 @@ class XSSScannerGUI:
             self.root.after(0, self._update_pages_tree)
             
             if not self.pages:
-                self.root.after(0, lambda: self._scan_complete([], []))
+                self.root.after(0, lambda: self._scan_complete(ResultStore(), []))
                 return
             
             alert_mode = self.alert_mode_var.get()  # [v5.5] Alert 모드 가져오기
             
             if SELENIUM_AVAILABLE:
-                self.scanner = XSSScanner(cookies=cookies, headless=headless, callback=self._callback, alert_mode=alert_mode)
+                self.scanner = XSSScanner(cookies=cookies, headless=headless, callback=self._callback, alert_mode=alert_mode,
+                                          session=self.crawler.session)
             else:
-                self.scanner = XSSScanner(cookies=cookies, callback=self._callback)
+                # 크롤러의 세션/커넥션 풀/서버 설정 쿠키를 그대로 사용
+                self.scanner = XSSScanner(callback=self._callback, transport=self.crawler.transport)
             
             stored_results = self.scanner.scan_page_content(self.pages)
-            results = self.scanner.scan_pages(self.pages, quick_mode=self.quick_mode_var.get())
+            self.journal = self._new_journal()
+            results = self.scanner.scan_pages(self.pages, quick_mode=self.quick_mode_var.get(), journal=self.journal,
+                                              plan=self._make_plan())
+            self.journal.close()
             
             self.root.after(0, lambda: self._scan_complete(results, stored_results))
         
+        def worker():
+            try:
+                run()
+            finally:
+                self._close_browser_session()
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _start_batch_scan(self):
+        """대상 URL 파일을 읽어 여러 사이트를 한 번에 스캔 (Requests 엔진)"""
+        path = filedialog.askopenfilename(
+            title="배치 스캔 대상 파일 (한 줄에 URL 하나)",
+            filetypes=[("텍스트", "*.txt"), ("모든 파일", "*.*")]
+        )
+        if not path:
+            return
+        
+        from batch_scan import BatchScanner, load_targets
+        
+        targets = load_targets(path)
+        if not targets:
+            messagebox.showerror("오류", "대상 파일에 URL 이 없습니다.")
+            return
+        
+        try:
+            max_pages = int(self.max_pages_var.get())
+            max_depth = int(self.max_depth_var.get())
+        except:
+            messagebox.showerror("오류", "최대 페이지/깊이는 숫자로 입력하세요.")
+            return
+        
+        cookies = self._parse_cookies()
+        self._set_ui_scanning(True)
+        self._clear_results()
+        self.scan_start_time = datetime.now()
+        self.journal = None
+        self.status_label.config(text=f"배치 스캔 중... ({len(targets)}개 대상)")
+        
+        self._log("", 'info')
+        self._log("=" * 50, 'info')
+        self._log(f"📚 배치 스캔 시작: {len(targets)}개 대상 ({path})", 'success')
+        self._log("=" * 50, 'info')
+        
+        self.batch = BatchScanner(targets, cookies=cookies, max_pages=max_pages, max_depth=max_depth,
+            quick_mode=self.quick_mode_var.get(), callback=self._callback)
+        
+        def worker():
+            self.batch_results = self.batch.run()
+            
+            # 대상별 결과를 하나의 화면으로 통합
+            results = ResultStore()
+            stored_results = []
+            self.pages = []
+            for target in self.batch_results.values():
+                results.merge(target.results)
+                stored_results.extend(target.stored_results)
+                self.pages.extend(target.pages)
+            
+            self.root.after(0, self._update_pages_tree)
+            self.root.after(0, lambda: self._scan_complete(results, stored_results))
+        
         threading.Thread(target=worker, daemon=True).start()
     
     def _stop_scan(self):
@@ -693,8 +817,80 @@ class XSSScannerGUI:
             self.crawler.stop()
         if self.scanner:
             self.scanner.stop()
+        if self.batch:
+            self.batch.stop()
         self._log("⏹ 중단 요청됨...", 'warning')
     
+    def _new_journal(self) -> ScanJournal:
+        filename = f"scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        return ScanJournal(os.path.join(JOURNAL_DIR, filename))
+    
+    def _pause_scan(self):
+        """스캔 중단 (완료된 테스트는 저널에 남아 재개 가능)"""
+        self._stop_scan()
+        if self.journal:
+            self._log(f"⏸ 일시정지됨 - 저널: {self.journal.path}", 'warning')
+            self._log("   '▶ 재개' 버튼으로 남은 테스트를 이어서 실행합니다.", 'info')
+        else:
+            self._log("⏸ 아직 폼/파라미터 스캔 단계가 아니므로 재개할 저널이 없습니다.", 'warning')
+    
+    def _resume_scan(self):
+        """저널에서 페이지 목록과 완료된 테스트를 읽어 스캔 재개"""
+        initial = self.journal.path if self.journal else None
+        path = filedialog.askopenfilename(
+            title="재개할 스캔 저널 선택",
+            initialdir=os.path.dirname(initial) if initial else JOURNAL_DIR,
+            initialfile=os.path.basename(initial) if initial else None,
+            filetypes=[("스캔 저널", "*.jsonl"), ("모든 파일", "*.*")]
+        )
+        if not path:
+            return
+        
+        journal = ScanJournal(path)
+        page_data = journal.load_pages()
+        if not page_data:
+            messagebox.showerror("오류", "저널에 페이지 목록이 없습니다.")
+            return
+        
+        fields = PageInfo.__dataclass_fields__
+        self.pages = [PageInfo(**{k: (set(v) if k == 'links' else v) for k, v in data.items() if k in fields})
+                      for data in page_data]
+        self.journal = journal
+        
+        cookies = self._parse_cookies()
+        self._set_ui_scanning(True)
+        self._clear_results()
+        self._update_pages_tree()
+        self.scan_start_time = datetime.now()
+        self.status_label.config(text="XSS 스캔 재개 중...")
+        self._log("", 'info')
+        self._log(f"▶ 스캔 재개: {path} ({len(self.pages)}개 페이지)", 'success')
+        
+        def worker():
+            results = ResultStore()
+            try:
+                if SELENIUM_AVAILABLE:
+                    self.scanner = XSSScanner(cookies=cookies, headless=self.headless_var.get(),
+                        callback=self._callback, alert_mode=self.alert_mode_var.get())
+                else:
+                    self.scanner = XSSScanner(cookies=cookies, callback=self._callback)
+                
+                # 빠른 스캔 여부/테스트 목록은 저널에 기록된 것을 따름
+                results = self.scanner.scan_pages(self.pages, quick_mode=self.quick_mode_var.get(), journal=journal)
+            except Exception as e:
+                self._callback(f"❌ 스캔 재개 오류: {e}", 'danger')
+            finally:
+                # 오류가 나도 저널을 닫고 UI 를 스캔 중 상태에서 되돌림 (완료된 테스트는 저널에 남음)
+                journal.close()
+                self.root.after(0, lambda: self._scan_complete(results, []))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _close_browser_session(self):
+        if self.browser_session is not None:
+            self.browser_session.close()
+            self.browser_session = None
+    
     def _update_pages_tree(self):
         for item in self.pages_tree.get_children():
             self.pages_tree.delete(item)
@@ -724,9 +920,9 @@ class XSSScannerGUI:
         else:
             elapsed_str = "-"
         
-        # 결과 분석
-        vulnerable = [r for r in results if r.vulnerable]
-        reflected = [r for r in results if r.reflected and not r.vulnerable]
+        # 결과 분석 (저장소에서 조회)
+        vulnerable = results.vulnerable
+        reflected = results.reflected
         
         # 저장된 XSS 트리 업데이트
         for item in self.stored_tree.get_children():
@@ -768,7 +964,7 @@ class XSSScannerGUI:
         
         # 통계 업데이트
         self.vuln_stats_label.config(
-            text=f"취약점: {len(vulnerable)} | 반사: {len(reflected)} | 테스트: {len(results)}"
+            text=f"취약점: {len(vulnerable)} | 반사: {len(reflected)} | 테스트: {results.total}"
         )
         self.count_label.config(
             text=f"페이지: {len(self.pages)} | 저장된XSS: {len(self.stored_results)} | 취약점: {len(vulnerable)} | 반사: {len(reflected)}"
@@ -781,7 +977,9 @@ class XSSScannerGUI:
         self._log("=" * 50, 'info')
         self._log(f"⏱️ 소요 시간: {elapsed_str}", 'info')
         self._log(f"📄 크롤링된 페이지: {len(self.pages)}", 'info')
-        self._log(f"🔍 총 테스트: {len(results)}", 'info')
+        self._log(f"🔍 총 테스트: {results.total}", 'info')
+        if results.errors:
+            self._log(f"⚠️ 요청 오류: {results.errors}건", 'warning')
         self._log("", 'info')
         
         if self.stored_results:
@@ -817,6 +1015,8 @@ class XSSScannerGUI:
         self.vuln_stats_label.config(text="취약점: 0 | 반사: 0 | 테스트: 0")
         self.count_label.config(text="페이지: 0 | 저장된XSS: 0 | 취약점: 0 | 반사: 0")
         
+        self.batch_results = {}
+        
         self.stored_detail_text.config(state='normal')
         self.stored_detail_text.delete('1.0', tk.END)
         self.stored_detail_text.insert('1.0', '항목을 선택하면 상세 정보가 표시됩니다.')
@@ -832,12 +1032,12 @@ class XSSScannerGUI:
         self.log_text.delete('1.0', tk.END)
         self.all_logs = []
         self.pages = []
-        self.results = []
+        self.results = ResultStore()
         self.stored_results = []
         self._log("🗑 초기화 완료", 'info')
     
     def _export_report(self):
-        if not self.results and not self.stored_results:
+        if not self.results.total and not self.stored_results:
             messagebox.showinfo("알림", "저장할 결과가 없습니다.")
             return
         
@@ -850,8 +1050,8 @@ class XSSScannerGUI:
         if not filename:
             return
         
-        vulnerable = [r for r in self.results if r.vulnerable]
-        reflected = [r for r in self.results if r.reflected and not r.vulnerable]
+        vulnerable = self.results.vulnerable
+        reflected = self.results.reflected
         
         if filename.endswith('.html'):
             html = self._generate_html_report(vulnerable, reflected)
@@ -865,9 +1065,13 @@ class XSSScannerGUI:
                 'summary': {
                     'stored_xss': len(self.stored_results),
                     'vulnerabilities': len(vulnerable),
-                    'reflections': len(reflected)
+                    'reflections': len(reflected),
+                    'tests': self.results.total,
+                    'errors': self.results.errors
                 },
+                'targets': [t.summary() for t in self.batch_results.values()],
                 'stored_xss': [{'url': r.url, 'type': r.pattern_name, 'content': r.matched_content, 'line': r.line_number} for r in self.stored_results],
+                'stored_xss_grouped': FindingIndex(self.stored_results).to_list(),
                 'vulnerabilities': [{'url': r.url, 'param': r.parameter, 'payload': r.payload, 'status': r.status_code} for r in vulnerable]
             }
             with open(filename, 'w', encoding='utf-8') as f:
@@ -877,7 +1081,8 @@ class XSSScannerGUI:
                 f.write(f"XSS 취약점 스캔 보고서\n")
                 f.write(f"생성 시간: {datetime.now()}\n")
                 f.write(f"대상 URL: {self.url_entry.get()}\n")
-                f.write(f"크롤링된 페이지: {len(self.pages)}\n\n")
+                f.write(f"크롤링된 페이지: {len(self.pages)}\n")
+                f.write(f"총 테스트: {self.results.total} (오류 {self.results.errors})\n\n")
                 f.write(f"=== 저장된 XSS ({len(self.stored_results)}개) ===\n")
                 for r in self.stored_results:
                     f.write(f"  [{r.pattern_name}] {r.url}\n    {r.matched_content[:80]}\n\n")
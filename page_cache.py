@@ -0,0 +1,168 @@
+"""
+================================================================================
+XSS Scanner - 페이지 본문 캐시 (page_cache.py)
+================================================================================
+
+크롤링 중 받은 HTML 본문을 저장된 XSS 분석 단계에서 다시 사용합니다.
+(Requests 엔진 - 분석 단계에서 페이지를 다시 요청하지 않음)
+
+- 메모리에는 max_bytes 까지만 보관 (오래 사용하지 않은 본문부터 내보냄)
+- 내보낸 본문은 임시 디렉토리에 파일로 저장 (spill=False 면 버림 -> 분석 시 다시 요청)
+- large_bytes 보다 큰 본문은 메모리에 두지 않고 바로 파일로 보관
+  (take_file() 로 파일을 넘겨받아 창 단위로 분석 - stream_analysis.py)
+- 스레드 안전, close() 시 임시 파일 삭제
+
+사용법:
+    from page_cache import PageCache
+
+    cache = PageCache(max_bytes=32 * 1024 * 1024)
+    cache.put(url, html)
+    html = cache.pop(url)      # 없으면 None
+================================================================================
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024   # 메모리에 보관할 본문 총 크기 (UTF-8 바이트)
+LARGE_BODY_BYTES = 4 * 1024 * 1024     # 이보다 큰 본문은 바로 파일로 보관
+
+
+class PageCache:
+    """URL -> HTML 본문 (메모리 상한 + 디스크 보관)"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, spill: bool = True,
+                 large_bytes: int = LARGE_BODY_BYTES):
+        self.max_bytes = max(0, max_bytes)
+        self.spill = spill
+        self.large_bytes = large_bytes
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.spilled = 0
+        self._memory: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._disk: Dict[str, str] = {}  # url -> 파일 경로
+        self._dir: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory) + len(self._disk)
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return url in self._memory or url in self._disk
+
+    def put(self, url: str, html: str) -> None:
+        body = html.encode('utf-8', errors='surrogatepass')
+        with self._lock:
+            self._discard(url)
+            if self.spill and len(body) > self.large_bytes and self._write(url, body):
+                return
+            self._memory[url] = body
+            self.memory_bytes += len(body)
+            while self.memory_bytes > self.max_bytes and self._memory:
+                old_url, old_body = self._memory.popitem(last=False)
+                self.memory_bytes -= len(old_body)
+                if self.spill:
+                    self._write(old_url, old_body)
+
+    def get(self, url: str) -> Optional[str]:
+        with self._lock:
+            body = self._memory.get(url)
+            if body is not None:
+                self._memory.move_to_end(url)
+            else:
+                body = self._read(url)
+            self._count(body)
+        return None if body is None else body.decode('utf-8', errors='surrogatepass')
+
+    def pop(self, url: str) -> Optional[str]:
+        """본문을 꺼내고 캐시에서 제거 (한 번만 쓰는 본문의 메모리/디스크 즉시 반환)"""
+        with self._lock:
+            body = self._memory.get(url)
+            if body is None:
+                body = self._read(url)
+            self._discard(url)
+            self._count(body)
+        return None if body is None else body.decode('utf-8', errors='surrogatepass')
+
+    def take_file(self, url: str, min_bytes: int = 0) -> Optional[str]:
+        """
+        파일로 보관된 min_bytes 이상 본문의 경로를 넘기고 캐시에서 제거 (파일 삭제는 호출한 쪽)
+
+        메모리에 있거나 작은 본문이면 None (pop() 으로 꺼냄)
+        """
+        with self._lock:
+            path = self._disk.get(url)
+            if path is None:
+                return None
+            try:
+                if os.path.getsize(path) < min_bytes:
+                    return None
+            except OSError:
+                return None
+            del self._disk[url]
+            self.hits += 1
+            return path
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._disk.clear()
+            self.memory_bytes = 0
+            if self._dir is not None:
+                shutil.rmtree(self._dir, ignore_errors=True)
+                self._dir = None
+
+    def close(self) -> None:
+        self.clear()
+
+    # ----- 내부 (잠금 보유 상태에서 호출) -----
+
+    def _count(self, body: Optional[bytes]) -> None:
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+    def _discard(self, url: str) -> None:
+        body = self._memory.pop(url, None)
+        if body is not None:
+            self.memory_bytes -= len(body)
+        path = self._disk.pop(url, None)
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _write(self, url: str, body: bytes) -> bool:
+        try:
+            if self._dir is None:
+                self._dir = tempfile.mkdtemp(prefix='xss_pages_')
+            path = os.path.join(self._dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+            with open(path, 'wb') as f:
+                f.write(body)
+        except OSError:
+            return False  # 디스크에 쓸 수 없으면 버림 (분석 단계에서 다시 요청)
+        self._disk[url] = path
+        self.spilled += 1
+        return True
+
+    def _read(self, url: str) -> Optional[bytes]:
+        path = self._disk.get(url)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            self._disk.pop(url, None)
+            return None
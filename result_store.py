@@ -0,0 +1,321 @@
+"""
+================================================================================
+XSS Scanner - 스캔 결과 저장소 (result_store.py)
+================================================================================
+
+반사형 XSS 스캔 결과를 적은 메모리로 보관합니다.
+
+- 양성 결과 (반사/취약/실행): __slots__ 레코드로 개별 보관
+- 음성 결과 (반사 없음/오류): 엔드포인트별 카운터 + 페이로드 ID 배열만 보관
+
+테스트 수가 10만 건을 넘어도 메모리 사용량은 양성 결과 수에 비례합니다.
+
+저장된 XSS 결과는 FindingIndex 가 (패턴 이름, 매치 내용) 기준으로 묶어
+여러 페이지에 반복된 결과를 발생 횟수가 있는 항목 하나로 보여줍니다.
+
+사용법:
+    from result_store import ResultStore
+
+    store = ResultStore()
+    store.add(scan_result)          # ScanResult (두 엔진 모두 지원)
+
+    for record in store:            # 양성 결과만 순회
+        print(record.url, record.payload)
+
+    print(store.total, store.stats())
+
+    index = FindingIndex(stored_results)
+    for finding in index.repeated():
+        print(finding.pattern_name, finding.count)
+================================================================================
+"""
+
+import threading
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# ==============================================================================
+# 레코드
+# ==============================================================================
+
+class ResultRecord:
+    """양성 스캔 결과 (ScanResult 와 같은 속성 이름)"""
+
+    __slots__ = ('url', 'parameter', 'payload', 'reflected', 'vulnerable',
+                 'executed', 'console_output', 'response_snippet', 'status_code')
+
+    def __init__(self, url: str, parameter: str, payload: str, reflected: bool, vulnerable: bool,
+                 executed: bool = False, console_output: str = "",
+                 response_snippet: Optional[str] = None, status_code: int = 0):
+        self.url = url
+        self.parameter = parameter
+        self.payload = payload
+        self.reflected = reflected
+        self.vulnerable = vulnerable
+        self.executed = executed
+        self.console_output = console_output
+        self.response_snippet = response_snippet
+        self.status_code = status_code
+
+    @classmethod
+    def from_result(cls, result, payload: str) -> 'ResultRecord':
+        return cls(
+            result.url, result.parameter, payload, result.reflected, result.vulnerable,
+            getattr(result, 'executed', False), getattr(result, 'console_output', ""),
+            result.response_snippet, result.status_code
+        )
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"ResultRecord({self.parameter!r}, {self.payload[:30]!r}, vulnerable={self.vulnerable})"
+
+
+class EndpointStats:
+    """엔드포인트 (URL, 파라미터) 별 음성 결과 집계"""
+
+    __slots__ = ('url', 'parameter', 'tested', 'positives', 'errors', 'last_error', 'negative_ids')
+
+    def __init__(self, url: str, parameter: str):
+        self.url = url
+        self.parameter = parameter
+        self.tested = 0
+        self.positives = 0
+        self.errors = 0
+        self.last_error = ""
+        self.negative_ids = array('I')  # 반사되지 않은 페이로드 ID
+
+    def to_dict(self) -> dict:
+        return {
+            'url': self.url,
+            'parameter': self.parameter,
+            'tested': self.tested,
+            'positives': self.positives,
+            'errors': self.errors,
+        }
+
+
+# ==============================================================================
+# 저장소
+# ==============================================================================
+
+class ResultStore:
+    """
+    스캔 결과 저장소
+
+    반복(iteration)과 len() 은 양성 결과 기준이며,
+    전체 테스트 수는 total 속성으로 확인합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._payloads: List[str] = []
+        self._payload_ids: Dict[str, int] = {}
+        self.positives: List[ResultRecord] = []
+        self.endpoints: Dict[Tuple[str, str], EndpointStats] = {}
+
+    # ----- 페이로드 ID -----
+
+    def payload_id(self, payload: str) -> int:
+        """페이로드 문자열을 정수 ID 로 변환 (같은 문자열은 한 번만 보관)"""
+        pid = self._payload_ids.get(payload)
+        if pid is None:
+            pid = self._payload_ids[payload] = len(self._payloads)
+            self._payloads.append(payload)
+        return pid
+
+    def payload(self, pid: int) -> str:
+        return self._payloads[pid]
+
+    # ----- 추가 -----
+
+    @staticmethod
+    def endpoint_key(url: str, parameter: str) -> Tuple[str, str]:
+        # GET 주입 URL 은 쿼리스트링만 다르므로 경로 기준으로 묶음
+        return url.split('?', 1)[0], parameter
+
+    def add(self, result) -> Optional[ResultRecord]:
+        """ScanResult 추가. 양성이면 ResultRecord 반환, 음성이면 집계만 하고 None"""
+        if result is None:
+            return None
+
+        with self._lock:
+            key = self.endpoint_key(result.url, result.parameter)
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointStats(*key)
+            stats.tested += 1
+
+            pid = self.payload_id(result.payload)
+            if result.reflected or result.vulnerable or getattr(result, 'executed', False):
+                stats.positives += 1
+                record = ResultRecord.from_result(result, self._payloads[pid])
+                self.positives.append(record)
+                return record
+
+            snippet = result.response_snippet or ""
+            if snippet.startswith("Error"):
+                stats.errors += 1
+                stats.last_error = snippet
+            stats.negative_ids.append(pid)
+            return None
+
+    def extend(self, results) -> None:
+        for result in results:
+            self.add(result)
+
+    def merge(self, other: 'ResultStore') -> None:
+        """다른 저장소의 양성 레코드와 엔드포인트 집계를 합침 (배치 스캔 결과 통합용)"""
+        with self._lock:
+            for record in other.positives:
+                record.payload = self._payloads[self.payload_id(record.payload)]
+                self.positives.append(record)
+            for key, src in other.endpoints.items():
+                stats = self.endpoints.get(key)
+                if stats is None:
+                    stats = self.endpoints[key] = EndpointStats(*key)
+                stats.tested += src.tested
+                stats.positives += src.positives
+                stats.errors += src.errors
+                stats.last_error = src.last_error or stats.last_error
+                stats.negative_ids.extend(self.payload_id(other.payload(pid)) for pid in src.negative_ids)
+
+    # ----- 조회 -----
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        return iter(list(self.positives))
+
+    def __len__(self) -> int:
+        return len(self.positives)
+
+    @property
+    def total(self) -> int:
+        """전체 테스트 수 (음성 포함)"""
+        return sum(stats.tested for stats in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(stats.errors for stats in self.endpoints.values())
+
+    @property
+    def vulnerable(self) -> List[ResultRecord]:
+        return [r for r in self.positives if r.vulnerable]
+
+    @property
+    def reflected(self) -> List[ResultRecord]:
+        """반사만 감지된 결과 (취약 제외)"""
+        return [r for r in self.positives if r.reflected and not r.vulnerable]
+
+    def negative_payloads(self, url: str, parameter: str) -> List[str]:
+        """엔드포인트에서 반사되지 않은 페이로드 목록"""
+        stats = self.endpoints.get(self.endpoint_key(url, parameter))
+        if stats is None:
+            return []
+        return [self._payloads[pid] for pid in stats.negative_ids]
+
+    def stats(self) -> dict:
+        """보고서/상태 표시용 통계"""
+        return {
+            'tests': self.total,
+            'endpoints': len(self.endpoints),
+            'vulnerable': len(self.vulnerable),
+            'reflected': len(self.reflected),
+            'errors': self.errors,
+        }
+
+
+# ==============================================================================
+# 저장된 XSS 결과 색인
+# ==============================================================================
+
+class StoredFinding:
+    """여러 페이지에서 반복된 같은 저장된 XSS 결과 (패턴 이름 + 매치 내용)"""
+
+    __slots__ = ('pattern_name', 'matched_content', 'first', 'pages')
+
+    def __init__(self, first):
+        self.pattern_name = first.pattern_name
+        self.matched_content = first.matched_content
+        self.first = first              # 처음 발견된 StoredXSSResult
+        self.pages: Dict[str, int] = {}  # URL -> 줄 번호 (발견 순서 유지)
+
+    @property
+    def count(self) -> int:
+        """발견된 페이지 수"""
+        return len(self.pages)
+
+    def to_dict(self) -> dict:
+        return {
+            'pattern_name': self.pattern_name,
+            'matched_content': self.matched_content,
+            'count': self.count,
+            'urls': list(self.pages),
+        }
+
+    def __repr__(self):
+        return f"StoredFinding({self.pattern_name!r}, count={self.count})"
+
+
+class FindingIndex:
+    """
+    스캔 전체의 저장된 XSS 결과 색인
+
+    (패턴 이름, 매치 내용) 해시 키로 묶어, 공통 레이아웃처럼 N개 페이지에
+    반복된 같은 결과를 발생 횟수가 있는 항목 하나로 보여줍니다.
+    같은 페이지에서 반복된 결과는 한 번만 셉니다.
+    """
+
+    def __init__(self, results=()):
+        self._lock = threading.Lock()
+        self._findings: Dict[Tuple[str, str], StoredFinding] = {}
+        self.occurrences = 0
+        self.extend(results)
+
+    @staticmethod
+    def key(result) -> Tuple[str, str]:
+        return result.pattern_name, result.matched_content
+
+    def add(self, result) -> bool:
+        """StoredXSSResult 추가 (두 엔진 모두 지원). 처음 보는 결과면 True"""
+        with self._lock:
+            key = self.key(result)
+            finding = self._findings.get(key)
+            is_new = finding is None
+            if is_new:
+                finding = self._findings[key] = StoredFinding(result)
+            if result.url not in finding.pages:
+                finding.pages[result.url] = getattr(result, 'line_number', 0)
+                self.occurrences += 1
+            return is_new
+
+    def extend(self, results) -> None:
+        for result in results:
+            self.add(result)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._findings.clear()
+            self.occurrences = 0
+
+    def __iter__(self) -> Iterator[StoredFinding]:
+        return iter(list(self._findings.values()))
+
+    def __len__(self) -> int:
+        return len(self._findings)
+
+    def __contains__(self, result) -> bool:
+        return self.key(result) in self._findings
+
+    def get(self, pattern_name: str, matched_content: str) -> Optional[StoredFinding]:
+        return self._findings.get((pattern_name, matched_content))
+
+    def repeated(self, min_count: int = 2) -> List[StoredFinding]:
+        """min_count 개 이상 페이지에서 발견된 결과 (발생 횟수 내림차순)"""
+        found = [f for f in self if f.count >= min_count]
+        found.sort(key=lambda f: f.count, reverse=True)
+        return found
+
+    def to_list(self) -> List[dict]:
+        return [finding.to_dict() for finding in self]
@@ -0,0 +1,158 @@
+"""
+================================================================================
+XSS Scanner - 스캔 저널 (scan_journal.py)
+================================================================================
+
+반사형 XSS 스캔의 완료된 테스트를 추가 전용(JSONL) 파일에 기록합니다.
+스캔이 중단/크래시되어도 다시 시작하면 완료된 테스트는 건너뛰고
+기록된 결과를 그대로 합칩니다.
+
+- 키: (주입 지점, 페이로드 ID)
+    주입 지점 = "종류|메서드|URL|파라미터", 페이로드 ID = 페이로드 SHA-1 앞 12자
+- 요청 오류 결과는 기록하지 않음 (재개 시 다시 시도)
+- 처음 실행할 때 테스트 목록(키 순서)과 빠른 스캔 여부를 기록
+  -> 재개하면 현재 옵션과 관계없이 같은 테스트 목록으로 이어서 실행 (시간 예산 계획에서 빠진 엔드포인트 제외)
+
+사용법:
+    from scan_journal import ScanJournal
+
+    journal = ScanJournal("journals/scan.jsonl")
+    scanner.scan_pages(pages, quick_mode=True, journal=journal)
+    journal.close()
+================================================================================
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, is_dataclass
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+
+JournalKey = Tuple[str, str]
+
+
+def payload_id(payload: str) -> str:
+    """실행 간에 동일한 페이로드 ID"""
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+
+def injection_point(kind: str, method: str, url: str, parameter: str) -> str:
+    return f"{kind}|{method.lower()}|{url}|{parameter}"
+
+
+def task_key(kind: str, method: str, url: str, parameter: str, payload: str) -> JournalKey:
+    return injection_point(kind, method, url, parameter), payload_id(payload)
+
+
+def is_error_result(result) -> bool:
+    snippet = getattr(result, 'response_snippet', None) or ""
+    return not result.reflected and not result.vulnerable and snippet.startswith("Error")
+
+
+class ScanJournal:
+    """추가 전용 스캔 저널 (스레드 안전)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+    # ----- 읽기 -----
+
+    def _read_entries(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # 크래시로 잘린 마지막 줄 등은 무시
+                    continue
+
+    def load(self) -> Dict[JournalKey, SimpleNamespace]:
+        """완료된 테스트 -> 복원된 결과 (ResultStore.add 에 그대로 사용 가능)"""
+        completed = {}
+        for entry in self._read_entries():
+            if entry.get('t') != 'test':
+                continue
+            completed[(entry['k'], entry['p'])] = SimpleNamespace(
+                url=entry['u'], parameter=entry['n'], payload=entry.get('pl', ''),
+                reflected=entry.get('r', False), vulnerable=entry.get('v', False),
+                executed=entry.get('e', False), console_output=entry.get('c', ''),
+                response_snippet=entry.get('s'), status_code=entry.get('sc', 0),
+            )
+        return completed
+
+    def load_plan(self) -> Optional[Tuple[bool, List[JournalKey]]]:
+        """처음 실행할 때 기록된 (빠른 스캔 여부, 테스트 키 목록), 없으면 None"""
+        for entry in self._read_entries():
+            if entry.get('t') == 'plan':
+                return entry.get('quick', False), [tuple(key) for key in entry['keys']]
+        return None
+
+    def load_pages(self) -> Optional[List[dict]]:
+        """마지막으로 기록된 페이지 목록 (재개 시 재크롤링 없이 사용)"""
+        pages = None
+        for entry in self._read_entries():
+            if entry.get('t') == 'pages':
+                pages = entry['pages']
+        return pages
+
+    # ----- 쓰기 -----
+
+    def _append(self, entry: dict):
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+
+    def record_pages(self, pages) -> None:
+        serialized = []
+        for page in pages:
+            data = asdict(page) if is_dataclass(page) else dict(page)
+            data['links'] = sorted(data.get('links', []))
+            serialized.append(data)
+        self._append({'t': 'pages', 'pages': serialized})
+
+    def record_plan(self, keys: List[JournalKey], quick_mode: bool) -> None:
+        """실행할 테스트 목록 기록 (재개 시 같은 목록을 다시 만듦)"""
+        self._append({'t': 'plan', 'quick': quick_mode, 'keys': [list(key) for key in keys]})
+
+    def record(self, key: JournalKey, result) -> None:
+        """완료된 테스트 기록 (요청 오류는 재시도를 위해 기록하지 않음)"""
+        if result is None or is_error_result(result):
+            return
+        entry = {
+            't': 'test', 'k': key[0], 'p': key[1],
+            'u': result.url, 'n': result.parameter, 'pl': result.payload,
+            'r': result.reflected, 'v': result.vulnerable,
+        }
+        if result.reflected or result.vulnerable or getattr(result, 'executed', False):
+            # 양성 결과만 상세 필드 보관
+            entry.update({
+                'e': getattr(result, 'executed', False), 'c': getattr(result, 'console_output', ''),
+                's': result.response_snippet, 'sc': result.status_code,
+            })
+        self._append(entry)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,221 @@
+"""
+================================================================================
+XSS Scanner - 시간 예산 스캔 계획 (scan_planner.py)
+================================================================================
+
+크롤링된 PageInfo 목록을 스캔 계획으로 변환합니다.
+
+- 주입 지점(엔드포인트)별 기대 수익(반사 가능성) 점수 계산
+- 측정된 요청 지연과 동시성으로 소요 시간 추정 (dry-run 요약)
+- 시간 예산이 주어지면 엔드포인트별로 빠른/전체 페이로드 선택
+  (예산이 빠른 스캔에도 부족하면 점수가 낮은 엔드포인트부터 제외)
+- 테스트는 기대 수익 순으로 정렬 -> 중단되더라도 가치가 높은 테스트가 먼저 끝남
+
+사용법:
+    from scan_planner import plan_scan
+
+    plan = plan_scan(pages, XSS_PAYLOADS_QUICK, XSS_PAYLOADS_FULL,
+                     latency=0.3, concurrency=20, budget=600)
+    print(plan.describe())
+    results = scanner.scan_pages(pages, plan=plan)
+================================================================================
+"""
+
+import math
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+DEFAULT_LATENCY = 0.5  # 측정 실패 시 요청당 지연 (초)
+
+# 검색/입력 값을 그대로 출력하는 경우가 많은 파라미터 이름
+HIGH_YIELD_NAMES = frozenset({
+    'q', 's', 'query', 'search', 'keyword', 'kw', 'term', 'name', 'title', 'message', 'msg',
+    'comment', 'content', 'text', 'body', 'subject', 'desc', 'description', 'redirect',
+    'url', 'next', 'return', 'returnurl', 'callback', 'error', 'id', 'page',
+})
+LOW_YIELD_TYPES = frozenset({'hidden', 'password', 'checkbox', 'radio', 'file', 'submit', 'button'})
+
+
+# ==============================================================================
+# 계획 항목
+# ==============================================================================
+
+@dataclass
+class PlannedEndpoint:
+    """주입 지점 하나 (URL 파라미터 또는 폼 입력 필드)"""
+    kind: str                       # 'url' / 'form'
+    method: str
+    url: str                        # URL 파라미터는 페이지 URL, 폼은 action
+    parameter: str
+    score: float
+    payloads: List[str] = field(default_factory=list)
+    full: bool = False              # 전체 페이로드 사용 여부
+    form: Optional[Dict] = None
+    input_field: Optional[Dict] = None
+
+
+@dataclass
+class PlannedTest:
+    """실행할 테스트 하나 (엔드포인트 + 페이로드)"""
+    endpoint: PlannedEndpoint
+    payload: str
+    value: float
+
+
+def endpoint_score(kind: str, url: str, parameter: str, input_type: str = 'text') -> float:
+    """주입 지점의 기대 수익 점수 (휴리스틱, 클수록 먼저 스캔)"""
+    score = 1.0
+    name = parameter.lower()
+    if name in HIGH_YIELD_NAMES:
+        score += 1.0
+    if kind == 'url':
+        score += 0.5  # GET 파라미터는 그대로 반사되는 경우가 많음
+    if input_type in ('text', 'search', 'textarea', 'url'):
+        score += 0.5
+    elif input_type in LOW_YIELD_TYPES:
+        score -= 0.5
+    if 'search' in url.lower():
+        score += 0.5
+    return score
+
+
+def estimate_seconds(tests: int, latency: float, concurrency: int) -> float:
+    """테스트 수 -> 예상 소요 시간 (요청 지연 x 동시 실행 라운드 수)"""
+    return math.ceil(tests / max(1, concurrency)) * latency
+
+
+def measure_latency(fetch: Callable[[str], object], urls: Iterable[str], samples: int = 3) -> float:
+    """URL 몇 개를 실제로 요청하여 요청당 지연(중앙값) 측정, 실패하면 DEFAULT_LATENCY"""
+    timings = []
+    for url in list(urls)[:samples]:
+        started = time.time()
+        try:
+            fetch(url)
+        except Exception:
+            continue
+        timings.append(time.time() - started)
+    return statistics.median(timings) if timings else DEFAULT_LATENCY
+
+
+# ==============================================================================
+# 계획
+# ==============================================================================
+
+class ScanPlan:
+    """엔드포인트별 페이로드 선택 + 기대 수익 순 테스트 목록"""
+
+    def __init__(self, endpoints: List[PlannedEndpoint], dropped: List[PlannedEndpoint],
+                 latency: float, concurrency: int, budget: Optional[float] = None):
+        self.endpoints = endpoints
+        self.dropped = dropped
+        self.latency = latency
+        self.concurrency = concurrency
+        self.budget = budget
+
+    @property
+    def test_count(self) -> int:
+        return sum(len(e.payloads) for e in self.endpoints)
+
+    @property
+    def estimated_seconds(self) -> float:
+        return estimate_seconds(self.test_count, self.latency, self.concurrency)
+
+    def tests(self) -> List[PlannedTest]:
+        """기대 수익 순으로 정렬된 테스트 (페이로드 순위가 낮을수록 수익 감소)"""
+        tests = [PlannedTest(endpoint, payload, endpoint.score / (1 + rank))
+                 for endpoint in self.endpoints
+                 for rank, payload in enumerate(endpoint.payloads)]
+        tests.sort(key=lambda t: t.value, reverse=True)
+        return tests
+
+    def summary(self) -> dict:
+        return {
+            'endpoints': len(self.endpoints),
+            'full_endpoints': sum(1 for e in self.endpoints if e.full),
+            'dropped_endpoints': len(self.dropped),
+            'tests': self.test_count,
+            'latency': round(self.latency, 3),
+            'concurrency': self.concurrency,
+            'estimated_seconds': round(self.estimated_seconds, 1),
+            'budget': self.budget,
+        }
+
+    def describe(self) -> str:
+        """dry-run 요약 (로그 출력용)"""
+        s = self.summary()
+        lines = [
+            f"📐 스캔 계획: 엔드포인트 {s['endpoints']}개 (전체 페이로드 {s['full_endpoints']}개), "
+            f"테스트 {s['tests']}개",
+            f"   예상 소요: {s['estimated_seconds']:.0f}초 (요청당 {s['latency']:.2f}초, 동시 {s['concurrency']})",
+        ]
+        if self.budget is not None:
+            lines.append(f"   시간 예산: {self.budget:.0f}초")
+        if self.dropped:
+            lines.append(f"   ⚠️ 예산 부족으로 제외된 엔드포인트: {len(self.dropped)}개")
+        return '\n'.join(lines)
+
+
+def collect_endpoints(pages) -> List[PlannedEndpoint]:
+    """PageInfo 목록 -> 주입 지점 목록 (build_tasks 와 같은 범위)"""
+    endpoints = []
+    for page in pages:
+        for param in page.params:
+            endpoints.append(PlannedEndpoint('url', 'get', page.url, param,
+                                             endpoint_score('url', page.url, param)))
+        for form in page.forms:
+            for input_field in form['inputs']:
+                endpoints.append(PlannedEndpoint(
+                    'form', form['method'], form['action'], input_field['name'],
+                    endpoint_score('form', form['action'], input_field['name'], input_field.get('type', 'text')),
+                    form=form, input_field=input_field))
+    return endpoints
+
+
+def plan_scan(pages, quick_payloads: List[str], full_payloads: List[str], latency: float = DEFAULT_LATENCY,
+              concurrency: int = 1, budget: Optional[float] = None, full: bool = False) -> ScanPlan:
+    """
+    스캔 계획 생성
+
+    Args:
+        pages: 크롤링된 PageInfo 목록
+        quick_payloads / full_payloads: 엔진의 빠른/전체 페이로드 (빠른 페이로드가 앞쪽 순위)
+        latency: 요청당 지연 (초)
+        concurrency: 동시 실행 수
+        budget: 시간 예산 (초). None 이면 예산 제한 없이 full 여부로 페이로드 결정
+        full: 예산이 없을 때 전체 페이로드 사용 여부
+    """
+    endpoints = sorted(collect_endpoints(pages), key=lambda e: e.score, reverse=True)
+    extra = [p for p in full_payloads if p not in quick_payloads]
+
+    def upgrade(endpoint):
+        endpoint.payloads = list(quick_payloads) + extra
+        endpoint.full = True
+
+    for endpoint in endpoints:
+        endpoint.payloads = list(quick_payloads)
+    if budget is None:
+        if full:
+            for endpoint in endpoints:
+                upgrade(endpoint)
+        return ScanPlan(endpoints, [], latency, concurrency)
+
+    def fits(tests):
+        return estimate_seconds(tests, latency, concurrency) <= budget
+
+    # 1. 빠른 스캔도 예산을 넘으면 점수가 낮은 엔드포인트부터 제외
+    tests = len(endpoints) * len(quick_payloads)
+    dropped = []
+    while endpoints and not fits(tests):
+        dropped.append(endpoints.pop())
+        tests -= len(quick_payloads)
+
+    # 2. 남은 예산으로 점수가 높은 엔드포인트부터 전체 페이로드로 확장
+    for endpoint in endpoints:
+        if extra and fits(tests + len(extra)):
+            upgrade(endpoint)
+            tests += len(extra)
+
+    return ScanPlan(endpoints, dropped, latency, concurrency, budget)
@@ -0,0 +1,393 @@
+"""
+================================================================================
+XSS Scanner - 저장된 XSS 패턴 매처 (stored_xss.py)
+================================================================================
+
+STORED_XSS_PATTERNS / 테이블 패턴을 문서 한 번 스캔으로 검사합니다. (Requests 엔진)
+
+- 리터럴 사전 필터: 패턴마다 반드시 포함되어야 하는 소문자 문자열(on, javascript,
+  <script, xss 등)이 문서에 없으면 그 패턴은 검사하지 않고, 리터럴의 마지막 등장
+  위치 이후에서는 그 패턴의 매치를 시도하지 않음
+- 남은 패턴의 시작 리터럴(<script, <img, href 등)을 하나의 alternation 으로 미리
+  컴파일 (활성 조합별 캐시)하여 후보 위치를 한 번의 스캔으로 찾고, 후보 위치에서만
+  각 패턴을 고정 위치 매치
+- 패턴별 결과는 기존 finditer 와 같음 (같은 패턴의 매치는 겹치지 않음)
+- 안전한 외부 스크립트(CDN)는 re.sub 로 치환하지 않고 구간으로 제외
+
+선형 시간 (ReDoS 방지):
+- re2 가 설치되어 있으면 (pip install google-re2) re2 로 컴파일 (선형 시간 보장)
+  re2 가 지원하지 않는 구문(전방탐색 등)을 쓰는 패턴만 표준 re 사용
+- 표준 re 에서는 반복 길이에 상한을 두고 (태그 MAX_TAG_LENGTH, 스크립트/셀 본문
+  MAX_SPAN), 셀/목록 패턴의 지연 반복 연쇄는 원자적으로 매치하여 (전방탐색 +
+  역참조) 시작 위치당 작업량을 제한
+- 페이지별 시간 예산(budget)을 넘기면 그때까지의 결과와 함께 partial 로 보고
+
+사용법:
+    from stored_xss import STORED_XSS_MATCHER
+
+    for match in STORED_XSS_MATCHER.find(html):
+        print(match.name, match.start, match.text[:50])
+
+    report = STORED_XSS_MATCHER.scan(html, budget=2.0)
+    if report.partial:
+        print("시간 예산 초과 - 일부만 분석")
+
+    # 보고용 결과 (프로세스 풀에서 실행 가능)
+    findings, partial = analyze_document(html, budget=2.0)
+================================================================================
+"""
+
+import re
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from line_index import LineIndex
+
+try:
+    import re2  # 선택 의존성: 선형 시간 정규식 (pip install google-re2)
+except ImportError:
+    re2 = None
+
+
+# ==============================================================================
+# 패턴 데이터
+# ==============================================================================
+
+STORED_XSS_PATTERNS = [
+    (r'<script[^>]*>[\s\S]*?alert\s*\(', 'alert() 스크립트'),
+    (r'<script[^>]*>[\s\S]*?console\s*\.\s*log\s*\(', 'console.log() 스크립트'),
+    (r'<script[^>]*>[\s\S]*?document\s*\.\s*cookie', '쿠키 접근 스크립트'),
+    (r'<script[^>]*>[\s\S]*?document\s*\.\s*location', '리다이렉트 스크립트'),
+    (r'<script[^>]*>[\s\S]*?document\s*\.\s*write', 'document.write() 스크립트'),
+    (r'<script[^>]*>[\s\S]*?eval\s*\(', 'eval() 스크립트'),
+    (r'<script[^>]*>[\s\S]*?window\s*\.\s*location', 'window.location 스크립트'),
+    (r'<img[^>]*\sonerror\s*=', 'img onerror XSS'),
+    (r'<img[^>]*\sonload\s*=', 'img onload XSS'),
+    (r'<svg[^>]*\sonload\s*=', 'svg onload XSS'),
+    (r'<body[^>]*\sonload\s*=', 'body onload XSS'),
+    (r'<input[^>]*\sonfocus\s*=', 'input onfocus XSS'),
+    (r'<[a-z]+[^>]*\sonerror\s*=', 'onerror 이벤트'),
+    (r'<[a-z]+[^>]*\sonload\s*=', 'onload 이벤트'),
+    (r'<[a-z]+[^>]*\sonclick\s*=', 'onclick 이벤트'),
+    (r'<[a-z]+[^>]*\sonmouseover\s*=', 'onmouseover 이벤트'),
+    (r'href\s*=\s*["\']?\s*javascript\s*:', 'javascript: href'),
+    (r'src\s*=\s*["\']?\s*javascript\s*:', 'javascript: src'),
+    (r'<iframe[^>]*\ssrc\s*=\s*["\']?(?!https?://)', '의심스러운 iframe'),
+    (r'XSS[_\-]?(ATTACK|TEST|PAYLOAD|SUCCESS)', 'XSS 테스트 흔적'),
+    (r'<img[^>]*src\s*=\s*["\']?[x1#]["\']?[^>]*onerror', '깨진 이미지 XSS'),
+]
+
+# 셀/목록 단위 패턴 (안전한 스크립트 제외 없이 원본 HTML 대상)
+# 스크립트/onerror 는 그 셀(목록 항목)이 끝나기 전에 시작해야 함
+# (닫는 태그 또는 다음 셀/항목의 여는 태그에서 끝남 - HTML 에서 </td>, </li> 는 생략 가능)
+TABLE_XSS_PATTERNS = [
+    (r'<t[dh][^>]*>(?:(?!</?t[dh][\s>/]).)*?<script.*?</script>.*?</t[dh]>', '테이블 셀 내 스크립트'),
+    (r'<t[dh][^>]*>(?:(?!</?t[dh][\s>/]).)*?onerror\s*=.*?</t[dh]>', '테이블 셀 내 onerror'),
+    (r'<li[^>]*>(?:(?!</?li[\s>/]).)*?<script.*?</script>.*?</li>', '리스트 내 스크립트'),
+]
+
+SAFE_SCRIPT_PATTERNS = [
+    r'<script[^>]+src\s*=\s*["\']https?://cdn\.cloudflare\.com',
+    r'<script[^>]+src\s*=\s*["\']https?://cdnjs\.cloudflare\.com',
+    r'<script[^>]+src\s*=\s*["\']https?://code\.jquery\.com',
+    r'<script[^>]+src\s*=\s*["\']https?://unpkg\.com',
+    r'<script[^>]+src\s*=\s*["\']https?://cdn\.jsdelivr\.net',
+]
+
+# 패턴 이름 -> 문서(casefold)에 모두 있어야 매치 가능한 리터럴
+PATTERN_LITERALS: Dict[str, Tuple[str, ...]] = {
+    'alert() 스크립트': ('<script', 'alert'),
+    'console.log() 스크립트': ('<script', 'console', 'log'),
+    '쿠키 접근 스크립트': ('<script', 'document', 'cookie'),
+    '리다이렉트 스크립트': ('<script', 'document', 'location'),
+    'document.write() 스크립트': ('<script', 'document', 'write'),
+    'eval() 스크립트': ('<script', 'eval'),
+    'window.location 스크립트': ('<script', 'window', 'location'),
+    'img onerror XSS': ('<img', 'onerror'),
+    'img onload XSS': ('<img', 'onload'),
+    'svg onload XSS': ('<svg', 'onload'),
+    'body onload XSS': ('<body', 'onload'),
+    'input onfocus XSS': ('<input', 'onfocus'),
+    'onerror 이벤트': ('onerror',),
+    'onload 이벤트': ('onload',),
+    'onclick 이벤트': ('onclick',),
+    'onmouseover 이벤트': ('onmouseover',),
+    'javascript: href': ('href', 'javascript'),
+    'javascript: src': ('src', 'javascript'),
+    '의심스러운 iframe': ('<iframe', 'src'),
+    'XSS 테스트 흔적': ('xss',),
+    '깨진 이미지 XSS': ('<img', 'src', 'onerror'),
+    '테이블 셀 내 스크립트': ('<t', '<script', '</script>', '</t'),
+    '테이블 셀 내 onerror': ('<t', 'onerror', '</t'),
+    '리스트 내 스크립트': ('<li', '<script', '</script>', '</li>'),
+}
+
+FLAGS = re.IGNORECASE | re.DOTALL
+
+MAX_TAG_LENGTH = 1000       # 표준 re: 태그 속성 부분([^>]*) 최대 길이
+MAX_SPAN = 5000             # 표준 re: 스크립트/셀 본문(.*?) 최대 길이
+ANALYSIS_BUDGET = 2.0       # 페이지당 분석 시간 예산 기본값 (초)
+DEADLINE_CHECK = 64         # 시간 예산 확인 간격 (후보 위치 수)
+
+
+def linear_source(source: str, table: bool = False) -> str:
+    r"""
+    표준 re 용 패턴 변환 - 시작 위치당 작업량이 상한을 넘지 않도록 함
+
+    - [^>]* / [^>]+ / [a-z]+ / \s* -> 최대 MAX_TAG_LENGTH, [\s\S]*? / .*? -> 최대 MAX_SPAN
+    - 셀/목록 패턴(head, 지연 반복 + A, 지연 반복 + B, ...)은 마지막을 제외한 구간을
+      원자적으로 매치 (?=(?P<a0>.{0,N}?A))(?P=a0)
+      첫 A 이후에서 실패하면 뒤의 A 에서도 실패하므로 결과는 같고 백트래킹만 사라짐
+    """
+    source = (source.replace('[^>]*', '[^>]{0,%d}' % MAX_TAG_LENGTH)
+              .replace('[^>]+', '[^>]{1,%d}' % MAX_TAG_LENGTH)
+              .replace('[a-z]+', '[a-z]{1,%d}' % MAX_TAG_LENGTH)
+              .replace(r'\s*', r'\s{0,%d}' % MAX_TAG_LENGTH)
+              .replace(r'[\s\S]*?', r'[\s\S]{0,%d}?' % MAX_SPAN))
+    parts = _LAZY_RE.split(source)  # [head, 반복0, 조각0, 반복1, 조각1, ...]
+    bound = '{0,%d}?' % MAX_SPAN
+    segments = [(lazy[:-2] + bound, piece) for lazy, piece in zip(parts[1::2], parts[2::2])]
+    if not table or len(segments) < 2:
+        return parts[0] + ''.join(lazy + piece for lazy, piece in segments)
+    atomic = ''.join(f'(?=(?P<a{k}>{lazy}{piece}))(?P=a{k})' for k, (lazy, piece) in enumerate(segments[:-1]))
+    return parts[0] + atomic + segments[-1][0] + segments[-1][1]
+
+
+# 지연 반복: .*? 또는 (?:(?!닫는 태그).)*?
+_LAZY_RE = re.compile(r'(\.\*\?|\(\?:\(\?!.+?\)\.\)\*\?)')
+
+
+def max_width(source: str) -> Optional[int]:
+    """
+    반복 상한을 둔 패턴의 최대 매치 길이 (넉넉한 추정), 상한 없는 반복이 있으면 None
+
+    매치 안의 리터럴은 시작 위치에서 이 거리 안에 있어야 하므로, 리터럴이 그보다
+    멀리 있는 후보 위치는 매치를 시도하지 않아도 됨
+    """
+    if re.search(r'(?<!\\)[*+]', source):
+        return None
+    return len(source) + sum(int(upper) for upper in re.findall(r'\{\d+,(\d+)\}', source))
+
+
+def leading_literal(source: str) -> str:
+    """패턴이 항상 시작하는 리터럴 (후보 위치 탐색용, 소문자)"""
+    literal = re.match(r'[^\\\[\](){}.*+?|^$]*', source).group(0)
+    if literal and source[len(literal):len(literal) + 1] in ('*', '?', '{'):
+        literal = literal[:-1]  # 반복 대상인 마지막 문자는 생략 가능
+    return (literal or source[:1]).lower()
+
+
+def compile_pattern(source: str, table: bool = False, use_re2: bool = True):
+    """
+    re2 로 컴파일 (가능하면), 아니면 반복 상한을 둔 표준 re
+
+    Returns:
+        (정규식, 백엔드 이름, 최대 매치 길이 또는 None)
+    """
+    if use_re2 and re2 is not None:
+        try:
+            return re2.compile('(?is)' + source), 're2', None
+        except Exception:
+            pass  # re2 미지원 구문 (전방탐색 등)
+    linear = linear_source(source, table)
+    return re.compile(linear, FLAGS), 're', max_width(linear)
+
+
+class StoredMatch(NamedTuple):
+    """패턴 매치 하나"""
+    name: str
+    start: int
+    end: int
+    text: str
+    table: bool  # 셀/목록 단위 패턴 여부
+
+
+class StoredScan(NamedTuple):
+    """문서 하나의 검사 결과"""
+    matches: List[StoredMatch]
+    partial: bool  # 시간 예산 초과로 문서 일부만 검사
+    ends: Dict[str, int] = {}  # 패턴 이름 -> 마지막 매치 끝 (창 단위 분석에서 다음 창으로 넘김)
+
+
+class _Pattern(NamedTuple):
+    name: str
+    regex: 're.Pattern'
+    literals: Tuple[str, ...]
+    table: bool
+    prefix: str
+    backend: str
+    reach: Optional[int]  # 최대 매치 길이 (re2 는 None)
+
+
+# ==============================================================================
+# 매처
+# ==============================================================================
+
+class StoredXSSMatcher:
+    """저장된 XSS 패턴 전체를 한 번의 스캔으로 검사"""
+
+    def __init__(self, patterns=STORED_XSS_PATTERNS, table_patterns=TABLE_XSS_PATTERNS,
+                 safe_patterns=SAFE_SCRIPT_PATTERNS, literals=PATTERN_LITERALS, use_re2: bool = True):
+        self.patterns: List[_Pattern] = []
+        for table, group in ((False, patterns), (True, table_patterns)):
+            for pattern, name in group:
+                regex, backend, reach = compile_pattern(pattern, table, use_re2)
+                self.patterns.append(_Pattern(name, regex, tuple(literals.get(name, ())), table,
+                                              leading_literal(pattern), backend, reach))
+        self.backend = 're2' if any(p.backend == 're2' for p in self.patterns) else 're'
+        self.safe_re = re.compile(linear_source('|'.join(f'(?:{p})' for p in safe_patterns)), re.IGNORECASE)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _candidate_re(prefixes: Tuple[str, ...]) -> 're.Pattern':
+        """활성 패턴 시작 리터럴의 alternation (후보 위치 탐색용, 백트래킹 없음, 긴 리터럴 우선)"""
+        return re.compile('(?=(%s))' % '|'.join(re.escape(p) for p in prefixes), re.IGNORECASE)
+
+    def start_limits(self, html: str) -> Dict[int, int]:
+        """
+        리터럴 사전 필터: 패턴 인덱스 -> 매치가 시작될 수 있는 마지막 위치
+
+        매치에는 패턴의 리터럴이 모두 포함되므로, 각 리터럴의 마지막 등장 위치보다
+        뒤에서는 시작할 수 없음. 리터럴이 하나라도 없는 패턴은 제외
+        """
+        lowered = html.casefold()  # IGNORECASE 와 같은 대소문자 규칙 (길이는 늘어날 수만 있음)
+        last_seen: Dict[str, int] = {}
+        limits = {}
+        for i, pattern in enumerate(self.patterns):
+            limit = len(html)
+            for literal in pattern.literals:
+                idx = last_seen.get(literal)
+                if idx is None:
+                    idx = last_seen[literal] = lowered.rfind(literal)
+                if idx < 0:
+                    break
+                limit = min(limit, idx)
+            else:
+                limits[i] = limit
+        return limits
+
+    def literal_positions(self, html: str, limits: Dict[int, int]) -> Dict[int, Tuple[List[int], int]]:
+        """
+        패턴 인덱스 -> (가장 드문 리터럴의 등장 위치 목록, 최대 매치 길이)
+
+        최대 매치 길이가 정해진 패턴만 (표준 re). 후보 위치에서 그 거리 안에
+        리터럴이 없으면 매치를 시도하지 않음 (긴 적대적 페이지에서 시작 위치마다
+        상한까지 스캔하는 것을 방지)
+        """
+        found: Dict[str, List[int]] = {}
+        checks = {}
+        for i in limits:
+            pattern = self.patterns[i]
+            if pattern.reach is None or not pattern.literals:
+                continue
+            for literal in pattern.literals:
+                if literal not in found:
+                    found[literal] = [m.start() for m in
+                                      re.finditer('(?=%s)' % re.escape(literal), html, re.IGNORECASE)]
+            rarest = min(pattern.literals, key=lambda literal: len(found[literal]))
+            checks[i] = (found[rarest], pattern.reach)
+        return checks
+
+    def safe_spans(self, html: str) -> List[Tuple[int, int]]:
+        return [m.span() for m in self.safe_re.finditer(html)]
+
+    def find(self, html: str) -> List[StoredMatch]:
+        """모든 패턴의 매치 (시간 예산 없음)"""
+        return self.scan(html).matches
+
+    def scan(self, html: str, budget: Optional[float] = None, begin: int = 0, stop: Optional[int] = None,
+             carry: Optional[Dict[str, int]] = None) -> StoredScan:
+        """
+        모든 패턴의 매치 (패턴 목록 순서 -> 위치 순서)
+
+        각 패턴의 결과는 re.finditer(pattern, html) 와 같고, 안전한 외부 스크립트
+        구간에서 시작하는 매치는 없는 것으로, 그 구간을 포함하는 매치는 건너뜀으로 처리.
+        budget(초)을 넘기면 그 위치까지의 매치와 partial=True 반환
+
+        창 단위 분석용: 매치는 [begin, stop) 에서만 시작하고, carry(패턴 이름 -> 앞 창의
+        마지막 매치 끝)보다 앞에서는 시작하지 않음 (finditer 상태를 이어서 검사)
+        """
+        deadline = None if budget is None else time.monotonic() + budget
+        limits = self.start_limits(html)
+        if not limits:
+            return StoredScan([], False)
+        safe = self.safe_spans(html)
+
+        per_pattern: Dict[int, List[StoredMatch]] = {i: [] for i in limits}
+        carry = carry or {}
+        last_end = {i: max(begin, carry.get(self.patterns[i].name, 0)) for i in limits}
+        horizon = max(limits.values())
+        if stop is not None:
+            horizon = min(horizon, stop - 1)
+        prefixes = {self.patterns[i].prefix for i in limits}
+        # 찾은 시작 리터럴 -> 그 위치에서 시작할 수 있는 패턴 (예: '<script' -> <script 패턴들 + '<' 패턴들)
+        by_head: Dict[str, List[int]] = {}
+        reach_checks = self.literal_positions(html, limits)
+        partial = False
+        for checked, candidate in enumerate(self._candidate_re(tuple(sorted(prefixes, key=len, reverse=True)))
+                                            .finditer(html, min(last_end.values()))):
+            start = candidate.start()
+            if start > horizon:
+                break
+            if deadline is not None and checked % DEADLINE_CHECK == 0 and time.monotonic() > deadline:
+                partial = True
+                break
+            head = candidate.group(1).lower()
+            indices = by_head.get(head)
+            if indices is None:
+                indices = by_head[head] = [i for i in limits if head.startswith(self.patterns[i].prefix)]
+
+            # 후보 위치에서 시작 가능한 패턴을 모두 고정 위치로 검사 (패턴 간 겹침 허용)
+            for i in indices:
+                if not last_end[i] <= start <= limits[i]:
+                    continue
+                check = reach_checks.get(i)
+                if check is not None:
+                    positions, reach = check
+                    k = bisect_left(positions, start)
+                    if k == len(positions) or positions[k] > start + reach:
+                        continue  # 리터럴이 매치 가능한 거리 밖
+                pattern = self.patterns[i]
+                m = pattern.regex.match(html, start)
+                if m is None:
+                    continue
+                if not pattern.table and safe:
+                    if any(s <= start < e for s, e in safe):
+                        continue  # 치환되어 사라진 구간에서 시작
+                    last_end[i] = m.end()
+                    if any(start < s < m.end() for s, e in safe):
+                        continue  # 안전한 스크립트를 포함하는 매치
+                else:
+                    last_end[i] = m.end()
+                per_pattern[i].append(StoredMatch(pattern.name, start, m.end(), m.group(0), pattern.table))
+
+        return StoredScan([match for i in limits for match in per_pattern[i]], partial,
+                          {self.patterns[i].name: end for i, end in last_end.items()})
+
+
+STORED_XSS_MATCHER = StoredXSSMatcher()
+
+
+DISPLAY_LENGTH = 100        # 보고용 매치 내용 최대 길이
+
+
+def analyze_document(html: str, budget: Optional[float] = None) -> Tuple[List[Tuple[str, str, int]], bool]:
+    """
+    문서 하나의 보고용 결과 -> ([(패턴 이름, 매치 내용, 줄 번호), ...], partial)
+
+    같은 내용은 한 번만 보고. 프로세스 풀에서 실행할 수 있도록 모듈 수준 함수이며
+    인자와 결과는 모두 피클 가능
+    """
+    report = STORED_XSS_MATCHER.scan(html, budget=budget)
+    lines = LineIndex(html)
+    findings = []
+    seen = set()
+    for match in report.matches:
+        text = match.text
+        display = text[:DISPLAY_LENGTH] + '...' if len(text) > DISPLAY_LENGTH else text
+        if display not in seen:
+            seen.add(display)
+            findings.append((match.name, display, lines.line_of(match.start)))
+    return findings, report.partial
@@ -0,0 +1,190 @@
+"""
+================================================================================
+XSS Scanner - 큰 페이지 창 단위 분석 (stream_analysis.py)
+================================================================================
+
+수 MB 짜리 관리자 보고서 페이지처럼 큰 본문을 겹치는 창(window) 단위로 나누어
+저장된 XSS 패턴을 검사합니다. (Requests 엔진)
+
+- 본문 캐시가 디스크에 보관한 파일은 mmap 으로 열어 창 크기만큼만 디코딩
+  (본문 전체를 문자열로 만들지 않음)
+- 이미 문자열로 받은 본문은 창 크기만큼 잘라서 검사
+- 창은 가장 긴 매치 길이(패턴 반복 상한)만큼 다음 구간과 겹치므로 창 경계에서
+  잘리는 매치가 없음. 매치는 시작 위치가 속한 창에서만 찾고, 패턴별 마지막 매치
+  끝을 다음 창으로 넘겨 문서 전체를 한 번에 검사한 것과 같은 결과
+- 창 앞에 LOOKBEHIND 만큼 앞 구간을 붙여 경계에 걸친 안전한 스크립트 태그도 제외
+- 줄 번호는 앞 창들의 줄바꿈 수 + 창 안의 줄 번호 색인
+- 최대 메모리: 창 크기 + 겹침 구간 (페이지 크기와 무관)
+
+사용법:
+    from stream_analysis import analyze_file, analyze_text
+
+    findings, partial = analyze_file(path, budget=2.0)   # UTF-8 파일 (mmap)
+    findings, partial = analyze_text(html, budget=2.0)   # 이미 받은 문자열
+
+    # 본문 캐시에서 넘겨받은 파일 (분석 후 삭제, 프로세스 풀에서 실행 가능)
+    findings, partial = analyze_body_file(BodyFile(cache.take_file(url, STREAM_THRESHOLD)), 2.0)
+================================================================================
+"""
+
+import mmap
+import os
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from line_index import LineIndex
+from stored_xss import STORED_XSS_MATCHER, DISPLAY_LENGTH, MAX_SPAN, MAX_TAG_LENGTH
+
+
+CHUNK_SIZE = 1024 * 1024                # 창 하나가 맡는 구간 (바이트 또는 문자)
+LOOKBEHIND = MAX_TAG_LENGTH + 100       # 앞 구간에서 시작해 이어지는 안전한 스크립트 태그를 찾기 위한 앞부분 (문자)
+STREAM_THRESHOLD = 4 * 1024 * 1024      # 이보다 큰 본문은 창 단위로 분석 (바이트 또는 문자)
+
+
+class BodyFile(NamedTuple):
+    """본문 캐시에서 넘겨받은 본문 파일 (UTF-8, 분석 후 삭제)"""
+    path: str
+
+
+def window_overlap(matcher=STORED_XSS_MATCHER) -> int:
+    """창 겹침 길이 (문자) - 가장 긴 매치 길이, 상한 없는 패턴(re2)이 있으면 MAX_SPAN 의 4배"""
+    reaches = [p.reach for p in matcher.patterns]
+    if None in reaches:
+        return 4 * MAX_SPAN
+    return max(reaches)
+
+
+# ==============================================================================
+# 창 나누기
+# ==============================================================================
+
+def _char_boundary(buffer, pos: int) -> int:
+    """pos 이하의 가장 가까운 UTF-8 문자 시작 위치"""
+    while 0 < pos < len(buffer) and (buffer[pos] & 0xC0) == 0x80:
+        pos -= 1
+    return pos
+
+
+def iter_byte_windows(buffer, chunk_size: int = CHUNK_SIZE,
+                      overlap: Optional[int] = None) -> Iterator[Tuple[str, int, int]]:
+    """
+    UTF-8 바이트 버퍼(bytes/memoryview/mmap) -> (창 문자열, 맡은 구간 시작, 맡은 구간 끝)
+
+    창 문자열 = 앞부분(LOOKBEHIND 문자 이상) + 맡은 구간 + 겹침(overlap 문자 이상),
+    구간 위치는 창 문자열 안의 문자 위치
+    """
+    overlap = window_overlap() if overlap is None else overlap
+    view = memoryview(buffer)
+    size = len(view)
+    start = 0
+    try:
+        while start < size:
+            owned_end = _char_boundary(view, min(start + max(1, chunk_size), size))
+            if owned_end <= start:  # 청크 크기가 문자 하나보다 작음
+                owned_end = start + 1
+                while owned_end < size and (view[owned_end] & 0xC0) == 0x80:
+                    owned_end += 1
+            # 문자 하나는 최대 4바이트이므로 4배를 읽으면 필요한 문자 수 이상
+            window_start = _char_boundary(view, max(0, start - 4 * LOOKBEHIND))
+            window_end = _char_boundary(view, min(owned_end + 4 * overlap, size))
+            parts = [view[a:b].tobytes().decode('utf-8', errors='replace')
+                     for a, b in ((window_start, start), (start, owned_end), (owned_end, window_end))]
+            begin = len(parts[0])
+            yield ''.join(parts), begin, begin + len(parts[1])
+            start = owned_end
+    finally:
+        view.release()
+
+
+def iter_text_windows(text: str, chunk_size: int = CHUNK_SIZE,
+                      overlap: Optional[int] = None) -> Iterator[Tuple[str, int, int]]:
+    """문자열 -> (창 문자열, 맡은 구간 시작, 맡은 구간 끝)"""
+    overlap = window_overlap() if overlap is None else overlap
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(text), chunk_size):
+        window_start = max(0, start - LOOKBEHIND)
+        begin = start - window_start
+        yield (text[window_start:start + chunk_size + overlap], begin,
+               begin + min(chunk_size, len(text) - start))
+
+
+# ==============================================================================
+# 분석
+# ==============================================================================
+
+def analyze_windows(windows: Iterator[Tuple[str, int, int]],
+                    budget: Optional[float] = None) -> Tuple[List[Tuple[str, str, int]], bool]:
+    """
+    창 목록 분석 -> analyze_document 와 같은 형식 ([(이름, 내용, 줄)], partial)
+
+    패턴별 마지막 매치 끝을 다음 창으로 넘기므로 같은 패턴의 매치는 겹치지 않고,
+    같은 내용은 한 번만 보고 (문서 전체 분석과 같은 순서: 패턴 목록 순서 -> 위치 순서)
+    """
+    deadline = None if budget is None else time.monotonic() + budget
+    order = {pattern.name: i for i, pattern in enumerate(STORED_XSS_MATCHER.patterns)}
+    first: Dict[str, Tuple[int, int, str, int]] = {}  # 내용 -> (패턴 순서, 위치, 이름, 줄)
+    ends: Dict[str, int] = {}   # 패턴 이름 -> 마지막 매치 끝 (문서 내 문자 위치)
+    offset = 0                  # 맡은 구간 시작의 문서 내 문자 위치
+    lines_before = 0            # 맡은 구간 앞의 줄바꿈 수
+    for window, begin, stop in windows:
+        base = offset - begin   # 창 시작의 문서 내 문자 위치
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        carry = {name: end - base for name, end in ends.items() if end > offset}
+        report = STORED_XSS_MATCHER.scan(window, budget=remaining, begin=begin, stop=stop, carry=carry)
+        lines = None
+        for match in report.matches:
+            text = match.text
+            display = text[:DISPLAY_LENGTH] + '...' if len(text) > DISPLAY_LENGTH else text
+            key = (order[match.name], base + match.start)
+            known = first.get(display)
+            if known is None or key < known[:2]:
+                lines = lines or LineIndex(window)
+                line = lines_before + lines.line_of(match.start) - lines.line_of(begin) + 1
+                first[display] = (*key, match.name, line)
+        if report.partial:
+            return _ordered(first), True
+        for name, end in report.ends.items():
+            ends[name] = max(ends.get(name, 0), base + end)
+        lines_before += window.count('\n', begin, stop)
+        offset += stop - begin
+    return _ordered(first), False
+
+
+def _ordered(first: Dict[str, Tuple[int, int, str, int]]) -> List[Tuple[str, str, int]]:
+    ranked = sorted(first.items(), key=lambda item: item[1][:2])
+    return [(name, display, line) for display, (_order, _start, name, line) in ranked]
+
+
+def analyze_text(html: str, budget: Optional[float] = None,
+                 chunk_size: int = CHUNK_SIZE) -> Tuple[List[Tuple[str, str, int]], bool]:
+    """이미 받은 문자열을 창 단위로 분석"""
+    return analyze_windows(iter_text_windows(html, chunk_size), budget)
+
+
+def analyze_file(path: str, budget: Optional[float] = None,
+                 chunk_size: int = CHUNK_SIZE) -> Tuple[List[Tuple[str, str, int]], bool]:
+    """
+    UTF-8 파일을 mmap 으로 열어 창 단위로 분석
+
+    프로세스 풀에서 실행할 수 있도록 모듈 수준 함수 (본문 대신 경로만 전달)
+    """
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return [], False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            windows = iter_byte_windows(mapped, chunk_size)
+            try:
+                return analyze_windows(windows, budget)
+            finally:
+                windows.close()  # mmap 을 닫기 전에 memoryview 해제
+
+
+def analyze_body_file(body: BodyFile, budget: Optional[float] = None) -> Tuple[List[Tuple[str, str, int]], bool]:
+    """본문 파일을 창 단위로 분석하고 삭제"""
+    try:
+        return analyze_file(body.path, budget)
+    finally:
+        try:
+            os.remove(body.path)
+        except OSError:
+            pass
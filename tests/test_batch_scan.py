@@ -0,0 +1,166 @@
+"""
+================================================================================
+XSS Scanner - 배치 스캔 테스트 (test_batch_scan.py)
+================================================================================
+
+batch_scan.py의 대상 파일 파싱, 호스트별 라운드로빈 스케줄링, 대상별 단계 오류 처리를
+테스트합니다.
+(네트워크 사용 안 함)
+
+실행:
+    python -m pytest tests/test_batch_scan.py -v
+    python tests/test_batch_scan.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch_scan
+from batch_scan import BatchScanner, HostScheduler, load_targets
+
+
+class TestLoadTargets(unittest.TestCase):
+    """대상 파일 파싱 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_comments_and_duplicates(self):
+        """빈 줄/주석 무시, 중복 제거, 순서 유지"""
+        path = os.path.join(self.tmp_dir, 'targets.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("# 대상 목록\nhttp://a.com\n\nhttp://b.com  # 스테이징\nhttp://a.com\n")
+        self.assertEqual(load_targets(path), ['http://a.com', 'http://b.com'])
+
+
+class TestHostScheduler(unittest.TestCase):
+    """라운드로빈 스케줄러 테스트"""
+
+    def _run(self, scheduler, workers):
+        threads = [threading.Thread(target=scheduler.run_worker) for _ in range(workers)]
+        for t in threads: t.start()
+        for t in threads: t.join(timeout=5)
+        self.assertFalse(any(t.is_alive() for t in threads))
+
+    def test_round_robin(self):
+        """한 호스트의 작업이 많아도 다른 호스트가 번갈아 실행됨"""
+        order = []
+        scheduler = HostScheduler(per_host=1)
+        for i in range(5):
+            scheduler.submit('slow', lambda i=i: order.append(('slow', i)))
+        scheduler.submit('fast', lambda: order.append(('fast', 0)))
+        self._run(scheduler, workers=1)
+        self.assertEqual(len(order), 6)
+        self.assertLessEqual(order.index(('fast', 0)), 1)
+
+    def test_per_host_limit(self):
+        """호스트당 동시 실행 수 제한"""
+        lock = threading.Lock()
+        active = {'a': 0, 'b': 0}
+        peak = {'a': 0, 'b': 0}
+
+        def job(host):
+            def run():
+                with lock:
+                    active[host] += 1
+                    peak[host] = max(peak[host], active[host])
+                time.sleep(0.01)
+                with lock:
+                    active[host] -= 1
+            return run
+
+        scheduler = HostScheduler(per_host=2)
+        for _ in range(10):
+            scheduler.submit('a', job('a'))
+            scheduler.submit('b', job('b'))
+        self._run(scheduler, workers=8)
+        self.assertLessEqual(peak['a'], 2)
+        self.assertLessEqual(peak['b'], 2)
+
+    def test_jobs_can_submit_jobs(self):
+        """실행 중인 작업이 후속 작업을 추가해도 모두 처리 후 종료"""
+        done = []
+        scheduler = HostScheduler(per_host=4)
+
+        def crawl():
+            for i in range(3):
+                scheduler.submit('a', lambda i=i: done.append(i))
+
+        scheduler.submit('a', crawl)
+        self._run(scheduler, workers=4)
+        self.assertEqual(sorted(done), [0, 1, 2])
+
+    def test_failing_job_does_not_stall(self):
+        """예외가 난 작업도 완료로 처리"""
+        done = []
+        scheduler = HostScheduler(per_host=1)
+        scheduler.submit('a', lambda: 1 / 0)
+        scheduler.submit('a', lambda: done.append(1))
+        self._run(scheduler, workers=2)
+        self.assertEqual(done, [1])
+
+
+class FakeCrawler(batch_scan.SiteCrawler):
+    """SiteCrawler 대역 - 'broken' 호스트는 크롤링 오류"""
+
+    def __init__(self, base_url, **kwargs):
+        self.base_url = base_url
+
+    def crawl(self):
+        if 'broken' in self.base_url:
+            raise RuntimeError("DNS 실패")
+        return []
+
+    def stop(self):
+        pass
+
+
+class TestBatchScanner(unittest.TestCase):
+    """배치 스캐너 단계 처리 테스트"""
+
+    def test_phase_error_finishes_target(self):
+        """크롤링/분석 단계에서 예외가 나면 대상은 오류와 함께 완료"""
+        with mock.patch.object(batch_scan, 'SiteCrawler', FakeCrawler):
+            batch = BatchScanner(['http://ok.test', 'http://broken.test'], workers=2)
+            results = batch.run()
+        ok, broken = results['http://ok.test'], results['http://broken.test']
+        self.assertTrue(ok.finished and broken.finished)
+        self.assertEqual(ok.error, '')
+        self.assertIn('DNS 실패', broken.error)
+        self.assertIn('error', broken.summary())
+        self.assertEqual(batch._finished_targets, 2)
+
+    def test_content_phase_single_thread(self):
+        """저장된 XSS 분석은 워커 안에서 실행 (대상마다 스레드 풀을 만들지 않음)"""
+        created = []
+
+        class RecordingScanner(batch_scan.XSSScanner):
+            def __init__(self, **kwargs):
+                created.append(kwargs)
+                super().__init__(**kwargs)
+
+            def scan_page_content(self, pages):
+                raise ValueError("분석 실패")
+
+        with mock.patch.object(batch_scan, 'SiteCrawler', FakeCrawler), \
+                mock.patch.object(batch_scan, 'XSSScanner', RecordingScanner):
+            results = BatchScanner(['http://ok.test'], workers=4, per_host=8).run()
+        self.assertEqual([(kw['threads'], kw['analysis_workers']) for kw in created], [(1, 1)])
+        self.assertIn('분석 실패', results['http://ok.test'].error)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,115 @@
+"""
+================================================================================
+XSS Scanner - 템플릿 블록 분석 캐시 테스트 (test_block_memo.py)
+================================================================================
+
+block_memo.py의 블록 분할, 블록 해시 캐시, 문서 단위 분석과의 결과 동일성을
+테스트합니다.
+
+실행:
+    python -m pytest tests/test_block_memo.py -v
+    python tests/test_block_memo.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from block_memo import BlockMemo, split_blocks
+from stored_xss import analyze_document
+from xss_engine import XSSScanner, PageInfo
+
+
+HEADER = '<header><nav>' + ''.join(f'<a href="/m{i}" onclick="go({i})">메뉴</a>' for i in range(20)) + '</nav></header>\n'
+FOOTER = '<footer>' + '<p>copyright</p>\n' * 40 + '</footer>'
+
+
+def page(body: str, wrap: bool = True) -> str:
+    content = HEADER + f'<main>{body}' + '<p>본문</p>\n' * 40 + '</main>\n' + FOOTER
+    if wrap:
+        content = f'<div id="wrap">{content}</div>'
+    return f'<html><body>{content}</body></html>'
+
+
+class TestSplitBlocks(unittest.TestCase):
+    """블록 분할 테스트"""
+
+    def test_spans_cover_document(self):
+        """블록을 이어 붙이면 원문"""
+        for html in (page('a'), page('b', wrap=False), '', '<p>no blocks</p>', '</div></div>' + page('x')):
+            spans = split_blocks(html)
+            self.assertEqual(''.join(html[s:e] for s, e in spans), html)
+
+    def test_wrapper_children_split(self):
+        """전체를 감싸는 요소가 있으면 그 자식 단위로 분할"""
+        for wrap in (True, False):
+            html = page('x', wrap=wrap)
+            blocks = [html[s:e] for s, e in split_blocks(html, min_length=0)]
+            self.assertGreaterEqual(len(blocks), 3)
+            self.assertTrue(blocks[0].endswith('</header>'))
+
+    def test_script_contents_ignored(self):
+        """스크립트/주석 안의 태그 문자열은 깊이 계산에서 제외"""
+        html = '<div><script>var s = "</div><div>";</script><!-- </div> --></div>' + '<div>x</div>' * 3
+        spans = split_blocks(html, min_length=0)
+        self.assertTrue(html[spans[0][0]:spans[0][1]].endswith('--></div>'))
+
+
+class TestBlockMemo(unittest.TestCase):
+    """블록 캐시 테스트"""
+
+    def test_shared_blocks_hit(self):
+        """같은 헤더/푸터는 두 번째 페이지부터 캐시 적중"""
+        memo = BlockMemo()
+        memo.analyze(page('<p>1</p>'))
+        misses = memo.misses
+        memo.analyze(page('<p>2</p>'))
+        self.assertEqual(memo.misses, misses + 1)  # 본문 블록만 분석
+        self.assertGreaterEqual(memo.hits, 2)
+
+    def test_same_findings_as_document(self):
+        """템플릿 페이지의 결과가 문서 단위 분석과 같음 (줄 번호 포함)"""
+        memo = BlockMemo()
+        for i in range(10):
+            html = page(f'<img src=x onerror=alert({i})>\n' if i % 3 == 0 else '<p>ok</p>')
+            self.assertEqual(sorted(memo.analyze(html)[0]), sorted(analyze_document(html)[0]))
+
+    def test_partial_blocks_not_cached(self):
+        """시간 예산을 넘긴 블록은 캐시하지 않음"""
+        memo = BlockMemo()
+        html = page('<img src=x onerror=a()>' * 500)
+        findings, partial = memo.analyze(html, budget=0)
+        self.assertTrue(partial)
+        findings, partial = memo.analyze(html, budget=None)
+        self.assertFalse(partial)
+        self.assertIn('img onerror XSS', {name for name, _c, _l in findings})
+
+
+class TestScannerBlockMemo(unittest.TestCase):
+    """스캐너 연동 테스트"""
+
+    def test_shared_across_pages(self):
+        """스캔 전체에서 블록 캐시 공유, 공유 블록 결과는 색인에서 한 항목"""
+        scanner = XSSScanner(threads=1, analysis_workers=1)
+        pages = [PageInfo(f'http://a.com/p{i}') for i in range(5)]
+        for i, p in enumerate(pages):
+            scanner.transport.page_cache.put(p.url, page(f'<p>{i}</p>'))
+        scanner.scan_page_content(pages)
+        self.assertGreater(scanner.block_memo.hits, scanner.block_memo.misses)
+        finding = scanner.stored_index.get('onclick 이벤트', '<a href="/m0" onclick=')
+        self.assertEqual(finding.count, 5)
+
+    def test_disabled(self):
+        """block_memo=False 면 문서 단위 분석"""
+        scanner = XSSScanner(threads=1, block_memo=False)
+        self.assertIsNone(scanner.block_memo)
+        results = scanner.analyze_stored_xss('http://a.com/', page('<svg onload=x()>'))
+        self.assertIn('svg onload XSS', {r.pattern_name for r in results})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,346 @@
+"""
+================================================================================
+XSS Scanner - Selenium 브라우저 풀 테스트 (test_browser_pool.py)
+================================================================================
+
+xss_engine_selenium.py의 BrowserPool, 풀을 사용하는 병렬 반사형 스캔,
+단계 간 공유 브라우저 세션(BrowserSession)을 테스트합니다.
+(Chrome 없이 가짜 브라우저로 실행)
+
+실행:
+    python -m pytest tests/test_browser_pool.py -v
+    python tests/test_browser_pool.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import xss_engine_selenium
+    from xss_engine_selenium import (BrowserPool, BrowserSession, SeleniumXSSScanner, PageInfo, ScanResult,
+                                     default_browser_count, install_driver)
+    from scan_journal import ScanJournal
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+
+class FakeDriver:
+    """WebDriver 대역 (연 URL 만 기록)"""
+
+    def __init__(self):
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+
+class FakeBrowser:
+    """BrowserManager 대역 (start/close/쿠키만 기록)"""
+
+    fail = False
+
+    def __init__(self, headless=True, timeout=10, native_dialogs=False):
+        self.native_dialogs = native_dialogs
+        self.driver = None
+        self.closed = False
+        self.starts = 0
+        self.cookies = {}
+
+    def start(self):
+        if self.fail:
+            raise RuntimeError("Chrome 없음")
+        self.driver = FakeDriver()
+        self.closed = False
+        self.starts += 1
+        self.cookies = {}  # 새 브라우저 프로필
+        return self.driver
+
+    def add_cookies(self, cookies):
+        self.cookies.update(cookies)
+
+    def is_alive(self):
+        return self.driver is not None
+
+    def restart(self):
+        self.close()
+        return self.start()
+
+    def close(self):
+        self.driver = None
+        self.closed = True
+
+
+class FailingBrowser(FakeBrowser):
+    fail = True
+
+
+def page_with_params(count: int) -> PageInfo:
+    return PageInfo(url='http://a.com/search', params={f'q{i}': '' for i in range(count)})
+
+
+@unittest.skipUnless(SELENIUM_AVAILABLE, "selenium 미설치")
+class TestBrowserPool(unittest.TestCase):
+    """브라우저 풀 테스트"""
+
+    def test_start_and_lease(self):
+        """동시에 빌린 브라우저는 서로 다름"""
+        pool = BrowserPool(3, factory=FakeBrowser)
+        self.assertEqual(pool.start(), 3)
+        with pool.lease() as a, pool.lease() as b:
+            self.assertIsNot(a, b)
+        pool.close()
+        self.assertTrue(all(b.closed for b in pool.browsers))
+        self.assertIsNone(pool.acquire())
+
+    def test_partial_start_failure(self):
+        """시작에 실패한 브라우저는 빼고 사용, 모두 실패하면 예외"""
+        made = []
+
+        def factory(**kwargs):
+            browser = (FailingBrowser if len(made) % 2 else FakeBrowser)(**kwargs)
+            made.append(browser)
+            return browser
+
+        pool = BrowserPool(4, factory=factory)
+        self.assertEqual(pool.start(), 2)
+        with self.assertRaises(RuntimeError):
+            BrowserPool(2, factory=FailingBrowser).start()
+
+    def test_browsers_logged_in(self):
+        """쿠키가 있으면 새로 띄운 브라우저와 다시 시작한 브라우저 모두 대상 origin 에서 쿠키를 받음"""
+        pool = BrowserPool(3, factory=FakeBrowser, cookies={'sid': '1'}, origin='http://a.com')
+        pool.start()
+        for browser in pool.browsers:
+            self.assertEqual(browser.cookies, {'sid': '1'})
+            self.assertEqual(browser.driver.visited, ['http://a.com'])
+        browser = pool.browsers[0]
+        browser.driver = None  # 크래시
+        self.assertTrue(pool.revive(browser))
+        self.assertEqual(browser.cookies, {'sid': '1'})
+        self.assertEqual(browser.driver.visited, ['http://a.com'])
+        self.assertEqual(BrowserPool(1, factory=FakeBrowser).start(), 1)
+
+    def test_default_count_bounds(self):
+        """기본 브라우저 수는 1 ~ 상한"""
+        self.assertEqual(default_browser_count(limit=1), 1)
+        self.assertTrue(1 <= default_browser_count() <= 4)
+
+
+@unittest.skipUnless(SELENIUM_AVAILABLE, "selenium 미설치")
+class TestPooledScan(unittest.TestCase):
+    """풀을 사용하는 반사형 스캔 테스트"""
+
+    def make_scanner(self, browsers: int, delay: float = 0.05, callback=None):
+        scanner = SeleniumXSSScanner(browsers=browsers, callback=callback)
+        scanner.pool = BrowserPool(browsers, factory=FakeBrowser)
+        scanner.pool.start()
+        used = set()
+        lock = threading.Lock()
+
+        def inject(url, param, payload, method='get', form_data=None, browser=None):
+            with lock:
+                used.add(id(browser))
+            time.sleep(delay)
+            executed = param == 'q0' and 'XSS_TEST_1' in payload
+            return ScanResult(url, param, payload, reflected=not executed, vulnerable=executed, executed=executed)
+
+        scanner._inject_and_check = inject
+        return scanner, used
+
+    def test_tests_spread_over_browsers(self):
+        """모든 테스트가 여러 브라우저에서 실행되고 결과가 모두 집계됨"""
+        scanner, used = self.make_scanner(4)
+        started = time.time()
+        results = scanner.scan_pages([page_with_params(4)], quick_mode=True)
+        elapsed = time.time() - started
+        self.assertEqual(results.total, 28)
+        self.assertEqual(len(results.vulnerable), 1)
+        self.assertEqual(len(used), 4)
+        self.assertLess(elapsed, 28 * 0.05 * 0.75)
+        self.assertIsNone(scanner.pool)
+
+    def test_stop_discards_remaining(self):
+        """중단 후에는 결과를 더 기록하지 않음"""
+        reported = []
+
+        def callback(message, level, data=None):
+            if level == 'scan_result':
+                reported.append(data)
+                scanner.stop()
+
+        scanner, _ = self.make_scanner(2, callback=callback)
+        results = scanner.scan_pages([page_with_params(4)], quick_mode=True)
+        self.assertEqual(len(reported), 1)
+        self.assertLess(results.total, 28)
+
+    def test_resume_uses_recorded_tests(self):
+        """재개는 현재 빠른 스캔/Alert 모드 옵션과 관계없이 저널에 기록된 테스트 목록을 따름"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scan.jsonl')
+            scanner, _ = self.make_scanner(2, delay=0)
+            with ScanJournal(path) as journal:
+                scanner.scan_pages([page_with_params(4)], quick_mode=True, journal=journal)
+            scanner, used = self.make_scanner(2, delay=0)
+            scanner.alert_mode = True
+            with ScanJournal(path) as journal:
+                results = scanner.scan_pages([page_with_params(4)], quick_mode=False, journal=journal)
+        self.assertEqual(results.total, 28)
+        self.assertEqual(used, set())
+
+
+@unittest.skipUnless(SELENIUM_AVAILABLE, "selenium 미설치")
+class TestBrowserSession(unittest.TestCase):
+    """단계 간 공유 브라우저 세션 테스트"""
+
+    def test_reused_until_crash(self):
+        """살아 있으면 같은 브라우저, 크래시하면 다시 시작"""
+        session = BrowserSession(factory=FakeBrowser)
+        browser = session.ensure()
+        self.assertIs(session.ensure(), browser)
+        self.assertEqual((session.starts, session.restarts), (1, 0))
+        browser.driver = None  # 크래시
+        self.assertIs(session.ensure(), browser)
+        self.assertEqual((session.starts, session.restarts), (2, 1))
+        session.close()
+        self.assertTrue(browser.closed)
+
+    def test_pool_includes_main_browser(self):
+        """풀은 기본 브라우저를 포함하고 모자란 만큼만 시작"""
+        made = []
+
+        def factory(**kwargs):
+            made.append(FakeBrowser(**kwargs))
+            return made[-1]
+
+        with BrowserSession(factory=factory) as session:
+            main = session.ensure()
+            pool = session.pool(3)
+            self.assertIn(main, pool.browsers)
+            self.assertEqual(len(pool), 3)
+            self.assertEqual(len(made), 3)
+            self.assertIs(session.pool(3), pool)
+        self.assertTrue(all(b.closed for b in made))
+
+    def test_dialog_mode_reaches_every_browser(self):
+        """Alert 모드 세션은 기본 브라우저와 풀 브라우저 모두 대화상자를 그대로 띄움"""
+        with BrowserSession(factory=FakeBrowser, native_dialogs=True) as session:
+            pool = session.pool(2)
+            self.assertTrue(all(b.native_dialogs for b in pool.browsers))
+        scanner = SeleniumXSSScanner(alert_mode=True)
+        self.assertTrue(scanner.session.native_dialogs)
+
+    def test_scan_pool_gets_cookies(self):
+        """반사형 스캔 풀의 추가 브라우저도 스캐너 쿠키로 로그인 (대상 origin 에서)"""
+        with BrowserSession(factory=FakeBrowser) as session:
+            scanner = SeleniumXSSScanner(cookies={'sid': '1'}, browsers=2, session=session)
+            scanner._inject_and_check = lambda url, param, payload, method='get', form_data=None, browser=None: \
+                ScanResult(url, param, payload, reflected=False, vulnerable=False)
+            scanner.scan_pages([PageInfo(url='https://a.com:8443/s', params={'q': ''})], quick_mode=True)
+            extra = [b for b in session.pool(2).browsers if b is not session.ensure()]
+            self.assertEqual(len(extra), 1)
+            self.assertEqual(extra[0].cookies, {'sid': '1'})
+            self.assertEqual(extra[0].driver.visited, ['https://a.com:8443'])
+
+    def test_login_reapplied_on_restart(self):
+        """세션에 기록된 로그인 쿠키는 기본 브라우저를 다시 시작할 때마다 다시 넣음"""
+        with BrowserSession(factory=FakeBrowser) as session:
+            browser = session.ensure()
+            session.set_login({'sid': '1'}, 'http://a.com/board?x=1')
+            self.assertEqual(browser.cookies, {'sid': '1'})
+            session.set_login({'sid': '1'}, 'http://a.com/other')  # 같은 로그인은 다시 넣지 않음
+            self.assertEqual(browser.driver.visited, ['http://a.com'])
+            browser.driver = None  # 크래시
+            scanner = SeleniumXSSScanner(cookies={'sid': '1'}, session=session)
+            scanner.browser = browser
+            self.assertTrue(scanner._recover())
+            self.assertEqual(session.restarts, 1)
+            self.assertEqual(browser.cookies, {'sid': '1'})
+            self.assertEqual(browser.driver.visited, ['http://a.com'])
+
+    def test_own_session_logged_in(self):
+        """자체 세션을 쓰는 스캐너는 분석할 페이지의 origin 에서 로그인"""
+        scanner = SeleniumXSSScanner(cookies={'sid': '1'})
+        scanner.session.factory = FakeBrowser
+        scanner._start_browser('https://a.com/page')
+        self.assertEqual(scanner.browser.cookies, {'sid': '1'})
+        self.assertEqual(scanner.browser.driver.visited, ['https://a.com'])
+        scanner.session.close()
+
+    def test_pool_revives_crashed_browser(self):
+        """크래시한 풀 브라우저는 다시 시작"""
+        pool = BrowserPool(1, factory=FakeBrowser)
+        pool.start()
+        browser = pool.browsers[0]
+        browser.driver = None
+        self.assertTrue(pool.revive(browser))
+        self.assertTrue(browser.is_alive())
+        self.assertEqual(pool.restarts, 1)
+
+    def test_shared_session_survives_phases(self):
+        """넘겨받은 세션은 단계가 끝나도 닫지 않음, 자체 세션은 닫음"""
+        session = BrowserSession(factory=FakeBrowser)
+        shared = SeleniumXSSScanner(session=session)
+        shared._start_browser()
+        shared._close_browser()
+        self.assertTrue(session.ensure() is not None and session.starts == 1)
+        owned = SeleniumXSSScanner()
+        owned.session.factory = FakeBrowser
+        owned._start_browser()
+        browser = owned.browser
+        owned._close_browser()
+        self.assertTrue(browser.closed)
+        session.close()
+
+    def test_stop_keeps_shared_session(self):
+        """중단은 넘겨받은 세션을 닫지 않고 stop_flag 로 작업만 멈춤, 자체 세션은 닫음"""
+        session = BrowserSession(factory=FakeBrowser)
+        reported = []
+
+        def callback(message, level, data=None):
+            if level == 'scan_result':
+                reported.append(data)
+                scanner.stop()
+                crawler.stop()
+
+        crawler = xss_engine_selenium.SeleniumCrawler('http://a.com', session=session)
+        scanner = SeleniumXSSScanner(browsers=2, callback=callback, session=session)
+        scanner._inject_and_check = lambda url, param, payload, method='get', form_data=None, browser=None: \
+            ScanResult(url, param, payload, reflected=True, vulnerable=True)
+        results = scanner.scan_pages([page_with_params(4)], quick_mode=True)
+        self.assertEqual(len(reported), 1)
+        self.assertLess(results.total, 28)
+        self.assertTrue(scanner.stop_flag and crawler.stop_flag)
+        pool = session.pool(2)
+        self.assertFalse(any(b.closed for b in pool.browsers))
+        self.assertEqual(session.starts, 1)
+        session.close()
+
+        owned = SeleniumXSSScanner()
+        owned.session.factory = FakeBrowser
+        owned._start_browser()
+        browser = owned.browser
+        owned.stop()
+        self.assertTrue(browser.closed)
+
+    def test_driver_installed_once(self):
+        """드라이버 설치 확인은 프로세스당 한 번"""
+        installer = mock.Mock()
+        with mock.patch.dict(sys.modules, {'chromedriver_autoinstaller': installer}), \
+                mock.patch.object(xss_engine_selenium, '_DRIVER_INSTALLED', False):
+            install_driver()
+            install_driver()
+        self.assertEqual(installer.install.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
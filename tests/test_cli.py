@@ -0,0 +1,188 @@
+"""
+================================================================================
+XSS Scanner - 헤드리스 CLI 테스트 (test_cli.py)
+================================================================================
+
+xss_scan.py의 인자 처리, JSONL 출력, 지연 로드, 종료 코드를 테스트합니다.
+(종단 간 테스트는 로컬 http.server 만 사용)
+
+실행:
+    python -m pytest tests/test_cli.py -v
+    python tests/test_cli.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import shutil
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
+
+# 상위 디렉토리를 path에 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import xss_scan
+from xss_scan import JsonlWriter, build_parser, make_callback, parse_cookies
+from result_store import ResultRecord
+
+
+class TestCliArgs(unittest.TestCase):
+    """인자 처리 테스트"""
+
+    def test_defaults(self):
+        """기본값은 requests 엔진 + 빠른 스캔"""
+        args = build_parser().parse_args(['http://a.com'])
+        self.assertEqual(args.engine, 'requests')
+        self.assertFalse(args.full)
+        self.assertEqual(args.urls, ['http://a.com'])
+
+    def test_parse_cookies(self):
+        """쿠키 문자열 파싱"""
+        self.assertEqual(parse_cookies('a=1; b=x=y'), {'a': '1', 'b': 'x=y'})
+        self.assertIsNone(parse_cookies(''))
+        self.assertIsNone(parse_cookies('garbage'))
+
+    def test_no_targets_is_usage_error(self):
+        """대상이 없으면 종료 코드 2"""
+        with self.assertRaises(SystemExit) as ctx:
+            sys.stderr, saved = io.StringIO(), sys.stderr
+            try:
+                xss_scan.main([])
+            finally:
+                sys.stderr = saved
+        self.assertEqual(ctx.exception.code, 2)
+
+
+class TestCliOutput(unittest.TestCase):
+    """JSONL 출력 테스트"""
+
+    def test_result_streamed_as_jsonl(self):
+        """scan_result 콜백은 즉시 result 이벤트로 출력"""
+        stream = io.StringIO()
+        callback = make_callback(JsonlWriter(stream), quiet=True)
+        callback("로그", 'info')
+        callback(None, 'scan_result', ResultRecord('http://a/s', 'q', '<b>', True, True))
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        event = json.loads(lines[0])
+        self.assertEqual(event['event'], 'result')
+        self.assertEqual(event['payload'], '<b>')
+
+
+class TestLazyImport(unittest.TestCase):
+    """지연 로드 테스트"""
+
+    def test_import_does_not_load_engines(self):
+        """CLI 모듈 로드 시 tkinter/selenium/requests 를 가져오지 않음"""
+        code = ("import sys, xss_scan; "
+                "print(','.join(m for m in ('tkinter', 'selenium', 'requests', 'bs4') if m in sys.modules))")
+        output = subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        self.assertEqual(output, '')
+
+
+PAGES = {
+    '/': '<html><head><title>홈</title></head><body>'
+         '<form action="/search" method="get"><input name="q" value=""></form>'
+         '<a href="/board">게시판</a></body></html>',
+    '/board': '<html><head><title>게시판</title></head><body><p>글</p>'
+              '<img src=x onerror=alert(1)></body></html>',
+    '/clean': '<html><head><title>깨끗함</title></head><body><p>정적 페이지</p></body></html>',
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """고정 페이지 + q 를 그대로 반사하는 /search"""
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == '/search':
+            q = parse_qs(parsed.query).get('q', [''])[0]
+            body = f'<html><head><title>검색</title></head><body><p>결과: {q}</p></body></html>'
+        elif parsed.path in PAGES:
+            body = PAGES[parsed.path]
+        else:
+            self.send_error(404)
+            return
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestEndToEnd(unittest.TestCase):
+    """로컬 서버 대상 main() 종단 간 테스트 (requests 엔진)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.output = os.path.join(self.tmp_dir, 'results.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def run_cli(self, *argv):
+        code = xss_scan.main(['-q', '--threads', '4', '-o', self.output, *argv])
+        with open(self.output, encoding='utf-8') as f:
+            return code, [json.loads(line) for line in f]
+
+    def test_reflected_and_stored_found(self):
+        """크롤링 -> 저장된 XSS -> 반사형 스캔 이벤트, 취약점이 있으면 종료 코드 1"""
+        code, events = self.run_cli(self.base)
+        kinds = [e['event'] for e in events]
+        self.assertNotIn('error', kinds)
+        self.assertEqual(code, 1)
+        titles = {e['url']: e['title'] for e in events if e['event'] == 'page'}
+        self.assertEqual(titles[self.base], '홈')
+        self.assertTrue(any(e['url'].endswith('/board') for e in events if e['event'] == 'stored'))
+        self.assertTrue(any(e['vulnerable'] and e['parameter'].startswith('q') for e in events if e['event'] == 'result'))
+        summary = events[-1]
+        self.assertEqual(summary['event'], 'summary')
+        self.assertGreater(summary['vulnerable'], 0)
+
+    def test_clean_target_exit_zero(self):
+        """취약점이 없으면 종료 코드 0"""
+        code, events = self.run_cli(self.base + '/clean')
+        self.assertEqual(code, 0)
+        self.assertEqual([e['event'] for e in events], ['page', 'summary'])
+
+    def test_failed_target_nonzero(self):
+        """스캔하지 못한 대상이 있으면 error 이벤트 + 종료 코드 3"""
+        real = xss_scan.scan_target
+
+        def scan_target(args, base_url, out, callback):
+            if base_url.endswith('/broken'):
+                raise RuntimeError("연결 실패")
+            return real(args, base_url, out, callback)
+
+        with mock.patch.object(xss_scan, 'scan_target', scan_target):
+            code, events = self.run_cli(self.base + '/clean', self.base + '/broken')
+        self.assertEqual(code, 3)
+        self.assertEqual([e['event'] for e in events if e['event'] in ('error', 'summary')], ['summary', 'error'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
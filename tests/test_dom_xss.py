@@ -0,0 +1,108 @@
+"""
+================================================================================
+XSS Scanner - DOM 트리 기반 저장된 XSS 탐지 테스트 (test_dom_xss.py)
+================================================================================
+
+dom_xss.py의 요소별 규칙과 크롤링 파싱 트리 재사용을 테스트합니다.
+(네트워크 사용 안 함)
+
+실행:
+    python -m pytest tests/test_dom_xss.py -v
+    python tests/test_dom_xss.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dom_xss import analyze_html
+from http_transport import HttpTransport
+from xss_engine import SiteCrawler, XSSScanner
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+        self.status_code = 200
+        self.headers = {'Content-Type': 'text/html; charset=utf-8'}
+
+
+def names(html):
+    return [name for name, _content, _line in analyze_html(html)]
+
+
+class TestDomRules(unittest.TestCase):
+    """요소별 규칙 테스트"""
+
+    def test_event_handlers(self):
+        """요소별 이벤트 이름, 그 밖의 on* 속성도 탐지"""
+        self.assertEqual(names('<img src=x onerror=alert(1)>'), ['img onerror XSS'])
+        self.assertEqual(names('<div ONMOUSEOVER="x()">'), ['onmouseover 이벤트'])
+        self.assertEqual(names('<details ontoggle=x()>'), ['ontoggle 이벤트'])
+
+    def test_javascript_url_normalized(self):
+        """대소문자/공백/제어 문자가 섞인 javascript: URL"""
+        self.assertEqual(names('<a href="  JaVa\tScRiPt:go()">x</a>'), ['javascript: href'])
+        self.assertEqual(names('<form action="javascript:x()"></form>'), ['javascript: action'])
+        self.assertEqual(names('<a href="/javascript:ok">x</a>'), [])
+
+    def test_scripts(self):
+        """인라인 스크립트 본문 규칙, 안전한 CDN 스크립트 제외"""
+        self.assertEqual(names('<script>var c = document.cookie;</script>'), ['쿠키 접근 스크립트'])
+        self.assertEqual(names('<script src="https://code.jquery.com/j.js">alert(1)</script>'), [])
+        self.assertEqual(names('<table><tr><td><script>eval(x)</script></td></tr></table>'),
+                         ['eval() 스크립트', '테이블 셀 내 스크립트'])
+
+    def test_iframe_and_markers(self):
+        """상대/스킴 없는 iframe, 텍스트의 XSS 흔적 (줄 번호는 요소 시작 줄)"""
+        findings = analyze_html('<p>ok</p>\n<iframe src="//evil"></iframe>\n<p>XSS_TEST 1</p>')
+        self.assertEqual([(n, line) for n, _c, line in findings], [('의심스러운 iframe', 2), ('XSS 테스트 흔적', 3)])
+        self.assertEqual(names('<iframe src="https://ok.com"></iframe>'), [])
+
+    def test_dedup(self):
+        """같은 (이름, 내용)은 한 번만"""
+        self.assertEqual(names('<b onclick="x()">1</b><b onclick="x()">2</b>'), ['onclick 이벤트'])
+
+
+class TestDomContentPhase(unittest.TestCase):
+    """크롤링 트리 재사용 테스트"""
+
+    def test_crawl_tree_reused(self):
+        """dom 모드: 크롤링 중 분석, 본문은 캐시에 없고 분석 단계에서 요청 없음"""
+        site = {
+            'http://a.com': '<title>홈</title><a href="/board">board</a>',
+            'http://a.com/board': '<td><img src=x onerror=alert(1)></td>',
+        }
+        requests_made = []
+
+        def fake_get(url, **kwargs):
+            requests_made.append(url)
+            return FakeResponse(site.get(url, ''))
+
+        transport = HttpTransport(pool_size=1)
+        transport.session.get = fake_get
+        crawler = SiteCrawler('http://a.com', delay=0, transport=transport, content_analysis='dom')
+        pages = crawler.crawl()
+        self.assertEqual(pages[0].title, '홈')
+        self.assertEqual(len(transport.page_cache), 0)
+
+        scanner = XSSScanner(threads=1, transport=transport, content_analysis='dom')
+        results = scanner.scan_page_content(pages)
+        self.assertEqual(len(requests_made), 2)
+        self.assertEqual({r.pattern_name for r in results}, {'img onerror XSS', '테이블 셀 내 onerror'})
+
+    def test_uncrawled_page_parsed(self):
+        """크롤링 때 분석하지 않은 페이지는 본문을 받아 파싱"""
+        from xss_engine import PageInfo
+        scanner = XSSScanner(threads=1, content_analysis='dom')
+        scanner.session.get = lambda url, **kwargs: FakeResponse('<svg onload=x()>')
+        results = scanner.scan_page_content([PageInfo('http://a.com/x')])
+        self.assertEqual([r.pattern_name for r in results], ['svg onload XSS'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,287 @@
+"""
+================================================================================
+XSS Scanner - Requests 엔진 테스트 (test_engine.py)
+================================================================================
+
+xss_engine.py의 반사/취약점 판정 로직을 테스트합니다. (네트워크 사용 안 함)
+
+실행:
+    python -m pytest tests/test_engine.py -v
+    python tests/test_engine.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xss_engine import (
+    XSSScanner, PageInfo, ScanResult, declared_charset, encode_payload, changed_region,
+    payload_constructs, VULN_WINDOW, XSS_PAYLOADS_QUICK
+)
+from scan_journal import ScanJournal
+
+
+class FakeResponse:
+    """requests.Response 대용 (content/headers/status_code 만 사용)"""
+
+    def __init__(self, content: bytes, content_type: str = 'text/html', status_code: int = 200):
+        self.content = content
+        self.headers = {'Content-Type': content_type}
+        self.status_code = status_code
+
+    @property
+    def text(self):
+        raise AssertionError("response.text 는 사용하지 않아야 합니다")
+
+
+class TestByteReflection(unittest.TestCase):
+    """바이트 단위 반사 탐지 테스트"""
+
+    def setUp(self):
+        self.scanner = XSSScanner(threads=1)
+        self.payload = '<script>alert(1)</script>'
+
+    def test_declared_charset(self):
+        """Content-Type 의 charset 추출"""
+        self.assertEqual(declared_charset('text/html; charset=EUC-KR'), 'euc-kr')
+        self.assertEqual(declared_charset('text/html; charset="utf-8"'), 'utf-8')
+        self.assertIsNone(declared_charset('text/html'))
+        self.assertIsNone(declared_charset(''))
+
+    def test_encode_payload_dedupes(self):
+        """ASCII 페이로드는 인코딩이 달라도 하나로 합쳐짐"""
+        self.assertEqual(encode_payload(self.payload), (self.payload.encode(),))
+
+    def test_encode_payload_non_ascii(self):
+        """비 ASCII 페이로드는 인코딩별 변형을 모두 생성"""
+        variants = encode_payload('<b>테스트</b>', 'euc-kr')
+        self.assertEqual(variants[0], '<b>테스트</b>'.encode('euc-kr'))
+        self.assertIn('<b>테스트</b>'.encode('utf-8'), variants)
+
+    def test_reflection_in_bytes(self):
+        """bytes 응답에서 반사 탐지 및 스니펫 디코딩"""
+        body = ('<html><p>검색어: ' + self.payload + '</p></html>').encode('utf-8')
+        reflected, snippet = self.scanner.check_reflection(body, self.payload, 'utf-8')
+        self.assertTrue(reflected)
+        self.assertIn(self.payload, snippet)
+        self.assertIn('검색어', snippet)
+
+    def test_reflection_declared_encoding(self):
+        """선언된 charset 으로 인코딩된 비 ASCII 페이로드 탐지"""
+        payload = '"><b>테스트</b>'
+        body = ('<input value="' + payload + '">').encode('euc-kr')
+        reflected, snippet = self.scanner.check_reflection(body, payload, 'euc-kr')
+        self.assertTrue(reflected)
+        self.assertIn(payload, snippet)
+
+    def test_no_reflection(self):
+        """인코딩된 출력은 반사로 보지 않음"""
+        body = b'<p>&lt;script&gt;alert(1)&lt;/script&gt;</p>'
+        self.assertEqual(self.scanner.check_reflection(body, self.payload), (False, None))
+
+    def test_reflection_str_compat(self):
+        """기존 str 입력도 그대로 지원"""
+        reflected, snippet = self.scanner.check_reflection('a' + self.payload + 'b', self.payload)
+        self.assertTrue(reflected)
+        self.assertEqual(snippet, 'a' + self.payload + 'b')
+
+    def test_analyze_response_uses_content(self):
+        """응답 분석은 response.text 를 사용하지 않음"""
+        response = FakeResponse(b'<div>' + self.payload.encode() + b'</div>')
+        reflected, vulnerable, snippet = self.scanner._analyze_response(response, self.payload)
+        self.assertTrue(reflected)
+        self.assertTrue(vulnerable)
+        self.assertIn(self.payload, snippet)
+
+    def test_unknown_charset(self):
+        """알 수 없는 charset 이 선언돼도 반사/취약 판정 (스니펫은 실제로 일치한 인코딩으로 디코딩)"""
+        response = FakeResponse(('<p>검색: ' + self.payload + '</p>').encode('utf-8'), 'text/html; charset=x-bogus')
+        reflected, vulnerable, snippet = self.scanner._analyze_response(response, self.payload)
+        self.assertTrue(reflected and vulnerable)
+        self.assertIn('검색: ' + self.payload, snippet)
+        payload = '<b>테스트</b>'
+        body = ('<p>' + payload + '</p>').encode('euc-kr')
+        reflected, snippet = self.scanner.check_reflection(body, payload, 'x-bogus')
+        self.assertTrue(reflected)
+        self.assertIn(payload, snippet)
+
+    def test_vulnerability_requires_dangerous_payload(self):
+        """위험 구문이 없는 페이로드는 취약으로 판정하지 않음"""
+        body = b'<script>var a = 1;</script><p>hello</p>'
+        self.assertFalse(self.scanner.check_vulnerability(body, 'hello'))
+
+
+class TestWindowedVulnerability(unittest.TestCase):
+    """반사 위치 기준 윈도우 판정 테스트"""
+
+    def setUp(self):
+        self.scanner = XSSScanner(threads=1)
+
+    def test_payload_constructs(self):
+        """페이로드의 위험 구문 이름 추출"""
+        self.assertEqual(payload_constructs('<img src=x onerror=alert(1)>'), frozenset({'onerror'}))
+        self.assertEqual(payload_constructs('<script>alert(1)</script>'), frozenset({'script'}))
+        self.assertEqual(payload_constructs('hello'), frozenset())
+
+    def test_offset_window_only(self):
+        """지정된 반사 위치 주변에 위험 구문이 없으면 비취약"""
+        payload = '<script>alert(1)</script>'
+        body = b'<script>init()</script>' + b'x' * (VULN_WINDOW * 4) + b'[reflected]'
+        self.assertFalse(self.scanner.check_vulnerability(body, payload, offset=len(body) - 11))
+
+
+class TestBaselineDiff(unittest.TestCase):
+    """기준 응답 비교 테스트"""
+
+    def setUp(self):
+        self.scanner = XSSScanner(threads=1)
+        self.page = b'<html><script src="/app.js"></script><img src=a onerror=retry()><p>%s</p></html>'
+
+    def test_changed_region(self):
+        """공통 접두/접미를 제외한 구간"""
+        body, baseline = b'abcXYZdef', b'abc1def'
+        self.assertEqual(changed_region(body, baseline), (3, 6, 3, 4))
+
+    def test_changed_region_identical(self):
+        """동일한 응답은 빈 구간"""
+        start, end, base_start, base_end = changed_region(b'same', b'same')
+        self.assertEqual((end - start, base_end - base_start), (0, 0))
+
+    def test_existing_tags_not_counted(self):
+        """기준 응답에 이미 있던 위험 구문은 취약점으로 세지 않음"""
+        payload = 'javascript:alert(1)'
+        page = b'<a href="javascript:alert(1)">help</a><p>%s</p>'
+        baseline = page % b'test'
+        body = page % b'javascript&#58;alert(1)'
+        # 기준 응답 없이 전체를 보면 기존 링크 때문에 오탐
+        self.assertTrue(self.scanner.check_reflection(body, payload)[0])
+        self.assertTrue(self.scanner.check_vulnerability(body, payload))
+        self.assertFalse(self.scanner.check_vulnerability(body, payload, baseline))
+
+    def test_new_construct_detected(self):
+        """반사로 새로 생긴 위험 구문은 탐지"""
+        payload = '<img src=x onerror=alert(1)>'
+        baseline = self.page % b'test'
+        body = self.page % payload.encode()
+        self.assertTrue(self.scanner.check_vulnerability(body, payload, baseline))
+
+    def test_token_before_reflection(self):
+        """반사 위치 앞의 요청별 토큰만 달라도 멀리 있는 기존 구문은 세지 않음"""
+        payload = '<script>alert(1)</script>'
+        page = (b'<meta name="csrf-token" content="%s">' + b'<script src="/app.js"></script>' * 3
+                + b'x' * (VULN_WINDOW * 2) + b'<p>%s</p>')
+        body = page % (b'a1b2c3', payload.encode())
+        self.assertTrue(self.scanner.check_vulnerability(body, payload))
+        self.assertTrue(self.scanner.check_vulnerability(body, payload, page % (b'a1b2c3', b'test')))
+        self.assertTrue(self.scanner.check_vulnerability(body, payload, page % (b'z9y8x7', b'test')))
+        # 반사 위치 근처의 기존 구문은 토큰이 달라도 그대로 제외
+        near = b'<meta name="csrf-token" content="%s"><a href="javascript:alert(1)">help</a><p>%s</p>'
+        body = near % (b'a1b2c3', b'javascript&#58;alert(1)')
+        self.assertTrue(self.scanner.check_vulnerability(body, 'javascript:alert(1)'))
+        self.assertFalse(self.scanner.check_vulnerability(body, 'javascript:alert(1)', near % (b'z9y8x7', b'test')))
+
+    def test_baseline_window_not_wider(self):
+        """기준 응답이 더 길어도 응답 쪽 창보다 넓게 보지 않음 (창 밖의 기존 구문은 세지 않음)"""
+        payload = '<script>alert(1)</script>'
+        body = b'<p>' + payload.encode() + b'</p>'
+        baseline = b'<p>test</p>' + b'z' * (VULN_WINDOW + 100) + b'<script src="/a.js"></script>' + b'y' * 1000
+        self.assertTrue(self.scanner.check_vulnerability(body, payload, baseline))
+
+    def test_baseline_fetched_once(self):
+        """엔드포인트당 기준 응답은 한 번만 요청"""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return FakeResponse(b'base')
+
+        for _ in range(3):
+            self.assertEqual(self.scanner.get_baseline(('get', 'http://a/'), fetch), b'base')
+        self.assertEqual(len(calls), 1)
+
+    def test_baseline_failure_not_cached(self):
+        """기준 응답 요청 실패 시 None, 다음 요청에서 다시 시도"""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                raise IOError("down")
+            return FakeResponse(b'base')
+
+        self.assertIsNone(self.scanner.get_baseline(('get', 'http://b/'), fetch))
+        self.assertEqual(self.scanner.get_baseline(('get', 'http://b/'), fetch), b'base')
+        self.assertEqual(self.scanner.get_baseline(('get', 'http://b/'), fetch), b'base')
+        self.assertEqual(len(calls), 2)
+
+
+class TestJournalResume(unittest.TestCase):
+    """저널 기반 재개 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.tmp_dir, 'scan.jsonl')
+        self.pages = [PageInfo('http://a/s?q=1', params={'q': ['1']})]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _scanner(self, calls):
+        scanner = XSSScanner(threads=2)
+
+        def fake_scan(url, param, payload):
+            calls.append(payload)
+            reflected = payload == XSS_PAYLOADS_QUICK[0]
+            return ScanResult(url, param, payload, reflected, reflected, None, 200)
+
+        scanner.scan_url_param = fake_scan
+        return scanner
+
+    def test_resume_skips_completed(self):
+        """완료된 테스트는 건너뛰고 결과를 합침"""
+        first_calls, second_calls = [], []
+        with ScanJournal(self.journal_path) as journal:
+            store = self._scanner(first_calls).scan_pages(self.pages, quick_mode=True, journal=journal)
+        self.assertEqual(store.total, len(XSS_PAYLOADS_QUICK))
+
+        with ScanJournal(self.journal_path) as journal:
+            store = self._scanner(second_calls).scan_pages(self.pages, quick_mode=True, journal=journal)
+        self.assertEqual(second_calls, [])
+        self.assertEqual(store.total, len(XSS_PAYLOADS_QUICK))
+        self.assertEqual(len(store.vulnerable), 1)
+
+    def test_resume_keeps_recorded_plan(self):
+        """시간 예산 계획으로 시작한 스캔은 옵션과 관계없이 같은 테스트 목록으로 재개 (빠진 엔드포인트 제외)"""
+        pages = [PageInfo('http://a/s?q=1&zz=1', params={'q': ['1'], 'zz': ['1']})]
+        first_calls, second_calls = [], []
+        scanner = self._scanner(first_calls)
+        plan = scanner.plan(pages, quick_mode=True, budget=4.0, latency=1.0)
+        self.assertEqual(len(plan.endpoints), 1)
+        scan = scanner.scan_url_param
+
+        def stop_after_three(url, param, payload):
+            if len(first_calls) >= 3:
+                scanner.stop()
+            return scan(url, param, payload)
+
+        scanner.scan_url_param = stop_after_three
+        with ScanJournal(self.journal_path) as journal:
+            scanner.scan_pages(pages, quick_mode=True, journal=journal, plan=plan)
+
+        scanner = self._scanner(second_calls)
+        with ScanJournal(self.journal_path) as journal:
+            store = scanner.scan_pages(pages, quick_mode=False, journal=journal)
+        self.assertTrue(second_calls)
+        self.assertEqual(store.total, len(XSS_PAYLOADS_QUICK))
+        self.assertTrue(set(second_calls) <= set(XSS_PAYLOADS_QUICK))
+        self.assertEqual({stats.parameter for stats in store.endpoints.values()}, {'q'})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
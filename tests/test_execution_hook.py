@@ -0,0 +1,242 @@
+"""
+================================================================================
+XSS Scanner - Selenium 실행 감지 훅 테스트 (test_execution_hook.py)
+================================================================================
+
+xss_engine_selenium.py의 문서 시작 훅(Page.addScriptToEvaluateOnNewDocument)
+설치, 훅 기반 실행 대기와 네트워크 IDLE 준비 대기, 훅을 쓸 수 없을 때의
+alert/콘솔/readyState 폴링 대체, 화면에 보이는 Alert 모드의 대화상자 감지를
+테스트합니다. (Chrome 없이 가짜 드라이버로 실행)
+
+실행:
+    python -m pytest tests/test_execution_hook.py -v
+    python tests/test_execution_hook.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import time
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from selenium.common.exceptions import (WebDriverException, NoAlertPresentException,
+                                            UnexpectedAlertPresentException)
+    from config import Config
+    from xss_engine_selenium import (BrowserManager, SeleniumXSSScanner, EXECUTION_HOOK, ALERT_MODE_HOOK,
+                                     XSS_MARKERS, WAIT_FOR_IDLE, IDLE_TIMER_HORIZON)
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+
+class FakeSwitch:
+    @property
+    def alert(self):
+        raise NoAlertPresentException()
+
+
+class FakeDriver:
+    """WebDriver 대역 - 호출 기록"""
+
+    def __init__(self, hits=None, logs=(), cdp=True, async_errors=0, idle=True, ready_state='complete',
+                 dialog=None):
+        self.hits = hits
+        self.dialog = dialog
+        self.idle = idle
+        self.ready_state = ready_state
+        self.logs = list(logs)
+        self.cdp = cdp
+        self.async_errors = async_errors
+        self.calls = []
+        self.page_source = ''
+        self.switch_to = FakeSwitch()
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.calls.append(cmd)
+        if not self.cdp:
+            raise WebDriverException("CDP 없음")
+        self.hook_source = params['source']
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, *args):
+        self.calls.append('wait_for_idle' if script is WAIT_FOR_IDLE else 'execute_async_script')
+        self.last_args = args
+        if self.async_errors:
+            self.async_errors -= 1
+            raise WebDriverException("document unloaded while waiting for result")
+        if self.dialog is not None and script is not WAIT_FOR_IDLE:
+            # unhandledPromptBehavior='accept and notify' -> 수락 후 내용과 함께 알림
+            raise UnexpectedAlertPresentException(alert_text=self.dialog)
+        return self.idle if script is WAIT_FOR_IDLE else self.hits
+
+    def execute_script(self, script):
+        self.calls.append('execute_script')
+        return self.ready_state
+
+    def get_log(self, kind):
+        self.calls.append('get_log')
+        logs, self.logs = self.logs, []
+        return [{'message': m} for m in logs]
+
+    def get(self, url):
+        self.calls.append('get')
+
+
+def make_browser(driver, **kwargs) -> 'BrowserManager':
+    browser = BrowserManager(**kwargs)
+    browser.driver = driver
+    browser.hooked = browser.install_hook()
+    return browser
+
+
+@unittest.skipUnless(SELENIUM_AVAILABLE, "selenium 미설치")
+class TestExecutionHook(unittest.TestCase):
+    """훅 설치와 실행 대기 테스트"""
+
+    def test_hook_installed_with_markers(self):
+        """모든 새 문서에 마커를 포함한 훅 주입"""
+        driver = FakeDriver()
+        browser = make_browser(driver)
+        self.assertTrue(browser.hooked)
+        self.assertEqual(driver.calls, ['Page.addScriptToEvaluateOnNewDocument'])
+        for marker in XSS_MARKERS:
+            self.assertIn(marker, driver.hook_source)
+        self.assertIs(driver.hook_source, EXECUTION_HOOK)
+
+    def test_wait_results(self):
+        """기록이 있으면 실행됨, 없으면 깨끗함, 훅이 없는 문서면 None"""
+        self.assertEqual(make_browser(FakeDriver(hits=['XSS_TEST_1'])).wait_for_execution(), (True, 'XSS_TEST_1'))
+        self.assertEqual(make_browser(FakeDriver(hits=[])).wait_for_execution(), (False, ''))
+        self.assertIsNone(make_browser(FakeDriver(hits=None)).wait_for_execution())
+        self.assertIsNone(make_browser(FakeDriver(cdp=False)).wait_for_execution())
+
+    def test_retry_after_navigation(self):
+        """대기 중 문서가 바뀌면 새 문서에서 다시 대기"""
+        driver = FakeDriver(hits=['Alert: 1'], async_errors=1)
+        self.assertEqual(make_browser(driver).wait_for_execution(), (True, 'Alert: 1'))
+        self.assertEqual(driver.calls.count('execute_async_script'), 2)
+
+
+@unittest.skipUnless(SELENIUM_AVAILABLE, "selenium 미설치")
+class TestDetection(unittest.TestCase):
+    """스캐너 실행 감지 테스트"""
+
+    def test_clean_page_single_round_trip(self):
+        """훅이 있으면 깨끗한 페이지도 폴링 없이 WebDriver 호출 1회"""
+        driver = FakeDriver(hits=[])
+        scanner = SeleniumXSSScanner()
+        started = time.time()
+        result = scanner._inject_and_check('http://a.com/s?q=1', 'q', '<b>x</b>', browser=make_browser(driver))
+        self.assertLess(time.time() - started, 0.5)
+        self.assertEqual(driver.calls[1:], ['get', 'execute_async_script'])
+        self.assertFalse(result.executed)
+
+    def test_hit_marks_executed(self):
+        """훅 기록은 실행 증거"""
+        driver = FakeDriver(hits=['XSS_TEST_2'])
+        result = SeleniumXSSScanner()._inject_and_check('http://a.com/s', 'q', 'p', browser=make_browser(driver))
+        self.assertTrue(result.executed and result.vulnerable)
+        self.assertEqual(result.console_output, 'XSS_TEST_2')
+
+    def test_polling_fallback(self):
+        """CDP 를 쓸 수 없으면 alert/콘솔 폴링으로 감지"""
+        driver = FakeDriver(cdp=False, logs=['http://a.com 1:1 "XSS_TEST_3"'])
+        browser = make_browser(driver)
+        executed, evidence = SeleniumXSSScanner()._detect_execution(browser, 0.05)
+        self.assertTrue(executed)
+        self.assertIn('XSS_TEST_3', evidence)
+        self.assertEqual(SeleniumXSSScanner()._detect_execution(browser, 0), (False, ''))
+
+
+@unittest.skipUnless(SELENIUM_AVAILABLE, "selenium 미설치")
+class TestAlertMode(unittest.TestCase):
+    """화면에 보이는 Alert 모드 - 대화상자를 가로채지 않고 그대로 띄움"""
+
+    def test_hook_keeps_native_dialogs(self):
+        """Alert 모드 훅은 alert/confirm/prompt 를 덮어쓰지 않음 (마커/요청 추적은 같음)"""
+        self.assertIn("['alert', 'confirm', 'prompt']", EXECUTION_HOOK)
+        self.assertNotIn("['alert', 'confirm', 'prompt']", ALERT_MODE_HOOK)
+        for marker in XSS_MARKERS:
+            self.assertIn(marker, ALERT_MODE_HOOK)
+        self.assertIn('window.fetch', ALERT_MODE_HOOK)
+
+    def test_hook_selected_by_mode(self):
+        """화면에 보이는 Alert 모드만 대화상자를 그대로 띄움 (헤드리스는 훅으로 기록)"""
+        for kwargs, source in (({'headless': False, 'native_dialogs': True}, ALERT_MODE_HOOK),
+                               ({'headless': True, 'native_dialogs': True}, EXECUTION_HOOK),
+                               ({'headless': False}, EXECUTION_HOOK)):
+            driver = FakeDriver()
+            make_browser(driver, **kwargs)
+            self.assertIs(driver.hook_source, source)
+
+    def test_dialog_detected(self):
+        """대기 중 열린 대화상자의 내용이 실행 증거"""
+        browser = make_browser(FakeDriver(dialog='1'), headless=False, native_dialogs=True)
+        self.assertEqual(browser.wait_for_execution(), (True, 'Alert: 1'))
+        result = SeleniumXSSScanner(alert_mode=True)._inject_and_check('http://a.com/s', 'q', 'p', browser=browser)
+        self.assertTrue(result.executed and result.vulnerable)
+        self.assertEqual(result.console_output, 'Alert: 1')
+
+    def test_dialog_left_open_taken(self):
+        """알림에 내용이 없으면 열린 대화상자에서 읽고 수락"""
+        class Alert:
+            text = '2'
+            accepted = False
+
+            def accept(self):
+                self.accepted = True
+
+        class Switch:
+            alert = Alert()
+
+        def dialog_open(script, *args):
+            raise UnexpectedAlertPresentException()
+
+        driver = FakeDriver()
+        driver.switch_to = Switch()
+        driver.execute_async_script = dialog_open
+        browser = make_browser(driver, headless=False, native_dialogs=True)
+        self.assertEqual(browser.wait_for_execution(), (True, 'Alert: 2'))
+        self.assertTrue(Switch.alert.accepted)
+
+
+@unittest.skipUnless(SELENIUM_AVAILABLE, "selenium 미설치")
+class TestReadiness(unittest.TestCase):
+    """네트워크 IDLE 준비 대기 테스트"""
+
+    def test_hook_tracks_requests_and_timers(self):
+        """훅이 fetch/XHR 과 짧은 타이머를 추적"""
+        for name in ('window.fetch', 'XMLHttpRequest.prototype.send', 'window.setTimeout', 'window.clearTimeout'):
+            self.assertIn(name, EXECUTION_HOOK)
+        self.assertIn(f'horizon = {int(IDLE_TIMER_HORIZON * 1000)}', EXECUTION_HOOK)
+
+    def test_idle_wait_single_call(self):
+        """훅이 있으면 IDLE 대기 1회 (NETWORK_IDLE, 상한 전달)"""
+        driver = FakeDriver()
+        browser = make_browser(driver)
+        self.assertTrue(browser.wait_for_ready(3))
+        self.assertEqual(driver.calls[1:], ['wait_for_idle'])
+        self.assertEqual(driver.last_args, (Config.NETWORK_IDLE, 3))
+
+    def test_cap_reported(self):
+        """상한까지 조용해지지 않으면 False"""
+        self.assertFalse(make_browser(FakeDriver(idle=False)).wait_for_ready(0.1))
+
+    def test_ready_state_fallback(self):
+        """훅이 없으면 readyState 폴링"""
+        driver = FakeDriver(cdp=False)
+        self.assertTrue(make_browser(driver).wait_for_ready(1))
+        self.assertIn('execute_script', driver.calls)
+        started = time.time()
+        self.assertFalse(make_browser(FakeDriver(cdp=False, ready_state='loading')).wait_for_ready(0.2))
+        self.assertLess(time.time() - started, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
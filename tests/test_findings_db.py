@@ -0,0 +1,167 @@
+"""
+================================================================================
+XSS Scanner - 저장된 XSS 변경 추적 테스트 (test_findings_db.py)
+================================================================================
+
+findings_db.py의 URL 템플릿, 새 결과/해결된 결과 판정, 바뀌지 않은 페이지의
+분석 생략을 테스트합니다.
+
+실행:
+    python -m pytest tests/test_findings_db.py -v
+    python tests/test_findings_db.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from findings_db import FindingsDB, PriorAnalysis, url_template, text_digest, file_digest
+from xss_engine import XSSScanner, PageInfo
+
+
+FINDING = ('img onerror XSS', '<img src=x onerror=alert(1)>', 3)
+
+
+class TestUrlTemplate(unittest.TestCase):
+    """URL 템플릿 테스트"""
+
+    def test_numeric_segments_and_query_values(self):
+        """숫자 경로 조각과 쿼리 값은 지움"""
+        self.assertEqual(url_template('http://a.com/board/12?page=3&id=7'),
+                         url_template('http://A.com/board/57?id=1&page=9'))
+        self.assertEqual(url_template('http://a.com/board/12?id=7'), 'a.com/board/{id}?id=')
+
+    def test_distinct_paths_kept(self):
+        """일반 경로 조각은 유지"""
+        self.assertNotEqual(url_template('http://a.com/board/12'), url_template('http://a.com/news/12'))
+        self.assertEqual(url_template('http://a.com'), 'a.com/')
+
+    def test_file_digest_matches_text(self):
+        """파일 해시와 문자열 해시가 같음 (페이지 캐시 인코딩)"""
+        with tempfile.NamedTemporaryFile('wb', delete=False) as f:
+            f.write('<p>한글</p>'.encode('utf-8'))
+        try:
+            self.assertEqual(file_digest(f.name), text_digest('<p>한글</p>'))
+        finally:
+            os.remove(f.name)
+
+
+class TestFindingsDB(unittest.TestCase):
+    """실행 간 변경 추적 테스트"""
+
+    def setUp(self):
+        self.db = FindingsDB(':memory:', target='http://a.com')
+
+    def tearDown(self):
+        self.db.close()
+
+    def run_scan(self, pages):
+        """pages: {url: (본문 해시, 결과 목록)} -> (페이지별 상태, 해결된 결과)"""
+        self.db.begin_run()
+        statuses = {url: self.db.record_page(url, digest, findings) for url, (digest, findings) in pages.items()}
+        return statuses, self.db.finish_run(pages)
+
+    def test_new_then_known(self):
+        """처음 실행은 new, 다음 실행은 known"""
+        statuses, resolved = self.run_scan({'http://a.com/p': ('h1', [FINDING])})
+        self.assertEqual(statuses['http://a.com/p'], ['new'])
+        statuses, resolved = self.run_scan({'http://a.com/p': ('h1', [FINDING])})
+        self.assertEqual(statuses['http://a.com/p'], ['known'])
+        self.assertEqual(resolved, [])
+
+    def test_same_template_tracked_once(self):
+        """같은 템플릿의 다른 페이지에서 같은 결과는 한 항목"""
+        statuses, _ = self.run_scan({'http://a.com/post/1': ('h1', [FINDING]),
+                                     'http://a.com/post/2': ('h2', [FINDING])})
+        self.assertEqual(statuses['http://a.com/post/2'], ['new'])
+        self.assertEqual(len(self.db.findings()), 1)
+        statuses, _ = self.run_scan({'http://a.com/post/3': ('h3', [FINDING])})
+        self.assertEqual(statuses['http://a.com/post/3'], ['known'])
+
+    def test_resolved_and_reopened(self):
+        """사라진 결과는 해결됨, 다시 나타나면 new"""
+        self.run_scan({'http://a.com/p': ('h1', [FINDING])})
+        _, resolved = self.run_scan({'http://a.com/p': ('h2', [])})
+        self.assertEqual(len(resolved), 1)
+        self.assertEqual(resolved[0]['pattern_name'], FINDING[0])
+        self.assertEqual(self.db.findings(), [])
+        self.assertIsNotNone(self.db.findings(include_resolved=True)[0]['resolved_at'])
+        statuses, _ = self.run_scan({'http://a.com/p': ('h1', [FINDING])})
+        self.assertEqual(statuses['http://a.com/p'], ['new'])
+
+    def test_unvisited_page_not_resolved(self):
+        """이번에 분석하지 않은 페이지의 결과는 유지"""
+        self.run_scan({'http://a.com/p': ('h1', [FINDING])})
+        _, resolved = self.run_scan({'http://a.com/other': ('h2', [])})
+        self.assertEqual(resolved, [])
+        self.assertEqual(len(self.db.findings()), 1)
+
+    def test_prior_requires_same_digest(self):
+        """본문 해시가 같을 때만 이전 결과, 일부만 분석한 페이지는 보관하지 않음"""
+        self.run_scan({'http://a.com/p': ('h1', [FINDING])})
+        self.assertEqual(self.db.prior('http://a.com/p', 'h1'), PriorAnalysis([FINDING]))
+        self.assertIsNone(self.db.prior('http://a.com/p', 'h2'))
+        self.db.begin_run()
+        self.db.record_page('http://a.com/q', 'h3', [FINDING], partial=True)
+        self.assertIsNone(self.db.prior('http://a.com/q', 'h3'))
+
+    def test_persists_per_target(self):
+        """파일 DB는 다시 열어도 유지, 대상별로 따로 추적"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sub', 'findings.db')
+            with FindingsDB(path, 'http://a.com') as db:
+                db.begin_run()
+                db.record_page('http://a.com/p', 'h1', [FINDING])
+                db.finish_run(['http://a.com/p'])
+            with FindingsDB(path, 'http://a.com') as db:
+                self.assertEqual(len(db.findings()), 1)
+            with FindingsDB(path, 'http://b.com') as db:
+                self.assertEqual(db.findings(), [])
+                self.assertIsNone(db.prior('http://a.com/p', 'h1'))
+
+
+class TestScannerChangeTracking(unittest.TestCase):
+    """XSSScanner 연동 테스트"""
+
+    def scan(self, db, bodies):
+        scanner = XSSScanner(threads=1, analysis_workers=1)
+        for url, html in bodies.items():
+            scanner.transport.page_cache.put(url, html)
+        results = scanner.scan_page_content([PageInfo(url) for url in bodies], findings_db=db)
+        return scanner, results
+
+    def test_unchanged_pages_skip_analysis(self):
+        """본문이 같은 페이지는 분석하지 않고 이전 결과 사용"""
+        bodies = {'http://a.com/p': '<p>글</p>\n<img src=x onerror=alert(1)>',
+                  'http://a.com/q': '<p>깨끗한 페이지</p>'}
+        with FindingsDB(':memory:', 'http://a.com') as db:
+            _, first = self.scan(db, bodies)
+            self.assertEqual([r.status for r in first], ['new'] * len(first))
+            with mock.patch('xss_engine.analyze_document') as analyze, \
+                    mock.patch('xss_engine.analyze_blocks') as analyze_blocks:
+                scanner, second = self.scan(db, bodies)
+            analyze.assert_not_called()
+            analyze_blocks.assert_not_called()
+            self.assertEqual(scanner.unchanged_pages, 2)
+            self.assertEqual([r.to_dict() for r in second],
+                             [dict(r.to_dict(), status='known') for r in first])
+
+    def test_changed_page_reports_resolved(self):
+        """본문이 바뀐 페이지는 다시 분석하고 사라진 결과를 보고"""
+        with FindingsDB(':memory:', 'http://a.com') as db:
+            self.scan(db, {'http://a.com/p': '<img src=x onerror=alert(1)>'})
+            scanner, results = self.scan(db, {'http://a.com/p': '<p>수정됨</p><svg onload=alert(2)>'})
+        self.assertEqual(scanner.unchanged_pages, 0)
+        self.assertTrue(results and all(r.status == 'new' for r in results))
+        self.assertIn('img onerror XSS', [f['pattern_name'] for f in scanner.resolved_findings])
+        self.assertTrue(all(f['url'] == 'http://a.com/p' for f in scanner.resolved_findings))
+
+
+if __name__ == '__main__':
+    unittest.main()
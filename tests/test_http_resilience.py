@@ -0,0 +1,277 @@
+"""
+================================================================================
+XSS Scanner - HTTP 복원력 테스트 (test_http_resilience.py)
+================================================================================
+
+http_resilience.py의 차단기 상태 전이, 백오프 재시도, 스캐너 연동을 테스트합니다.
+(네트워크 사용 안 함)
+
+실행:
+    python -m pytest tests/test_http_resilience.py -v
+    python tests/test_http_resilience.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import time
+
+import requests
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_resilience import (
+    BreakerRegistry, CircuitBreaker, CircuitOpenError, backoff_delay, retry_with_backoff,
+    CLOSED, OPEN, HALF_OPEN
+)
+from xss_engine import PageInfo, XSSScanner, CIRCUIT_OPEN_ERROR, XSS_PAYLOADS_QUICK
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Status:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class Response(Status):
+    """본문이 있는 200 응답"""
+
+    def __init__(self, content: bytes):
+        super().__init__(200)
+        self.content = content
+        self.headers = {'Content-Type': 'text/html; charset=utf-8'}
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """차단기 상태 전이 테스트"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=self.clock)
+
+    def test_opens_after_consecutive_failures(self):
+        """연속 실패가 임계값에 도달하면 열림"""
+        for _ in range(2):
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow())
+
+    def test_success_resets_count(self):
+        """성공하면 연속 실패 수 초기화"""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_half_open_single_probe(self):
+        """대기 시간 후 탐색 요청은 1개만 허용"""
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now = 10
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertFalse(self.breaker.allow())
+
+    def test_probe_result(self):
+        """탐색 성공 -> 닫힘, 실패 -> 다시 열림"""
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now = 10
+        self.breaker.allow()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertEqual(self.breaker.remaining(), 10)
+
+        self.clock.now = 20
+        self.breaker.allow()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+
+class TestRetry(unittest.TestCase):
+    """백오프 재시도 테스트"""
+
+    def setUp(self):
+        self.sleeps = []
+
+    def test_backoff_bounded(self):
+        """대기 시간은 지수 증가하되 상한을 넘지 않음"""
+        for attempt in range(10):
+            self.assertLessEqual(backoff_delay(attempt, 0.5, 4.0), 4.0)
+        self.assertGreaterEqual(backoff_delay(3, 0.5, 4.0), 2.0)
+
+    def test_transient_retried(self):
+        """일시적 오류는 재시도 후 성공"""
+        calls = []
+
+        def func():
+            calls.append(1)
+            if len(calls) < 3:
+                raise requests.exceptions.ConnectionError("reset")
+            return Status(200)
+
+        self.assertEqual(retry_with_backoff(func, retries=2, sleep=self.sleeps.append).status_code, 200)
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_non_transient_not_retried(self):
+        """일시적이지 않은 오류는 즉시 전달"""
+        def func():
+            raise ValueError("bad url")
+
+        with self.assertRaises(ValueError):
+            retry_with_backoff(func, retries=3, sleep=self.sleeps.append)
+        self.assertEqual(self.sleeps, [])
+
+    def test_timeout_not_retried(self):
+        """타임아웃은 이미 timeout 만큼 기다렸으므로 재시도하지 않음"""
+        calls = []
+
+        def func():
+            calls.append(1)
+            raise requests.exceptions.ConnectTimeout("timeout")
+
+        with self.assertRaises(requests.exceptions.Timeout):
+            retry_with_backoff(func, retries=3, sleep=self.sleeps.append)
+        self.assertEqual((len(calls), self.sleeps), (1, []))
+
+    def test_breaker_opens_between_retries(self):
+        """시도마다 실패를 기록하여 차단기가 열리면 남은 재시도 중단"""
+        registry = BreakerRegistry(failure_threshold=2, retries=5, sleep=self.sleeps.append)
+        calls = []
+
+        def dead():
+            calls.append(1)
+            raise requests.exceptions.ConnectionError("refused")
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            registry.call('http://dead/', dead)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(registry.get('http://dead/').state, OPEN)
+
+    def test_post_not_retried(self):
+        """멱등이 아닌 요청은 연결 오류에도 재시도하지 않음 (실패는 기록)"""
+        registry = BreakerRegistry(retries=3, sleep=self.sleeps.append)
+        calls = []
+
+        def post():
+            calls.append(1)
+            raise requests.exceptions.ConnectionError("reset")
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            registry.call('http://a/form', post, idempotent=False)
+        self.assertEqual((len(calls), self.sleeps), (1, []))
+        self.assertEqual(registry.get('http://a/').failures, 1)
+
+    def test_transient_status_returned_after_retries(self):
+        """503 응답은 재시도 후에도 503 이면 응답을 그대로 반환하고 실패로 집계"""
+        registry = BreakerRegistry(failure_threshold=1, retries=1, sleep=self.sleeps.append)
+        response = registry.call('http://a/', lambda: Status(503))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(registry.get('http://a/x').state, OPEN)
+
+
+class TestRegistry(unittest.TestCase):
+    """호스트별 차단기 테스트"""
+
+    def test_open_host_fails_fast(self):
+        """열린 호스트는 요청 없이 CircuitOpenError, 다른 호스트는 영향 없음"""
+        registry = BreakerRegistry(failure_threshold=2, retries=0, clock=FakeClock())
+        calls = []
+
+        def dead():
+            calls.append(1)
+            raise requests.exceptions.Timeout("timeout")
+
+        for _ in range(2):
+            with self.assertRaises(requests.exceptions.Timeout):
+                registry.call('http://dead/a', dead)
+        with self.assertRaises(CircuitOpenError):
+            registry.call('http://dead/b', dead)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(registry.call('http://alive/', lambda: Status(200)).status_code, 200)
+        self.assertEqual(list(registry.open_hosts()), ['dead'])
+
+
+class TestScannerBreaker(unittest.TestCase):
+    """스캐너 연동 테스트"""
+
+    def test_dead_host_short_circuits(self):
+        """응답 없는 호스트는 몇 번만 요청하고 나머지는 오류로 집계 (저널 대상 아님)"""
+        scanner = XSSScanner(threads=1, breakers=BreakerRegistry(
+            failure_threshold=2, reset_timeout=0.2, retries=0))
+        calls = []
+
+        def dead_get(url, **kwargs):
+            calls.append(url)
+            raise requests.exceptions.ConnectionError("refused")
+
+        scanner.session.get = dead_get
+        store = scanner.scan_pages([PageInfo('http://dead/s?q=1', params={'q': ['1']})], quick_mode=True)
+        self.assertEqual(store.total, len(XSS_PAYLOADS_QUICK))
+        self.assertEqual(store.errors, len(XSS_PAYLOADS_QUICK))
+        self.assertLess(len(calls), len(XSS_PAYLOADS_QUICK))
+
+    def test_recovered_host_runs_deferred(self):
+        """호스트가 복구되면 보류된 작업이 탐색 요청 뒤에 모두 실행됨 (반열림 탐색 1개 제한에 걸리지 않음)"""
+        scanner = XSSScanner(threads=4, breakers=BreakerRegistry(
+            failure_threshold=3, reset_timeout=0.3, retries=0))
+        recover_at = time.time() + 0.15
+
+        def flaky_get(url, **kwargs):
+            if time.time() < recover_at:
+                raise requests.exceptions.ConnectionError("refused")
+            time.sleep(0.02)  # 탐색 요청이 끝나기 전에 다른 작업이 차단기를 확인하도록 지연
+            return Response(url.encode())
+
+        scanner.session.get = flaky_get
+        page = PageInfo('http://flaky/s?q=1&p=1', params={'q': ['1'], 'p': ['1']})
+        store = scanner.scan_pages([page], quick_mode=True)
+        self.assertEqual(store.total, 2 * len(XSS_PAYLOADS_QUICK))
+        self.assertLessEqual(store.errors, 4)  # 차단기를 연 실패만 (스레드 4개가 동시에 실패할 수 있음)
+        self.assertEqual(scanner.breakers.get('http://flaky/').state, CLOSED)
+        for stats in store.endpoints.values():
+            self.assertLess(stats.errors, stats.tested)
+
+    def test_form_errors_single_endpoint(self):
+        """폼 필드의 정상/오류/차단 결과가 한 엔드포인트로 집계됨"""
+        scanner = XSSScanner(threads=1, breakers=BreakerRegistry(
+            failure_threshold=2, reset_timeout=0.2, retries=0))
+        calls = []
+
+        def post(url, **kwargs):
+            calls.append(url)
+            if len(calls) <= 2:
+                return Response(b'ok')
+            raise requests.exceptions.ConnectionError("refused")
+
+        scanner.session.post = post
+        form = {'action': 'http://a/post', 'method': 'post', 'inputs': [{'name': 'body', 'value': ''}]}
+        store = scanner.scan_pages([PageInfo('http://a/', forms=[form])], quick_mode=True)
+        self.assertEqual(list(store.endpoints), [('http://a/post', 'body (POST)')])
+        stats = store.endpoints[('http://a/post', 'body (POST)')]
+        self.assertEqual(stats.tested, len(XSS_PAYLOADS_QUICK))
+        self.assertGreater(stats.errors, 0)
+
+    def test_circuit_open_result(self):
+        """열린 호스트에 대한 테스트 결과"""
+        scanner = XSSScanner(threads=1, breakers=BreakerRegistry(failure_threshold=1, retries=0))
+        scanner.breakers.get('http://dead/').record_failure()
+        result = scanner.scan_url_param('http://dead/s?q=1', 'q', '<b>')
+        self.assertEqual(result.response_snippet, CIRCUIT_OPEN_ERROR)
+        self.assertFalse(result.reflected)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,69 @@
+"""
+================================================================================
+XSS Scanner - 공유 HTTP 전송 계층 테스트 (test_http_transport.py)
+================================================================================
+
+http_transport.py의 세션 공유, 커넥션 풀 크기, 쿠키 전달을 테스트합니다.
+(네트워크 사용 안 함)
+
+실행:
+    python -m pytest tests/test_http_transport.py -v
+    python tests/test_http_transport.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+
+import requests
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_transport import HttpTransport
+from xss_engine import SiteCrawler, XSSScanner
+
+
+class TestHttpTransport(unittest.TestCase):
+    """전송 계층 테스트"""
+
+    def test_phases_share_session(self):
+        """크롤러와 스캐너가 같은 세션/차단기 사용"""
+        transport = HttpTransport(pool_size=4)
+        crawler = SiteCrawler('http://a.com', transport=transport)
+        scanner = XSSScanner(threads=4, transport=transport)
+        self.assertIs(crawler.session, scanner.session)
+        self.assertIs(scanner.breakers, transport.breakers)
+
+    def test_pool_sized_for_threads(self):
+        """스캐너 스레드 수에 맞춰 커넥션 풀 확장 (줄이지는 않음)"""
+        transport = HttpTransport(pool_size=2)
+        XSSScanner(threads=16, transport=transport)
+        self.assertEqual(transport.pool_size, 16)
+        self.assertEqual(transport.session.get_adapter('https://a.com')._pool_maxsize, 16)
+        transport.ensure_pool(4)
+        self.assertEqual(transport.pool_size, 16)
+
+    def test_server_cookies_carry_over(self):
+        """사용자 쿠키와 서버가 설정한 쿠키가 모두 전달됨 (Cookie 헤더 고정 없음)"""
+        transport = HttpTransport(cookies={'login': 'u1'})
+        crawler = SiteCrawler('http://a.com', transport=transport)
+        # 크롤링 중 서버가 Set-Cookie 로 세션 ID 를 설정한 상황
+        crawler.session.cookies.set('sessionid', 'abc', domain='a.com', path='/')
+
+        scanner = XSSScanner(threads=2, transport=transport)
+        self.assertNotIn('Cookie', scanner.session.headers)
+        prepared = scanner.session.prepare_request(requests.Request('GET', 'http://a.com/search?q=1'))
+        self.assertIn('login=u1', prepared.headers['Cookie'])
+        self.assertIn('sessionid=abc', prepared.headers['Cookie'])
+
+    def test_default_transport(self):
+        """전송 계층을 넘기지 않으면 각자 생성 (기존 동작)"""
+        scanner = XSSScanner(threads=3, cookies={'a': '1'})
+        self.assertEqual(scanner.transport.pool_size, 3)
+        self.assertEqual(scanner.transport.cookies, {'a': '1'})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
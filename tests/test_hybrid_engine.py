@@ -0,0 +1,148 @@
+"""
+================================================================================
+XSS Scanner - 하이브리드 엔진 테스트 (test_hybrid_engine.py)
+================================================================================
+
+hybrid_engine.py의 HTTP 반사 사전 필터와 브라우저 실행 확인을 테스트합니다.
+(네트워크/Chrome 없이 가짜 요청 결과와 가짜 브라우저로 실행)
+
+실행:
+    python -m pytest tests/test_hybrid_engine.py -v
+    python tests/test_hybrid_engine.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from hybrid_engine import HybridXSSScanner, browser_test
+    from xss_engine import PageInfo, ScanResult
+    from xss_engine_selenium import BrowserPool, ScanResult as BrowserResult
+    from scan_journal import ScanJournal, task_key
+    from tests.test_browser_pool import FakeBrowser, FailingBrowser
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+
+FORM = {'action': 'http://a.com/post', 'method': 'post',
+        'inputs': [{'name': 'title', 'value': ''}, {'name': 'body', 'value': ''}]}
+
+
+def http_result(url, param, payload):
+    """'q' 파라미터만 반사, 스크립트 태그는 위험 구문으로 판정"""
+    reflected = param == 'q'
+    return ScanResult(f'{url}?{param}=x', param, payload, reflected, reflected and '<script' in payload.lower())
+
+
+def make_scanner(executes=lambda test: '<script' in test[4].lower()):
+    """가짜 HTTP 결과 + 가짜 브라우저 풀을 쓰는 하이브리드 스캐너 -> (스캐너, 보고된 결과, 브라우저 테스트)"""
+    reported = []
+
+    def callback(message, level, data=None):
+        if level == 'scan_result':
+            reported.append(data)
+
+    scanner = HybridXSSScanner(threads=4, callback=callback, browsers=2)
+    scanner.scan_url_param = http_result
+    scanner.scan_form = lambda form, payload, field: ScanResult(
+        form['action'], f"{field['name']} (POST)", payload, field['name'] == 'body', False)
+    scanner.confirmer.pool = BrowserPool(2, factory=FakeBrowser)
+    scanner.confirmer.pool.start()
+    tested = []
+    lock = threading.Lock()
+
+    def run_test(pool, test):
+        with lock:
+            tested.append(test)
+        if executes(test):
+            return BrowserResult(test[1], 'p', test[4], False, True, executed=True, console_output='Alert: 1')
+        return BrowserResult(test[1], 'p', test[4], True, False)
+
+    scanner.confirmer._run_test = run_test
+    return scanner, reported, tested
+
+
+@unittest.skipUnless(SELENIUM_AVAILABLE, "selenium 미설치")
+class TestHybridScan(unittest.TestCase):
+    """반사 사전 필터 + 브라우저 확인 테스트"""
+
+    def setUp(self):
+        self.pages = [PageInfo(url='http://a.com/s', params={'q': '', 'page': ''}, forms=[FORM])]
+
+    def test_only_reflected_tests_reach_browser(self):
+        """HTTP 로 전체 테스트, 반사된 것만 브라우저에서 실행"""
+        scanner, reported, tested = make_scanner()
+        results = scanner.scan_pages(self.pages, quick_mode=True)
+        self.assertEqual(results.total, 4 * 7)
+        self.assertEqual(len(tested), 2 * 7)
+        self.assertEqual(scanner.browser_tests, 14)
+        self.assertEqual({test[0] for test in tested}, {'url', 'form'})
+        self.assertTrue(all(test[2] == 'q' or test[2]['name'] == 'body' for test in tested))
+
+    def test_execution_evidence_merged(self):
+        """브라우저에서 실행된 후보는 executed=True + 증거, 나머지는 HTTP 판정 그대로"""
+        scanner, reported, _ = make_scanner()
+        results = scanner.scan_pages(self.pages, quick_mode=True)
+        executed = [r for r in results if r.executed]
+        self.assertEqual(len(executed), 2 * 2)  # <script>, <ScRiPt> x (q, body)
+        self.assertEqual(scanner.confirmed, 4)
+        self.assertTrue(all(r.vulnerable and r.console_output == 'Alert: 1' for r in executed))
+        self.assertFalse(any(r.executed for r in results if '<script' not in r.payload.lower()))
+        # 양성 결과마다 확인 후 한 번씩 보고
+        self.assertEqual(sorted(map(id, reported)), sorted(map(id, results)))
+        self.assertEqual(sum(r.executed for r in reported), 4)
+
+    def test_no_candidates_no_browser(self):
+        """반사된 테스트가 없으면 브라우저를 쓰지 않음"""
+        scanner, reported, tested = make_scanner()
+        results = scanner.scan_pages([PageInfo(url='http://a.com/s', params={'page': ''})], quick_mode=True)
+        self.assertEqual((results.total, len(results), tested, reported), (7, 0, [], []))
+        self.assertEqual(scanner.browser_tests, 0)
+
+    def test_browser_failure_keeps_http_results(self):
+        """브라우저를 시작할 수 없으면 HTTP 결과만 보고"""
+        scanner, reported, _ = make_scanner()
+        scanner.confirmer.pool = None
+        scanner.confirmer.session.factory = FailingBrowser
+        results = scanner.scan_pages(self.pages, quick_mode=True)
+        self.assertEqual(len(reported), 14)
+        self.assertEqual(len(results.vulnerable), 2)  # HTTP 판정 (q 의 스크립트 태그)
+        self.assertFalse(any(r.executed for r in results))
+
+    def test_journal_keeps_confirmation(self):
+        """확인 결과도 저널에 기록 -> 재개 시 실행이 확인된 테스트는 다시 열지 않음"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scan.jsonl')
+            scanner, _, _ = make_scanner()
+            with ScanJournal(path) as journal:
+                scanner.scan_pages(self.pages, quick_mode=True, journal=journal)
+            scanner, reported, tested = make_scanner()
+            with ScanJournal(path) as journal:
+                results = scanner.scan_pages(self.pages, quick_mode=True, journal=journal)
+        self.assertEqual(len(tested), 14 - 4)
+        self.assertEqual(len([r for r in results if r.executed]), 4)
+        self.assertEqual(len(reported), 14)
+
+
+@unittest.skipUnless(SELENIUM_AVAILABLE, "selenium 미설치")
+class TestBrowserTest(unittest.TestCase):
+    """HTTP 작업 -> 브라우저 테스트 변환"""
+
+    def test_url_and_form(self):
+        url_task = (task_key('url', 'get', 'http://a.com/s', 'q', 'p'), None, ('http://a.com/s', 'q', 'p'))
+        self.assertEqual(browser_test(url_task), ('url', 'http://a.com/s', 'q', None, 'p'))
+        field = FORM['inputs'][1]
+        form_task = (task_key('form', 'post', FORM['action'], 'body', 'p'), None, (FORM, 'p', field))
+        self.assertEqual(browser_test(form_task), ('form', FORM['action'], field, FORM, 'p'))
+
+
+if __name__ == '__main__':
+    unittest.main()
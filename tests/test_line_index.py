@@ -0,0 +1,73 @@
+"""
+================================================================================
+XSS Scanner - 줄 번호 색인 테스트 (test_line_index.py)
+================================================================================
+
+line_index.py의 문자 위치 -> 줄/열 번호 변환을 테스트합니다.
+
+실행:
+    python -m pytest tests/test_line_index.py -v
+    python tests/test_line_index.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from line_index import LineIndex
+from xss_engine import XSSScanner
+
+
+class TestLineIndex(unittest.TestCase):
+    """줄 번호 색인 테스트"""
+
+    def test_matches_naive_count(self):
+        """모든 위치에서 앞쪽 줄바꿈 수 + 1 과 같음"""
+        text = 'a\nbc\n\nd\n'
+        index = LineIndex(text)
+        for offset in range(len(text) + 1):
+            self.assertEqual(index.line_of(offset), text.count('\n', 0, offset) + 1, offset)
+        self.assertEqual(index.line_count, 5)
+
+    def test_line_col(self):
+        """줄 번호와 열 번호 (1부터)"""
+        index = LineIndex('first\nsecond')
+        self.assertEqual(index.line_col(0), (1, 1))
+        self.assertEqual(index.line_col(5), (1, 6))   # 줄바꿈 문자는 앞 줄
+        self.assertEqual(index.line_col(8), (2, 3))
+        self.assertEqual(index.line_start(2), 6)
+
+    def test_no_newline(self):
+        """줄바꿈 없는 문서는 모두 1번 줄"""
+        index = LineIndex('<html></html>')
+        self.assertEqual(index.line_of(10), 1)
+
+
+class TestStoredXSSLineNumbers(unittest.TestCase):
+    """저장된 XSS 결과의 줄 번호 테스트"""
+
+    def setUp(self):
+        self.scanner = XSSScanner(threads=1)
+
+    def test_line_from_match_position(self):
+        """앞 30자가 같은 다른 매치도 각자 시작된 줄을 보고"""
+        html = ('<img src=x alt="0123456789abcdefghij" onerror=a()>\n\n'
+                '<img src=x alt="0123456789abcdefghij" title="t" onerror=b()>')
+        results = self.scanner.analyze_stored_xss('http://a.com/', html)
+        lines = [r.line_number for r in results if r.pattern_name == 'img onerror XSS']
+        self.assertEqual(lines, [1, 3])
+
+    def test_table_match_has_line(self):
+        """셀 단위 패턴도 줄 번호 보고"""
+        html = '<table>\n<tr>\n<td><script>alert(1)</script></td>\n</tr>\n</table>'
+        results = self.scanner.analyze_stored_xss('http://a.com/', html)
+        by_name = {r.pattern_name: r.line_number for r in results}
+        self.assertEqual(by_name['테이블 셀 내 스크립트'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,201 @@
+"""
+================================================================================
+XSS Scanner - 페이지 본문 캐시 테스트 (test_page_cache.py)
+================================================================================
+
+page_cache.py의 메모리 상한, 디스크 보관, 크롤링 본문 재사용과
+저장된 XSS 분석 단계의 병렬 처리를 테스트합니다.
+(네트워크 사용 안 함)
+
+실행:
+    python -m pytest tests/test_page_cache.py -v
+    python tests/test_page_cache.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import time
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page_cache import PageCache
+from http_transport import HttpTransport
+from xss_engine import PageInfo, SiteCrawler, XSSScanner
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+        self.status_code = 200
+        self.headers = {'Content-Type': 'text/html; charset=utf-8'}
+
+
+class TestPageCache(unittest.TestCase):
+    """본문 캐시 테스트"""
+
+    def test_put_get(self):
+        """저장한 본문을 그대로 반환, 없으면 None"""
+        cache = PageCache()
+        cache.put('http://a.com/', '<p>안녕</p>')
+        self.assertEqual(cache.get('http://a.com/'), '<p>안녕</p>')
+        self.assertIsNone(cache.get('http://a.com/none'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_spill_to_disk(self):
+        """메모리 상한을 넘으면 오래된 본문을 디스크로 내보내고 그대로 읽음"""
+        cache = PageCache(max_bytes=100)
+        for i in range(5):
+            cache.put(f'http://a.com/{i}', str(i) * 60)
+        self.assertLessEqual(cache.memory_bytes, 100)
+        self.assertEqual(cache.spilled, 4)
+        self.assertEqual(len(cache), 5)
+        self.assertEqual(cache.get('http://a.com/0'), '0' * 60)
+
+        spill_dir = cache._dir
+        self.assertTrue(os.path.isdir(spill_dir))
+        cache.close()
+        self.assertFalse(os.path.exists(spill_dir))
+        self.assertEqual(len(cache), 0)
+
+    def test_no_spill_drops(self):
+        """spill=False 면 상한을 넘은 본문은 버림"""
+        cache = PageCache(max_bytes=100, spill=False)
+        cache.put('http://a.com/1', 'x' * 80)
+        cache.put('http://a.com/2', 'y' * 80)
+        self.assertIsNone(cache.get('http://a.com/1'))
+        self.assertEqual(cache.get('http://a.com/2'), 'y' * 80)
+
+    def test_pop_removes(self):
+        """pop 은 꺼낸 본문을 메모리/디스크에서 제거"""
+        cache = PageCache(max_bytes=10)
+        cache.put('http://a.com/1', 'a' * 20)
+        cache.put('http://a.com/2', 'b' * 5)
+        self.assertEqual(cache.pop('http://a.com/1'), 'a' * 20)
+        self.assertNotIn('http://a.com/1', cache)
+        self.assertEqual(os.listdir(cache._dir), [])
+        self.assertEqual(cache.pop('http://a.com/2'), 'b' * 5)
+        self.assertEqual(cache.memory_bytes, 0)
+        cache.close()
+
+
+class TestContentPhase(unittest.TestCase):
+    """저장된 XSS 분석 단계 테스트 (본문 재사용, 병렬 처리)"""
+
+    def test_content_phase_makes_no_requests(self):
+        """크롤링한 페이지는 분석 단계에서 다시 요청하지 않음"""
+        site = {
+            'http://a.com': '<a href="/board">board</a>',
+            'http://a.com/board': '<td><img src=x onerror=alert(1)></td>',
+        }
+        requests_made = []
+
+        def fake_get(url, **kwargs):
+            requests_made.append(url)
+            return FakeResponse(site.get(url, ''))
+
+        transport = HttpTransport(pool_size=1)
+        transport.session.get = fake_get
+        crawler = SiteCrawler('http://a.com', delay=0, transport=transport)
+        pages = crawler.crawl()
+        self.assertEqual(len(requests_made), 2)
+
+        scanner = XSSScanner(threads=1, transport=transport)
+        results = scanner.scan_page_content(pages)
+        self.assertEqual(len(requests_made), 2)
+        self.assertIn('img onerror XSS', {r.pattern_name for r in results})
+
+    def test_missing_body_refetched(self):
+        """캐시에 없는 페이지는 다시 요청"""
+        requests_made = []
+
+        def fake_get(url, **kwargs):
+            requests_made.append(url)
+            return FakeResponse('<p>ok</p>')
+
+        scanner = XSSScanner(threads=1)
+        scanner.session.get = fake_get
+        scanner.scan_page_content([PageInfo('http://a.com/x')])
+        self.assertEqual(requests_made, ['http://a.com/x'])
+
+
+    def _pages(self, count, delay=0.0):
+        """앞쪽 페이지일수록 응답이 늦은 가짜 사이트"""
+        def fake_get(url, **kwargs):
+            index = int(url.rsplit('/', 1)[1])
+            time.sleep(delay * (count - index))
+            return FakeResponse(f'<p>{index}</p><img src=x onerror=alert({index})>')
+        pages = [PageInfo(f'http://a.com/{i}') for i in range(count)]
+        return pages, fake_get
+
+    def test_results_in_page_order(self):
+        """완료 순서와 관계없이 결과는 페이지 순서"""
+        pages, fake_get = self._pages(8, delay=0.01)
+        scanner = XSSScanner(threads=8, analysis_workers=1)
+        scanner.session.get = fake_get
+        progress = []
+
+        def callback(message, level, data=None):
+            if level == 'content_progress':
+                progress.append(data)
+        scanner.callback = callback
+        results = scanner.scan_page_content(pages)
+        self.assertEqual([r.url for r in results if r.pattern_name == 'img onerror XSS'],
+                         [page.url for page in pages])
+        self.assertEqual(progress[-1], 100)
+        self.assertEqual(len(progress), len(pages))
+
+    def test_process_pool_analysis(self):
+        """페이지가 많으면 프로세스 풀에서 분석해도 결과가 같음"""
+        pages, fake_get = self._pages(20)
+        scanner = XSSScanner(threads=4, analysis_workers=2)
+        scanner.session.get = fake_get
+        pool = scanner._analysis_pool(len(pages))
+        self.assertIsNotNone(pool)
+        pool.shutdown()
+        results = scanner.scan_page_content(pages)
+        expected = []
+        for page in pages:
+            expected.extend(scanner.analyze_stored_xss(page.url, fake_get(page.url).text))
+        self.assertEqual(results, expected)
+
+    def test_stop_during_content_phase(self):
+        """중지하면 남은 페이지를 분석하지 않고 반환"""
+        pages, fake_get = self._pages(30, delay=0.005)
+        scanner = XSSScanner(threads=2, analysis_workers=1)
+        scanner.session.get = fake_get
+
+        def callback(message, level, data=None):
+            if level == 'content_progress':
+                scanner.stop_flag = True
+        scanner.callback = callback
+        results = scanner.scan_page_content(pages)
+        self.assertLess(len({r.url for r in results}), len(pages))
+
+    def test_page_error_skips_only_that_page(self):
+        """한 페이지의 가져오기/DOM/분석 오류는 그 페이지만 건너뛰고 계속"""
+        pages, fake_get = self._pages(4)
+        for mode, method in (('regex', '_page_plan'), ('dom', '_dom_analysis'), ('regex', '_analyze_body')):
+            with self.subTest(method=method):
+                scanner = XSSScanner(threads=1, analysis_workers=1, content_analysis=mode)
+                scanner.session.get = fake_get
+                original = getattr(scanner, method)
+                calls = []
+
+                def failing(*args, original=original, calls=calls):
+                    calls.append(args)
+                    if len(calls) == 2:
+                        raise RuntimeError("block_memo.plan 실패")
+                    return original(*args)
+
+                setattr(scanner, method, failing)
+                logs = []
+                scanner.callback = lambda message, level, data=None: logs.append(message or '')
+                results = scanner.scan_page_content(pages)
+                self.assertEqual(len({r.url for r in results}), len(pages) - 1)
+                self.assertTrue(any('분석 오류' in line for line in logs))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
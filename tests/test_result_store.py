@@ -0,0 +1,141 @@
+"""
+================================================================================
+XSS Scanner - 결과 저장소 테스트 (test_result_store.py)
+================================================================================
+
+result_store.py의 양성 레코드 보관과 음성 결과 집계,
+저장된 XSS 결과 색인을 테스트합니다.
+
+실행:
+    python -m pytest tests/test_result_store.py -v
+    python tests/test_result_store.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from result_store import ResultStore, ResultRecord, FindingIndex
+
+
+@dataclass
+class ScanResult:
+    """엔진의 ScanResult 와 같은 형태 (requests 엔진 필드)"""
+    url: str
+    parameter: str
+    payload: str
+    reflected: bool
+    vulnerable: bool
+    response_snippet: Optional[str] = None
+    status_code: int = 0
+
+
+@dataclass
+class StoredXSSResult:
+    """엔진의 StoredXSSResult 와 같은 형태"""
+    url: str
+    pattern_name: str
+    matched_content: str
+    line_number: int = 0
+
+
+class TestResultStore(unittest.TestCase):
+    """결과 저장소 테스트"""
+
+    def setUp(self):
+        self.store = ResultStore()
+
+    def test_negative_not_kept(self):
+        """음성 결과는 레코드로 보관하지 않음"""
+        for i in range(100):
+            self.store.add(ScanResult(f"http://a/s?q=p{i}", 'q', f'p{i}', False, False, None, 200))
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store.total, 100)
+        self.assertEqual(len(self.store.endpoints), 1)
+
+    def test_positive_record(self):
+        """양성 결과는 __slots__ 레코드로 보관"""
+        record = self.store.add(ScanResult("http://a/s?q=x", 'q', '<b>', True, True, '...<b>...', 200))
+        self.assertIsInstance(record, ResultRecord)
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(self.store.vulnerable, [record])
+        self.assertEqual(record.to_dict()['payload'], '<b>')
+
+    def test_reflected_excludes_vulnerable(self):
+        """reflected 목록은 취약 결과를 제외"""
+        self.store.add(ScanResult("http://a/s", 'q', 'a', True, True))
+        self.store.add(ScanResult("http://a/s", 'q', 'b', True, False))
+        self.assertEqual([r.payload for r in self.store.reflected], ['b'])
+
+    def test_payload_interning(self):
+        """같은 페이로드는 하나의 ID 로 보관"""
+        self.assertEqual(self.store.payload_id('<x>'), self.store.payload_id('<x>'))
+        self.store.add(ScanResult("http://a/s?q=1", 'q', '<x>', False, False))
+        self.store.add(ScanResult("http://b/s?q=1", 'q', '<x>', False, False))
+        self.assertEqual(self.store.negative_payloads("http://b/s", 'q'), ['<x>'])
+
+    def test_errors_counted(self):
+        """오류 결과는 엔드포인트별로 집계"""
+        self.store.add(ScanResult("http://a/s", 'q', 'a', False, False, "Error: timeout"))
+        self.store.add(ScanResult("http://a/s", 'q', 'b', False, False))
+        self.assertEqual(self.store.errors, 1)
+        stats = self.store.stats()
+        self.assertEqual(stats['tests'], 2)
+        self.assertEqual(stats['endpoints'], 1)
+
+    def test_merge(self):
+        """다른 저장소 병합 시 집계와 페이로드 ID 재매핑"""
+        other = ResultStore()
+        other.payload_id('only-in-other')
+        other.add(ScanResult("http://b/s", 'q', '<x>', False, False))
+        other.add(ScanResult("http://b/s", 'q', '<y>', True, False))
+        self.store.add(ScanResult("http://a/s", 'q', '<x>', False, False))
+        self.store.merge(other)
+        self.assertEqual(self.store.total, 3)
+        self.assertEqual(len(self.store.reflected), 1)
+        self.assertEqual(self.store.negative_payloads("http://b/s", 'q'), ['<x>'])
+
+    def test_none_ignored(self):
+        """중단된 작업(None)은 무시"""
+        self.assertIsNone(self.store.add(None))
+        self.assertEqual(self.store.total, 0)
+
+
+class TestFindingIndex(unittest.TestCase):
+    """저장된 XSS 결과 색인 테스트"""
+
+    def test_repeated_finding_collapsed(self):
+        """N개 페이지에 반복된 같은 결과는 발생 횟수가 있는 항목 하나"""
+        results = [StoredXSSResult(f"http://a/p{i}", 'onclick 이벤트', 'onclick=', 3) for i in range(50)]
+        results.append(StoredXSSResult("http://a/p0", 'img onerror XSS', '<img onerror=', 7))
+        index = FindingIndex(results)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.occurrences, 51)
+        finding = index.get('onclick 이벤트', 'onclick=')
+        self.assertEqual(finding.count, 50)
+        self.assertEqual(finding.first.url, "http://a/p0")
+        self.assertEqual([f.matched_content for f in index.repeated()], ['onclick='])
+
+    def test_same_page_counted_once(self):
+        """같은 페이지의 같은 결과는 한 번만 셈"""
+        index = FindingIndex()
+        self.assertTrue(index.add(StoredXSSResult("http://a/", 'x', 'y', 1)))
+        self.assertFalse(index.add(StoredXSSResult("http://a/", 'x', 'y', 9)))
+        self.assertEqual(index.occurrences, 1)
+        self.assertEqual(index.to_list(), [{'pattern_name': 'x', 'matched_content': 'y', 'count': 1, 'urls': ["http://a/"]}])
+
+    def test_pattern_is_part_of_key(self):
+        """내용이 같아도 패턴이 다르면 다른 결과"""
+        index = FindingIndex([StoredXSSResult("http://a/", 'x', 'y'), StoredXSSResult("http://a/", 'z', 'y')])
+        self.assertEqual(len(index), 2)
+        self.assertIn(StoredXSSResult("http://b/", 'z', 'y'), index)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
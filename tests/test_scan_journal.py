@@ -0,0 +1,117 @@
+"""
+================================================================================
+XSS Scanner - 스캔 저널 테스트 (test_scan_journal.py)
+================================================================================
+
+scan_journal.py의 기록/복원과 재개 동작을 테스트합니다.
+
+실행:
+    python -m pytest tests/test_scan_journal.py -v
+    python tests/test_scan_journal.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scan_journal import ScanJournal, task_key, payload_id
+
+
+@dataclass
+class ScanResult:
+    url: str
+    parameter: str
+    payload: str
+    reflected: bool
+    vulnerable: bool
+    response_snippet: Optional[str] = None
+    status_code: int = 0
+
+
+@dataclass
+class PageInfo:
+    url: str
+    forms: List[Dict] = field(default_factory=list)
+    params: Dict = field(default_factory=dict)
+    links: Set[str] = field(default_factory=set)
+
+
+class TestScanJournal(unittest.TestCase):
+    """스캔 저널 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'sub', 'scan.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_payload_id_stable(self):
+        """페이로드 ID 는 실행 간 동일"""
+        self.assertEqual(payload_id('<x>'), payload_id('<x>'))
+        self.assertNotEqual(payload_id('<x>'), payload_id('<y>'))
+        self.assertEqual(len(payload_id('<x>')), 12)
+
+    def test_record_and_load(self):
+        """기록한 결과를 다시 읽음"""
+        key = task_key('url', 'GET', 'http://a/s', 'q', '<b>')
+        with ScanJournal(self.path) as journal:
+            journal.record(key, ScanResult('http://a/s?q=%3Cb%3E', 'q', '<b>', True, False, '..<b>..', 200))
+
+        restored = ScanJournal(self.path).load()
+        self.assertIn(key, restored)
+        self.assertTrue(restored[key].reflected)
+        self.assertEqual(restored[key].response_snippet, '..<b>..')
+        self.assertEqual(restored[key].status_code, 200)
+
+    def test_errors_not_recorded(self):
+        """요청 오류는 재시도를 위해 기록하지 않음"""
+        key = task_key('form', 'post', 'http://a/f', 'name', '<b>')
+        with ScanJournal(self.path) as journal:
+            journal.record(key, ScanResult('http://a/f', 'name', '<b>', False, False, 'Error: timeout'))
+        self.assertEqual(ScanJournal(self.path).load(), {})
+
+    def test_truncated_line_ignored(self):
+        """크래시로 잘린 줄은 무시"""
+        key = task_key('url', 'get', 'http://a/s', 'q', 'p')
+        with ScanJournal(self.path) as journal:
+            journal.record(key, ScanResult('http://a/s', 'q', 'p', False, False))
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"t": "test", "k": ')
+        self.assertEqual(list(ScanJournal(self.path).load()), [key])
+
+    def test_pages_roundtrip(self):
+        """페이지 목록 저장/복원"""
+        pages = [PageInfo('http://a/', forms=[{'action': 'http://a/f', 'method': 'post', 'inputs': []}],
+                          params={'q': ['1']}, links={'http://a/b', 'http://a/c'})]
+        with ScanJournal(self.path) as journal:
+            journal.record_pages(pages)
+        loaded = ScanJournal(self.path).load_pages()
+        self.assertEqual(loaded[0]['url'], 'http://a/')
+        self.assertEqual(loaded[0]['links'], ['http://a/b', 'http://a/c'])
+        self.assertEqual(loaded[0]['params'], {'q': ['1']})
+
+    def test_plan_roundtrip(self):
+        """처음 기록한 테스트 목록과 빠른 스캔 여부 복원 (없으면 None)"""
+        self.assertIsNone(ScanJournal(self.path).load_plan())
+        keys = [task_key('url', 'get', 'http://a/s', 'q', p) for p in ('<b>', '<i>')]
+        with ScanJournal(self.path) as journal:
+            journal.record_plan(keys, True)
+            journal.record(keys[0], ScanResult('http://a/s', 'q', '<b>', False, False))
+        self.assertEqual(ScanJournal(self.path).load_plan(), (True, keys))
+
+    def test_no_pages(self):
+        """페이지 기록이 없으면 None"""
+        self.assertIsNone(ScanJournal(self.path).load_pages())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,117 @@
+"""
+================================================================================
+XSS Scanner - 스캔 계획 테스트 (test_scan_planner.py)
+================================================================================
+
+scan_planner.py의 시간 추정, 예산에 따른 페이로드 선택, 기대 수익 순서를 테스트합니다.
+
+실행:
+    python -m pytest tests/test_scan_planner.py -v
+    python tests/test_scan_planner.py
+================================================================================
+"""
+
+import unittest
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scan_planner import DEFAULT_LATENCY, estimate_seconds, measure_latency, plan_scan
+from xss_engine import PageInfo, XSSScanner, XSS_PAYLOADS_QUICK, XSS_PAYLOADS_FULL
+
+
+QUICK = ['q1', 'q2']
+FULL = ['q1', 'q2', 'f1', 'f2', 'f3']
+
+
+def make_pages():
+    return [
+        PageInfo('http://a/search?q=1&sort=asc', params={'q': ['1'], 'sort': ['asc']}),
+        PageInfo('http://a/login', forms=[{
+            'action': 'http://a/login', 'method': 'post',
+            'inputs': [{'name': 'csrf', 'type': 'hidden', 'value': 'x'},
+                       {'name': 'comment', 'type': 'text', 'value': ''}],
+        }]),
+    ]
+
+
+class TestEstimate(unittest.TestCase):
+    """시간 추정 테스트"""
+
+    def test_estimate_rounds(self):
+        """동시 실행 라운드 수 x 지연"""
+        self.assertEqual(estimate_seconds(40, 0.5, 20), 1.0)
+        self.assertEqual(estimate_seconds(41, 0.5, 20), 1.5)
+        self.assertEqual(estimate_seconds(3, 1.0, 0), 3.0)
+
+    def test_measure_latency_fallback(self):
+        """측정이 모두 실패하면 기본 지연"""
+        def fetch(url):
+            raise IOError("down")
+        self.assertEqual(measure_latency(fetch, ['http://a/']), DEFAULT_LATENCY)
+
+
+class TestPlanScan(unittest.TestCase):
+    """예산 기반 계획 테스트"""
+
+    def test_no_budget_quick(self):
+        """예산이 없으면 모든 엔드포인트에 빠른 페이로드"""
+        plan = plan_scan(make_pages(), QUICK, FULL)
+        self.assertEqual(len(plan.endpoints), 4)
+        self.assertEqual(plan.test_count, 4 * len(QUICK))
+        self.assertFalse(plan.dropped)
+
+    def test_no_budget_full(self):
+        """예산이 없고 full 이면 전체 페이로드"""
+        plan = plan_scan(make_pages(), QUICK, FULL, full=True)
+        self.assertEqual(plan.test_count, 4 * len(FULL))
+
+    def test_budget_upgrades_best_endpoints(self):
+        """남은 예산으로 점수가 높은 엔드포인트부터 전체 페이로드"""
+        # 빠른 스캔 8개 + 확장 1회(3개) = 11개까지 허용
+        plan = plan_scan(make_pages(), QUICK, FULL, latency=1.0, concurrency=1, budget=11)
+        full = [e for e in plan.endpoints if e.full]
+        self.assertEqual(len(full), 1)
+        self.assertEqual(full[0].parameter, 'q')
+        self.assertLessEqual(plan.estimated_seconds, 11)
+
+    def test_budget_drops_low_yield(self):
+        """빠른 스캔도 예산을 넘으면 점수가 낮은 엔드포인트 제외"""
+        plan = plan_scan(make_pages(), QUICK, FULL, latency=1.0, concurrency=1, budget=4)
+        self.assertEqual(len(plan.endpoints), 2)
+        self.assertIn('csrf', [e.parameter for e in plan.dropped])
+        self.assertLessEqual(plan.estimated_seconds, 4)
+
+    def test_tests_ordered_by_yield(self):
+        """첫 테스트는 점수가 가장 높은 엔드포인트의 첫 페이로드"""
+        tests = plan_scan(make_pages(), QUICK, FULL).tests()
+        self.assertEqual((tests[0].endpoint.parameter, tests[0].payload), ('q', 'q1'))
+        self.assertEqual(tests[-1].endpoint.parameter, 'csrf')
+        values = [t.value for t in tests]
+        self.assertEqual(values, sorted(values, reverse=True))
+
+
+class TestScannerPlan(unittest.TestCase):
+    """Requests 엔진 계획 연동 테스트 (네트워크 사용 안 함)"""
+
+    def test_plan_tasks_follow_plan(self):
+        """계획이 주어지면 계획의 테스트 수와 순서대로 실행"""
+        scanner = XSSScanner(threads=1)
+        calls = []
+        scanner.scan_url_param = lambda url, param, payload: calls.append((param, payload))
+        scanner.scan_form = lambda form, payload, field: calls.append((field['name'], payload))
+
+        plan = scanner.plan(make_pages(), quick_mode=True, latency=0.1)
+        self.assertEqual(plan.test_count, 4 * len(XSS_PAYLOADS_QUICK))
+        scanner.scan_pages(make_pages(), plan=plan)
+        self.assertEqual(len(calls), plan.test_count)
+        self.assertEqual(calls[0], ('q', XSS_PAYLOADS_QUICK[0]))
+
+        full_plan = scanner.plan(make_pages(), quick_mode=False, latency=0.1)
+        self.assertEqual(full_plan.test_count, 4 * len(XSS_PAYLOADS_FULL))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,196 @@
+"""
+================================================================================
+XSS Scanner - 저장된 XSS 패턴 매처 테스트 (test_stored_xss.py)
+================================================================================
+
+stored_xss.py의 단일 스캔 결과가 패턴별 re.finditer 결과와 같은지,
+사전 필터와 안전한 스크립트 제외, 적대적 입력에서의 처리 시간을 테스트합니다.
+
+실행:
+    python -m pytest tests/test_stored_xss.py -v
+    python tests/test_stored_xss.py
+================================================================================
+"""
+
+import unittest
+import random
+import re
+import sys
+import os
+import time
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stored_xss import (
+    StoredXSSMatcher, STORED_XSS_MATCHER, STORED_XSS_PATTERNS, TABLE_XSS_PATTERNS,
+    SAFE_SCRIPT_PATTERNS, FLAGS, compile_pattern, re2
+)
+from xss_engine import XSSScanner, PageInfo
+
+
+def reference_find(html):
+    """기존 방식: re.sub 로 안전한 스크립트 치환 후 패턴별 finditer"""
+    cleaned = html
+    for safe in SAFE_SCRIPT_PATTERNS:
+        cleaned = re.sub(safe, '[SAFE_EXTERNAL_SCRIPT]', cleaned, flags=re.IGNORECASE)
+    found = []
+    for pattern, name in STORED_XSS_PATTERNS:
+        for m in re.finditer(pattern, cleaned, FLAGS):
+            if '[SAFE_EXTERNAL_SCRIPT]' not in m.group(0):
+                found.append((name, m.group(0)))
+    for pattern, name in TABLE_XSS_PATTERNS:
+        for m in re.finditer(pattern, html, FLAGS):
+            found.append((name, m.group(0)))
+    return found
+
+
+FRAGMENTS = [
+    '<script>alert(1)</script>', '<SCRIPT>document.cookie</SCRIPT>', '<script>eval(x)',
+    '<img src=x onerror=alert(1)>', '<img src="a.png" onload=f()>', '<svg onload=go()>',
+    '<td>', '</td>', '<th class="a">', '<li>', '</li>', '<a href="javascript:void(0)">',
+    '<iframe src="//evil">', '<iframe src="https://ok">', 'XSS_TEST', 'xss-success',
+    '<div onclick=x() onmouseover=y()>', '<script src="https://code.jquery.com/j.js"></script>',
+    '<script src="https://unpkg.com/a.js">alert(2)</script>', 'window.location', 'text ',
+    '\n', '<p>', '</p>', 'console.log(1)', '<input onfocus=z()>', '<body onload=init()>',
+]
+
+
+class TestStoredXSSMatcher(unittest.TestCase):
+    """단일 스캔 매처 테스트"""
+
+    def test_equivalent_to_per_pattern_finditer(self):
+        """무작위 문서에서 기존 방식과 같은 (패턴, 매치) 목록"""
+        rng = random.Random(7)
+        for _ in range(300):
+            html = ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 30)))
+            found = [(m.name, m.text) for m in STORED_XSS_MATCHER.find(html)]
+            self.assertEqual(found, reference_find(html), html)
+
+    def test_named_patterns(self):
+        """매치마다 패턴 이름과 위치 보고"""
+        html = '<p>hi</p><img src=x onerror=alert(1)>'
+        names = {m.name for m in STORED_XSS_MATCHER.find(html)}
+        self.assertIn('img onerror XSS', names)
+        self.assertIn('깨진 이미지 XSS', names)
+        match = STORED_XSS_MATCHER.find(html)[0]
+        self.assertEqual(html[match.start:match.end], match.text)
+
+    def test_safe_cdn_script_excluded(self):
+        """안전한 CDN 스크립트는 매치로 보지 않음"""
+        html = '<script src="https://cdnjs.cloudflare.com/x.js"></script><script>alert(1)</script>'
+        texts = [m.text for m in STORED_XSS_MATCHER.find(html) if m.name == 'alert() 스크립트']
+        self.assertEqual(texts, ['<script>alert('])
+
+    def test_prefilter_skips_absent_literals(self):
+        """리터럴이 없는 패턴은 검사 대상에서 제외"""
+        matcher = StoredXSSMatcher()
+        limits = matcher.start_limits('<p>plain text only</p>')
+        self.assertEqual(limits, {})
+        self.assertEqual(matcher.find('<p>plain text only</p>'), [])
+
+        limits = matcher.start_limits('<b onclick=x()>')
+        names = {matcher.patterns[i].name for i in limits}
+        self.assertEqual(names, {'onclick 이벤트'})
+
+    def test_large_page_linear(self):
+        """큰 게시판 페이지도 빠르게 처리 (셀 패턴 재스캔 없음)"""
+        row = '<tr><td>1</td><td><a href="/view?id=1">글 제목</a></td><td>작성자</td></tr>\n'
+        html = '<table>' + row * 3000 + '<tr><td><script>alert(1)</script></td></tr></table>'
+        started = time.perf_counter()
+        matches = STORED_XSS_MATCHER.find(html)
+        self.assertLess(time.perf_counter() - started, 2.0)
+        self.assertIn('테이블 셀 내 스크립트', {m.name for m in matches})
+
+
+# 백트래킹을 유발하는 입력 (이름, 문서)
+N = 100_000
+PATHOLOGICAL = [
+    ('닫히지 않은 태그', '<a ' * (N // 3) + ' onerror='),
+    ('중첩된 <', '<a<a' * (N // 4) + ' onclick=x'),
+    ('닫히지 않은 셀', '<td>' * (N // 4) + '<script></script></td>'),
+    ('셀 안 스크립트 쌍', '<td>' + '<script></script>' * (N // 17)),
+    ('목록 연쇄', '<li><script>' * (N // 12) + '</script>'),
+    ('alert 없는 스크립트', '<script>' * (N // 8) + 'alert('),
+    ('반복 src 속성', '<img ' + 'src=x ' * (N // 6) + 'onerror'),
+    ('긴 공백', '<img src' + ' ' * N + '=x onerror'),
+    ('XSS 반복', 'XSS_' * (N // 4)),
+    ('셀 onerror 반복', '<td onerror' * (N // 11)),
+]
+
+
+class TestPathologicalInputs(unittest.TestCase):
+    """ReDoS 방지 테스트"""
+
+    def test_corpus_finishes_quickly(self):
+        """적대적 입력도 시작 위치당 작업량이 제한되어 빠르게 끝남"""
+        for name, html in PATHOLOGICAL:
+            started = time.perf_counter()
+            STORED_XSS_MATCHER.scan(html)
+            self.assertLess(time.perf_counter() - started, 3.0, name)
+
+    def test_budget_marks_partial(self):
+        """시간 예산을 넘기면 멈추고 partial 로 보고"""
+        html = '<td onerror' * 100_000
+        started = time.perf_counter()
+        report = STORED_XSS_MATCHER.scan(html, budget=0.05)
+        self.assertTrue(report.partial)
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertFalse(STORED_XSS_MATCHER.scan('<img src=x onerror=a()>', budget=5).partial)
+
+    def test_standard_backend_bounded(self):
+        """표준 re 패턴은 반복 상한과 원자적 구간으로 변환"""
+        regex, backend, reach = compile_pattern(TABLE_XSS_PATTERNS[0][0], table=True, use_re2=False)
+        self.assertEqual(backend, 're')
+        self.assertIsNotNone(reach)
+        self.assertNotIn('*', regex.pattern)
+        self.assertIn('(?P=a0)', regex.pattern)
+        self.assertEqual(StoredXSSMatcher(use_re2=False).backend, 're')
+
+    @unittest.skipIf(re2 is None, "re2 미설치")
+    def test_re2_backend_equivalent(self):
+        """re2 백엔드도 같은 패턴을 탐지 (전방탐색 패턴은 표준 re)"""
+        matcher = StoredXSSMatcher()
+        self.assertEqual(matcher.backend, 're2')
+        rng = random.Random(11)
+        for _ in range(100):
+            html = ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 30)))
+            found = [(m.name, m.text) for m in matcher.find(html)]
+            self.assertEqual(found, reference_find(html), html)
+
+
+class TestAnalyzeStoredXSS(unittest.TestCase):
+    """XSSScanner.analyze_stored_xss 연동 테스트"""
+
+    def test_dedup_by_content(self):
+        """같은 내용은 한 번만 보고"""
+        scanner = XSSScanner(threads=1)
+        html = '<img src=x onerror=alert(1)>\n<img src=x onerror=alert(1)>'
+        results = scanner.analyze_stored_xss('http://a.com/', html)
+        contents = [r.matched_content for r in results]
+        self.assertEqual(len(contents), len(set(contents)))
+        self.assertEqual(results[0].line_number, 1)
+
+    def test_partial_page_recorded(self):
+        """시간 예산을 넘긴 페이지는 partial_pages 에 기록하고 결과에 표시"""
+        scanner = XSSScanner(threads=1, analysis_budget=0)
+        results = scanner.analyze_stored_xss('http://a.com/big', '<img src=x onerror=alert(1)>' * 200)
+        self.assertEqual(scanner.partial_pages, ['http://a.com/big'])
+        self.assertTrue(all(r.partial for r in results))
+        scanner.analyze_stored_xss('http://a.com/small', '<p>hi</p>')
+        self.assertEqual(scanner.partial_pages, ['http://a.com/big'])
+
+    def test_repeated_layout_indexed_once(self):
+        """여러 페이지에 반복된 같은 결과는 stored_index 에서 한 항목"""
+        scanner = XSSScanner(threads=2, analysis_workers=1)
+        pages = [PageInfo(f'http://a.com/p{i}') for i in range(5)]
+        for page in pages:
+            scanner.transport.page_cache.put(page.url, '<div onclick=menu()>메뉴</div>')
+        results = scanner.scan_page_content(pages)
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(scanner.stored_index), 1)
+        self.assertEqual(next(iter(scanner.stored_index)).count, 5)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
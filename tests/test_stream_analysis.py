@@ -0,0 +1,116 @@
+"""
+================================================================================
+XSS Scanner - 큰 페이지 창 단위 분석 테스트 (test_stream_analysis.py)
+================================================================================
+
+stream_analysis.py의 겹치는 창 분석이 문서 전체 분석과 같은 결과(줄 번호 포함)를
+내는지, 본문 캐시 파일(mmap) 분석과 스캐너 연동을 테스트합니다.
+
+실행:
+    python -m pytest tests/test_stream_analysis.py -v
+    python tests/test_stream_analysis.py
+================================================================================
+"""
+
+import unittest
+import random
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import xss_engine
+from page_cache import PageCache
+from stored_xss import analyze_document
+from stream_analysis import BodyFile, analyze_body_file, analyze_file, analyze_text, iter_byte_windows
+from xss_engine import XSSScanner, PageInfo
+from tests.test_stored_xss import FRAGMENTS
+
+
+def write_temp(data: bytes) -> str:
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        f.write(data)
+    return f.name
+
+
+class TestWindows(unittest.TestCase):
+    """창 분할 테스트"""
+
+    def test_utf8_boundaries(self):
+        """창 경계가 문자 중간에 오지 않고, 맡은 구간을 이으면 원문"""
+        text = '가나다 abc 라마바\n' * 50
+        owned = [window[begin:stop] for window, begin, stop in iter_byte_windows(text.encode('utf-8'), 7, overlap=5)]
+        self.assertEqual(''.join(owned), text)
+        self.assertNotIn('�', ''.join(owned))
+
+
+class TestStreamAnalysis(unittest.TestCase):
+    """창 단위 분석 결과 테스트"""
+
+    def test_equivalent_to_document(self):
+        """작은 창으로 나눠도 문서 전체 분석과 같은 결과 (줄 번호 포함)"""
+        rng = random.Random(5)
+        for _ in range(30):
+            html = ''.join(rng.choice(FRAGMENTS + ['한글 ', '\n']) for _ in range(rng.randint(0, 60)))
+            expected = analyze_document(html)
+            for chunk_size in (13, 200):
+                self.assertEqual(analyze_text(html, chunk_size=chunk_size), expected, (chunk_size, html))
+                path = write_temp(html.encode('utf-8'))
+                try:
+                    self.assertEqual(analyze_file(path, chunk_size=chunk_size), expected, (chunk_size, html))
+                finally:
+                    os.remove(path)
+
+    def test_match_across_window_edge(self):
+        """창 경계에 걸친 매치도 한 번만, 올바른 줄 번호로 보고"""
+        html = 'x\n' * 100 + '<img src=x onerror=alert(1)>' + '\ny' * 100
+        findings, partial = analyze_text(html, chunk_size=205)
+        self.assertFalse(partial)
+        self.assertEqual(findings, analyze_document(html)[0])
+        self.assertEqual(findings[0][2], 101)
+
+    def test_body_file_removed(self):
+        """본문 파일은 분석 후 삭제, 빈 파일도 처리"""
+        path = write_temp('<svg onload=x()>'.encode('utf-8'))
+        findings, _ = analyze_body_file(BodyFile(path))
+        self.assertEqual([name for name, _c, _l in findings][:1], ['svg onload XSS'])
+        self.assertFalse(os.path.exists(path))
+        path = write_temp(b'')
+        self.assertEqual(analyze_body_file(BodyFile(path)), ([], False))
+
+
+class TestLargeBodies(unittest.TestCase):
+    """본문 캐시/스캐너 연동 테스트"""
+
+    def test_large_body_goes_to_disk(self):
+        """large_bytes 보다 큰 본문은 바로 파일로, take_file 로 넘겨받음"""
+        cache = PageCache(large_bytes=100)
+        cache.put('http://a/big', 'x' * 200)
+        cache.put('http://a/small', 'y')
+        self.assertEqual(cache.memory_bytes, 1)
+        self.assertIsNone(cache.take_file('http://a/small'))
+        self.assertIsNone(cache.take_file('http://a/big', min_bytes=1000))
+        path = cache.take_file('http://a/big', min_bytes=100)
+        self.assertTrue(os.path.exists(path))
+        self.assertNotIn('http://a/big', cache)
+        os.remove(path)
+        cache.close()
+
+    def test_scanner_streams_large_page(self):
+        """크롤링한 큰 페이지는 파일에서 창 단위로 분석 (본문 전체를 읽지 않음)"""
+        scanner = XSSScanner(threads=1, analysis_workers=1)
+        scanner.transport.page_cache.large_bytes = 1000
+        html = '<p>row</p>\n' * 500 + '<img src=x onerror=alert(1)>'
+        scanner.transport.page_cache.put('http://a.com/report', html)
+        with mock.patch.object(xss_engine, 'STREAM_THRESHOLD', 1000), \
+                mock.patch.object(xss_engine, 'analyze_body_file', wraps=analyze_body_file) as streamed:
+            results = scanner.scan_page_content([PageInfo('http://a.com/report')])
+        self.assertEqual(streamed.call_count, 1)
+        self.assertIn(('img onerror XSS', 501), {(r.pattern_name, r.line_number) for r in results})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,12 +1,25 @@
-import requests
+import os
 import re
 import time
+import threading
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Set
+from typing import Optional, List, Dict, Set, Tuple, Union
 from collections import deque
+from functools import lru_cache
 from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor, as_completed  # 멀티스레딩 필수 모듈
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, Future, FIRST_COMPLETED  # 멀티스레딩 필수 모듈
+
+from result_store import ResultStore, ResultRecord, FindingIndex
+from scan_journal import ScanJournal, task_key
+from scan_planner import ScanPlan, measure_latency, plan_scan
+from http_resilience import BreakerRegistry, CircuitOpenError, CLOSED
+from http_transport import HttpTransport
+from stored_xss import STORED_XSS_PATTERNS, SAFE_SCRIPT_PATTERNS, ANALYSIS_BUDGET, analyze_document
+from dom_xss import analyze_tree, analyze_html
+from block_memo import BlockMemo, BlockPlan, analyze_blocks
+from stream_analysis import STREAM_THRESHOLD, BodyFile, analyze_body_file, analyze_text
+from findings_db import FindingsDB, PriorAnalysis, text_digest, file_digest
 
 # ============== XSS 페이로드 및 패턴 데이터 ==============
 
@@ -49,37 +62,112 @@ XSS_PAYLOADS_FULL = [
     '<script>alert`1`</script>',
 ]
 
-STORED_XSS_PATTERNS = [
-    (r'<script[^>]*>[\s\S]*?alert\s*\(', 'alert() 스크립트'),
-    (r'<script[^>]*>[\s\S]*?console\s*\.\s*log\s*\(', 'console.log() 스크립트'),
-    (r'<script[^>]*>[\s\S]*?document\s*\.\s*cookie', '쿠키 접근 스크립트'),
-    (r'<script[^>]*>[\s\S]*?document\s*\.\s*location', '리다이렉트 스크립트'),
-    (r'<script[^>]*>[\s\S]*?document\s*\.\s*write', 'document.write() 스크립트'),
-    (r'<script[^>]*>[\s\S]*?eval\s*\(', 'eval() 스크립트'),
-    (r'<script[^>]*>[\s\S]*?window\s*\.\s*location', 'window.location 스크립트'),
-    (r'<img[^>]*\sonerror\s*=', 'img onerror XSS'),
-    (r'<img[^>]*\sonload\s*=', 'img onload XSS'),
-    (r'<svg[^>]*\sonload\s*=', 'svg onload XSS'),
-    (r'<body[^>]*\sonload\s*=', 'body onload XSS'),
-    (r'<input[^>]*\sonfocus\s*=', 'input onfocus XSS'),
-    (r'<[a-z]+[^>]*\sonerror\s*=', 'onerror 이벤트'),
-    (r'<[a-z]+[^>]*\sonload\s*=', 'onload 이벤트'),
-    (r'<[a-z]+[^>]*\sonclick\s*=', 'onclick 이벤트'),
-    (r'<[a-z]+[^>]*\sonmouseover\s*=', 'onmouseover 이벤트'),
-    (r'href\s*=\s*["\']?\s*javascript\s*:', 'javascript: href'),
-    (r'src\s*=\s*["\']?\s*javascript\s*:', 'javascript: src'),
-    (r'<iframe[^>]*\ssrc\s*=\s*["\']?(?!https?://)', '의심스러운 iframe'),
-    (r'XSS[_\-]?(ATTACK|TEST|PAYLOAD|SUCCESS)', 'XSS 테스트 흔적'),
-    (r'<img[^>]*src\s*=\s*["\']?[x1#]["\']?[^>]*onerror', '깨진 이미지 XSS'),
+# 위험 구문 (이름, 정규식) - 반사 위치 주변 윈도우에서만 검사
+# '<img[^>]+onerror', '<svg[^>]+onload' 는 onerror/onload 구문에 포함되므로 별도 항목 없음
+DANGEROUS_CONSTRUCTS = [
+    ('script', r'<script[^>]*>'),
+    ('onerror', r'onerror\s*='),
+    ('onload', r'onload\s*='),
+    ('onclick', r'onclick\s*='),
+    ('onmouseover', r'onmouseover\s*='),
+    ('onfocus', r'onfocus\s*='),
+    ('javascript', r'javascript:'),
 ]
 
-SAFE_SCRIPT_PATTERNS = [
-    r'<script[^>]+src\s*=\s*["\']https?://cdn\.cloudflare\.com',
-    r'<script[^>]+src\s*=\s*["\']https?://cdnjs\.cloudflare\.com',
-    r'<script[^>]+src\s*=\s*["\']https?://code\.jquery\.com',
-    r'<script[^>]+src\s*=\s*["\']https?://unpkg\.com',
-    r'<script[^>]+src\s*=\s*["\']https?://cdn\.jsdelivr\.net',
-]
+# 단일 alternation 으로 미리 컴파일 (매치의 lastgroup = 구문 이름)
+_DANGER_ALTERNATION = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in DANGEROUS_CONSTRUCTS)
+DANGER_RE = re.compile(_DANGER_ALTERNATION, re.IGNORECASE)
+DANGER_BYTES_RE = re.compile(_DANGER_ALTERNATION.encode(), re.IGNORECASE)
+
+# 반사 위치 앞뒤로 검사할 바이트 수
+VULN_WINDOW = 256
+
+# 응답을 디코딩하지 않고 바이트로 비교할 때 시도할 인코딩 (Content-Type charset 이 우선)
+PAYLOAD_ENCODINGS = ('utf-8', 'cp949', 'latin-1')
+
+# 호스트 차단기가 열려 요청 없이 실패한 테스트의 응답 스니펫 (오류로 집계, 저널에는 기록하지 않음)
+CIRCUIT_OPEN_ERROR = "Error: circuit open"
+
+# 차단기로 보류된 작업을 다시 시도하는 최대 횟수 (호스트마다 탐색 요청 1개 -> 닫히면 나머지 실행)
+DEFER_ROUNDS = 3
+
+# 저장된 XSS 분석에 프로세스 풀을 쓰는 최소 페이지 수 (적으면 프로세스 시작 비용이 더 큼)
+ANALYSIS_PROCESS_MIN_PAGES = 16
+
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+def declared_charset(content_type: str) -> Optional[str]:
+    """Content-Type 헤더에 명시된 charset (없으면 None, 본문 추측은 하지 않음)"""
+    match = _CHARSET_RE.search(content_type or '')
+    return match.group(1).lower() if match else None
+
+@lru_cache(maxsize=2048)
+def encode_payload(payload: str, encoding: Optional[str] = None) -> Tuple[bytes, ...]:
+    """페이로드를 후보 인코딩별 바이트로 미리 인코딩 (중복 제거, 캐시됨)"""
+    variants = []
+    for enc in ((encoding,) if encoding else ()) + PAYLOAD_ENCODINGS:
+        try:
+            data = payload.encode(enc)
+        except (UnicodeEncodeError, LookupError):
+            continue
+        if data not in variants:
+            variants.append(data)
+    return tuple(variants)
+
+def needle_encoding(payload: str, needle: bytes, encoding: Optional[str] = None) -> str:
+    """encode_payload 후보 중 needle 을 만든 인코딩 (스니펫 디코딩용, 알 수 없는 charset 은 건너뜀, 없으면 utf-8)"""
+    for enc in ((encoding,) if encoding else ()) + PAYLOAD_ENCODINGS:
+        try:
+            if payload.encode(enc) == needle:
+                return enc
+        except (UnicodeEncodeError, LookupError):
+            continue
+    return 'utf-8'
+
+def _common_prefix_len(a: bytes, b: bytes, limit: int) -> int:
+    # 이진 탐색 + memoryview 비교 (복사 없이 C 레벨 비교)
+    va, vb = memoryview(a), memoryview(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if va[:mid] == vb[:mid]: lo = mid
+        else: hi = mid - 1
+    return lo
+
+def _common_suffix_len(a: bytes, b: bytes, limit: int) -> int:
+    va, vb = memoryview(a), memoryview(b)
+    la, lb = len(a), len(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if va[la - mid:] == vb[lb - mid:]: lo = mid
+        else: hi = mid - 1
+    return lo
+
+def changed_region(body: bytes, baseline: bytes) -> Tuple[int, int, int, int]:
+    """
+    기준 응답과 비교해 공통 접두/접미를 제외한 변경 구간 계산
+    
+    Returns:
+        (body_start, body_end, baseline_start, baseline_end)
+    """
+    limit = min(len(body), len(baseline))
+    prefix = _common_prefix_len(body, baseline, limit)
+    suffix = _common_suffix_len(body, baseline, limit - prefix)
+    return prefix, len(body) - suffix, prefix, len(baseline) - suffix
+
+@lru_cache(maxsize=2048)
+def payload_constructs(payload: str) -> frozenset:
+    """페이로드에 포함된 위험 구문 이름 집합 (캐시됨)"""
+    return frozenset(m.lastgroup for m in DANGER_RE.finditer(payload))
+
+def count_constructs(data: bytes, start: int, end: int, kinds: frozenset) -> Dict[str, int]:
+    """data[start:end] 구간의 위험 구문 개수 (슬라이스 복사 없이 검색)"""
+    counts: Dict[str, int] = {}
+    for match in DANGER_BYTES_RE.finditer(data, max(0, start), max(0, end)):
+        if match.lastgroup in kinds:
+            counts[match.lastgroup] = counts.get(match.lastgroup, 0) + 1
+    return counts
 
 # ============== 데이터 클래스 ==============
 
@@ -89,6 +177,9 @@ class PageInfo:
     forms: List[Dict] = field(default_factory=list)
     params: Dict = field(default_factory=dict)
     links: Set[str] = field(default_factory=set)
+    title: str = ""
+    # 크롤링 중 DOM 트리로 분석한 저장된 XSS 결과 [(이름, 내용, 줄)] (None 이면 분석 안 함)
+    dom_findings: Optional[List[Tuple[str, str, int]]] = None
 
 @dataclass
 class StoredXSSResult:
@@ -96,6 +187,18 @@ class StoredXSSResult:
     pattern_name: str
     matched_content: str
     line_number: int = 0
+    partial: bool = False  # 분석 시간 예산 초과로 페이지 일부만 분석
+    status: str = ""  # 변경 추적 시 'new' (이번에 처음 발견) / 'known' (이전 실행에서 발견)
+    
+    def to_dict(self):
+        return {
+            'url': self.url,
+            'pattern_name': self.pattern_name,
+            'matched_content': self.matched_content,
+            'line_number': self.line_number,
+            'partial': self.partial,
+            'status': self.status
+        }
 
 @dataclass
 class ScanResult:
@@ -111,7 +214,8 @@ class ScanResult:
 
 class SiteCrawler:
     def __init__(self, base_url: str, cookies: Dict = None, max_pages: int = 50, max_depth: int = 3, 
-                 timeout: int = 10, callback=None, delay: float = 0.05): # Delay 대폭 감소
+                 timeout: int = 10, callback=None, delay: float = 0.05, # Delay 대폭 감소
+                 transport: HttpTransport = None, content_analysis: str = 'regex'):
         self.base_url = self._normalize_url(base_url)
         self.max_pages = max_pages
         self.max_depth = max_depth
@@ -123,14 +227,12 @@ class SiteCrawler:
         self.domain = parsed.netloc
         self.scheme = parsed.scheme
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        
-        if cookies:
-            self.session.cookies.update(cookies)
-            self.session.headers.update({'Cookie': '; '.join([f"{k}={v}" for k, v in cookies.items()])})
+        # 공유 전송 계층 (주어지면 스캐너와 같은 세션/커넥션 풀/쿠키 사용)
+        self.transport = transport if transport is not None else HttpTransport(cookies=cookies)
+        self.session = self.transport.session
+        self.page_cache = self.transport.page_cache  # 받은 본문은 저장된 XSS 분석에서 재사용
+        # 'dom' 이면 parse_page 의 트리로 저장된 XSS 를 바로 분석 (본문은 캐시에 남기지 않음)
+        self.content_analysis = content_analysis
         
         self.visited: Set[str] = set()
         self.pages: List[PageInfo] = []
@@ -229,7 +331,10 @@ class SiteCrawler:
             if normalized and self._is_same_domain(normalized):
                 normalized_links.add(normalized)
         
-        return PageInfo(url=url, forms=forms, params=params, links=normalized_links)
+        title = soup.title.get_text(strip=True) if soup.title else ""
+        dom_findings = analyze_tree(soup) if self.content_analysis == 'dom' else None
+        return PageInfo(url=url, forms=forms, params=params, links=normalized_links,
+                        title=title, dom_findings=dom_findings)
     
     def crawl(self) -> List[PageInfo]:
         self.visited = set()
@@ -248,6 +353,8 @@ class SiteCrawler:
             
             page_info = self.parse_page(url, html)
             self.pages.append(page_info)
+            if page_info.dom_findings is None:
+                self.page_cache.put(url, html)
             
             forms_count = len(page_info.forms)
             params_count = len(page_info.params)
@@ -276,110 +383,391 @@ class SiteCrawler:
         self.stop_flag = True
 
 class XSSScanner:
-    def __init__(self, timeout: int = 10, cookies: Dict = None, callback=None, threads: int = 20):
+    def __init__(self, timeout: int = 10, cookies: Dict = None, callback=None, threads: int = 20,
+                 baseline_diff: bool = True, breakers: BreakerRegistry = None, transport: HttpTransport = None,
+                 analysis_budget: Optional[float] = ANALYSIS_BUDGET, analysis_workers: Optional[int] = None,
+                 content_analysis: str = 'regex', block_memo: bool = True):
         self.timeout = timeout
         self.callback = callback
         self.threads = threads  # 스레드 개수 설정
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+        self.baseline_diff = baseline_diff  # 엔드포인트별 기준 응답과 비교하여 오탐 감소
         
-        # 커넥션 풀 크기 증설 (병렬 요청을 위해)
-        adapter = requests.adapters.HTTPAdapter(pool_connections=threads, pool_maxsize=threads)
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
+        # 공유 전송 계층 (크롤러에서 넘겨받으면 연결/쿠키 재사용), 커넥션 풀은 스레드 수에 맞춤
+        if transport is None:
+            transport = HttpTransport(cookies=cookies, pool_size=threads)
+        else:
+            transport.ensure_pool(threads)
+            if cookies:
+                transport.session.cookies.update(cookies)
+        self.transport = transport
+        self.session = transport.session
         
-        if cookies:
-            self.session.cookies.update(cookies)
-            self.session.headers.update({'Cookie': '; '.join([f"{k}={v}" for k, v in cookies.items()])})
-            
-        self.results = []
+        self.results = ResultStore()
+        self.reflected_tasks: List[Tuple[tuple, ResultRecord]] = []  # 반사된 테스트 (작업, 양성 레코드)
         self.stored_xss_results = []
+        self.stored_index = FindingIndex()  # 페이지 간 같은 결과를 묶은 색인
+        self.resolved_findings: List[dict] = []  # 변경 추적 시 이번 실행에서 해결된 결과
+        self.unchanged_pages = 0  # 변경 추적 시 본문이 바뀌지 않아 분석을 건너뛴 페이지 수
         self.stop_flag = False
+        
+        # 저장된 XSS 분석 페이지당 시간 예산 (초, None 이면 제한 없음), 초과한 페이지 URL
+        self.analysis_budget = analysis_budget
+        self.partial_pages: List[str] = []
+        # 저장된 XSS 분석 프로세스 수 (None 이면 CPU 수, 1 이하면 프로세스 풀 사용 안 함)
+        self.analysis_workers = analysis_workers
+        # 저장된 XSS 분석 방식: 'regex' (원문 패턴 스캔) / 'dom' (파싱 트리 순회)
+        self.content_analysis = content_analysis
+        # 템플릿 블록(헤더/푸터 등) 분석 결과 캐시 (스캔 전체에서 공유, False 면 문서 단위 분석)
+        self.block_memo = BlockMemo() if block_memo else None
+        
+        # 호스트별 차단기 (응답 없는 호스트는 연속 실패 후 즉시 실패 처리, 배치 스캔에서는 공유 가능)
+        self.breakers = breakers if breakers is not None else transport.breakers
+        
+        # 엔드포인트별 기준 응답 캐시 (key -> Future[bytes|None], 스레드 간 1회만 요청)
+        self._baselines: Dict[tuple, Future] = {}
+        self._baseline_lock = threading.Lock()
     
     def log(self, message: str, level: str = 'info'):
         if self.callback: self.callback(message, level)
     
-    # ... (analyze_stored_xss, scan_page_content 메서드는 기존과 동일, 생략 없이 포함) ...
+    def get_baseline(self, key: tuple, fetch) -> Optional[bytes]:
+        """엔드포인트 기준 응답 본문 (성공할 때까지 fetch() 호출 후 캐시, 실패 시 None)"""
+        with self._baseline_lock:
+            future = self._baselines.get(key)
+            owner = future is None
+            if owner:
+                future = self._baselines[key] = Future()
+        if owner:
+            try:
+                body = fetch().content
+            except Exception:
+                # 일시적 오류/차단기 열림은 캐시하지 않음 (다음 요청에서 다시 시도)
+                with self._baseline_lock:
+                    self._baselines.pop(key, None)
+                body = None
+            future.set_result(body)
+        return future.result()
+    
     def analyze_stored_xss(self, url: str, html: str) -> List[StoredXSSResult]:
-        results = []
-        cleaned_html = html
-        for safe_pattern in SAFE_SCRIPT_PATTERNS:
-            cleaned_html = re.sub(safe_pattern, '[SAFE_EXTERNAL_SCRIPT]', cleaned_html, flags=re.IGNORECASE)
-        lines = html.split('\n')
+        """
+        저장된 XSS 패턴 검사 (모든 패턴을 문서 한 번 스캔으로 처리)
         
-        for pattern, pattern_name in STORED_XSS_PATTERNS:
-            try:
-                matches = re.finditer(pattern, cleaned_html, re.IGNORECASE | re.DOTALL)
-                for match in matches:
-                    matched_text = match.group(0)
-                    if '[SAFE_EXTERNAL_SCRIPT]' in matched_text: continue
-                    line_num = 0
-                    for i, line in enumerate(lines):
-                        if matched_text[:30] in line:
-                            line_num = i + 1; break
-                    display_content = matched_text[:100] + '...' if len(matched_text) > 100 else matched_text
-                    if not any(r.matched_content == display_content and r.url == url for r in results):
-                        results.append(StoredXSSResult(url, pattern_name, display_content, line_num))
-            except re.error: pass
-        
-        table_patterns = [
-            (r'<t[dh][^>]*>.*?<script.*?</script>.*?</t[dh]>', '테이블 셀 내 스크립트'),
-            (r'<t[dh][^>]*>.*?onerror\s*=.*?</t[dh]>', '테이블 셀 내 onerror'),
-            (r'<li[^>]*>.*?<script.*?</script>.*?</li>', '리스트 내 스크립트'),
-        ]
-        for pattern, pattern_name in table_patterns:
-            try:
-                matches = re.finditer(pattern, html, re.IGNORECASE | re.DOTALL)
-                for match in matches:
-                    matched_text = match.group(0)
-                    display_content = matched_text[:100] + '...' if len(matched_text) > 100 else matched_text
-                    if not any(r.matched_content == display_content for r in results):
-                        results.append(StoredXSSResult(url, pattern_name, display_content, 0))
-            except re.error: pass
-            
-        return results
-
-    def scan_page_content(self, pages: List[PageInfo]) -> List[StoredXSSResult]:
+        분석 시간 예산을 넘기면 그때까지의 결과만 partial 로 반환하고 partial_pages 에 기록
+        아주 큰 본문(STREAM_THRESHOLD 이상)은 겹치는 창 단위로 분석
+        """
+        return self._stored_results(url, self._analyze_body(html))
+    
+    def _stored_results(self, url: str, analysis) -> List[StoredXSSResult]:
+        findings, partial = analysis
+        if partial:
+            self.partial_pages.append(url)
+            self.log(f"  ⏱️ 분석 시간 초과, 일부만 분석: {url[:60]}", 'warning')
+        return [StoredXSSResult(url, name, content, line, partial) for name, content, line in findings]
+    
+    def _page_body(self, page: PageInfo, stream: bool = False) -> Tuple[Optional[Union[str, BodyFile]], bool]:
+        """
+        (본문, 다시 요청했는지) - 크롤링 중 받은 본문 우선, 실패하면 (None, ...)
+        
+        stream 이면 파일로 보관된 큰 본문은 읽지 않고 BodyFile 로 넘김 (창 단위 분석)
+        """
+        cache = self.transport.page_cache
+        if stream:
+            path = cache.take_file(page.url, STREAM_THRESHOLD)
+            if path is not None:
+                return BodyFile(path), False
+        html = cache.pop(page.url)
+        if html is not None:
+            return html, False
+        try:
+            return self.session.get(page.url, timeout=self.timeout).text, True
+        except Exception:
+            return None, True
+    
+    def _page_plan(self, page: PageInfo, findings_db: Optional[FindingsDB] = None
+                   ) -> Tuple[Optional[Union[str, BodyFile, BlockPlan, PriorAnalysis]], bool, Optional[str]]:
+        """
+        (본문 또는 블록 분할 + 캐시 조회, 다시 요청했는지, 본문 해시) - 가져오기 스레드에서 실행
+        
+        findings_db 에 같은 본문 해시가 있으면 분석 대신 이전 결과(PriorAnalysis)
+        """
+        body, refetched = self._page_body(page, stream=True)
+        digest = None
+        if findings_db is not None and body is not None:
+            digest = file_digest(body.path) if isinstance(body, BodyFile) else text_digest(body)
+            prior = findings_db.prior(page.url, digest)
+            if prior is not None:
+                if isinstance(body, BodyFile):
+                    try:
+                        os.remove(body.path)
+                    except OSError:
+                        pass
+                return prior, refetched, digest
+        return self._plan_body(body), refetched, digest
+    
+    def _plan_body(self, body):
+        # 블록 캐시는 창 단위로 분석하지 않는 본문에만 사용
+        if self.block_memo is not None and isinstance(body, str) and len(body) < STREAM_THRESHOLD:
+            return self.block_memo.plan(body)
+        return body
+    
+    @staticmethod
+    def _analysis_job(body):
+        """본문 -> (분석 함수, 인자) - 프로세스 풀에 보낼 수 있는 모듈 수준 함수"""
+        if isinstance(body, BlockPlan):
+            return analyze_blocks, BlockMemo.missing(body)
+        if isinstance(body, BodyFile):
+            return analyze_body_file, body
+        if len(body) >= STREAM_THRESHOLD:
+            return analyze_text, body
+        return analyze_document, body
+    
+    def _analyze_body(self, body):
+        """본문(문자열 / BlockPlan / BodyFile) -> analyze_document 형식 결과"""
+        body = self._plan_body(body)
+        func, arg = self._analysis_job(body)
+        analysis = func(arg, self.analysis_budget)
+        return self.block_memo.complete(body, analysis) if isinstance(body, BlockPlan) else analysis
+    
+    def _dom_analysis(self, page: PageInfo) -> Tuple[Optional[tuple], bool]:
+        """(DOM 분석 결과, 다시 요청했는지) - 크롤링 중 분석한 결과 우선, 없으면 본문을 파싱"""
+        if page.dom_findings is not None:
+            return (page.dom_findings, False), False
+        html, refetched = self._page_body(page)
+        if html is None:
+            return None, refetched
+        return (analyze_html(html), False), refetched
+    
+    def _analysis_pool(self, page_count: int) -> Optional[ProcessPoolExecutor]:
+        """페이지가 충분히 많으면 분석용 프로세스 풀 (만들 수 없는 환경이면 None -> 스레드에서 분석)"""
+        workers = self.analysis_workers if self.analysis_workers is not None else (os.cpu_count() or 1)
+        if workers < 2 or page_count < ANALYSIS_PROCESS_MIN_PAGES:
+            return None
+        try:
+            return ProcessPoolExecutor(max_workers=min(workers, page_count))
+        except (OSError, NotImplementedError, ImportError):
+            return None
+    
+    def scan_page_content(self, pages: List[PageInfo], findings_db: Optional[FindingsDB] = None) -> List[StoredXSSResult]:
+        """
+        저장된 XSS 분석 - 본문 가져오기는 스레드 풀, 정규식 분석은 프로세스 풀
+        
+        크롤링 중 받은 본문을 사용하고 캐시에 없는 페이지만 다시 요청합니다.
+        블록 캐시를 사용하면 이전 페이지에서 분석한 블록은 다시 분석하지 않습니다.
+        파일로 보관된 큰 본문은 읽지 않고 mmap 창 단위로 분석합니다.
+        content_analysis='dom' 이면 크롤링 때 파싱 트리로 분석한 결과를 그대로 사용합니다.
+        findings_db 가 주어지면 본문이 바뀌지 않은 페이지는 이전 결과를 사용하고,
+        결과마다 새 결과/이전 결과 상태를 표시하며 사라진 결과는 resolved_findings 에 기록합니다.
+        결과는 완료 순서와 관계없이 페이지 순서대로 반환합니다.
+        """
         self.stored_xss_results = []
+        self.stored_index.clear()
+        self.partial_pages = []
+        self.resolved_findings = []
+        self.unchanged_pages = 0
+        if findings_db is not None:
+            findings_db.begin_run()
         self.log(f"\n🔎 저장된 XSS 분석 시작 ({len(pages)}개 페이지)", 'info')
+        if not pages:
+            self.log(f"\n✅ 저장된 XSS 패턴 없음", 'success')
+            return self.stored_xss_results
         
-        # 콘텐츠 분석은 병렬 처리가 크지 않아 순차적으로 하되, stop check 강화
-        for i, page in enumerate(pages):
-            if self.stop_flag: break
-            try:
-                response = self.session.get(page.url, timeout=self.timeout)
-                results = self.analyze_stored_xss(page.url, response.text)
-                if results:
-                    self.log(f"  [{i+1}/{len(pages)}] {page.url[:50]}...", 'info')
-                    for r in results:
-                        self.log(f"    ⚠️ {r.pattern_name}: {r.matched_content[:50]}...", 'danger')
-                    self.stored_xss_results.extend(results)
-                if self.callback:
-                    progress = int(((i + 1) / len(pages)) * 100)
-                    self.callback(None, 'content_progress', progress)
-            except: pass
+        per_page: List[List[StoredXSSResult]] = [[] for _ in pages]
+        plans: Dict[int, BlockPlan] = {}  # 프로세스 풀에서 분석 중인 페이지의 블록 분할
+        digests: Dict[int, Optional[str]] = {}  # 분석을 마친 페이지의 본문 해시 (변경 추적)
+        memo = self.block_memo
+        memo_hits, memo_misses = (memo.hits, memo.misses) if memo is not None else (0, 0)
+        refetched = 0
+        done = 0
+        
+        def finish(i: int, results: List[StoredXSSResult]):
+            nonlocal done
+            done += 1
+            if results:
+                per_page[i] = results
+                self.log(f"  [{i+1}/{len(pages)}] {pages[i].url[:50]}...", 'info')
+                for r in results:
+                    self.log(f"    ⚠️ {r.pattern_name}: {r.matched_content[:50]}...", 'danger')
+            if self.callback:
+                self.callback(None, 'content_progress', int(done / len(pages) * 100))
+        
+        dom_mode = self.content_analysis == 'dom'
+        analysis_pool = None if dom_mode else self._analysis_pool(len(pages))
+        fetch_pool = ThreadPoolExecutor(max_workers=max(1, min(self.threads, len(pages))))
+        jobs: Dict[Future, Tuple[str, int]] = {}
+        try:
+            for i, page in enumerate(pages):
+                if dom_mode:
+                    jobs[fetch_pool.submit(self._dom_analysis, page)] = ('dom', i)
+                else:
+                    jobs[fetch_pool.submit(self._page_plan, page, findings_db)] = ('fetch', i)
+            pending = set(jobs)
+            while pending and not self.stop_flag:
+                completed, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    kind, i = jobs.pop(future)
+                    url = pages[i].url
+                    try:
+                        if kind == 'fetch':
+                            body, was_refetched, digests[i] = future.result()
+                            refetched += was_refetched
+                            if body is None:
+                                del digests[i]
+                                finish(i, [])
+                            elif isinstance(body, PriorAnalysis):
+                                self.unchanged_pages += 1
+                                finish(i, self._stored_results(url, body))
+                            elif analysis_pool is None or (isinstance(body, BlockPlan) and None not in body.cached):
+                                finish(i, self._stored_results(url, self._analyze_body(body)))
+                            else:
+                                if isinstance(body, BlockPlan):
+                                    plans[i] = body
+                                func, arg = self._analysis_job(body)
+                                analysis = analysis_pool.submit(func, arg, self.analysis_budget)
+                                jobs[analysis] = ('analyze', i)
+                                pending.add(analysis)
+                        elif kind == 'dom':
+                            analysis, was_refetched = future.result()
+                            refetched += was_refetched
+                            if analysis is not None:
+                                digests[i] = None
+                            finish(i, [] if analysis is None else self._stored_results(url, analysis))
+                        else:
+                            analysis = future.result()
+                            plan = plans.pop(i, None)
+                            if plan is not None:
+                                analysis = memo.complete(plan, analysis)
+                            finish(i, self._stored_results(url, analysis))
+                    except Exception as e:
+                        # 페이지 하나의 오류(본문 읽기/블록 분할/프로세스 풀 등)는 그 페이지만 건너뜀
+                        digests.pop(i, None)
+                        plans.pop(i, None)
+                        self.log(f"  ❌ 분석 오류: {url[:50]} ({str(e)[:50]})", 'warning')
+                        finish(i, [])
+        finally:
+            for future in jobs:
+                future.cancel()
+            fetch_pool.shutdown(wait=False)
+            if analysis_pool is not None:
+                analysis_pool.shutdown(wait=False)
         
-        if self.stored_xss_results: self.log(f"\n⚠️ 저장된 XSS {len(self.stored_xss_results)}개 발견!", 'danger')
+        if findings_db is not None:
+            self._track_changes(findings_db, pages, per_page, digests)
+        for results in per_page:
+            self.stored_xss_results.extend(results)
+            self.stored_index.extend(results)
+        if self.stored_xss_results:
+            self.log(f"\n⚠️ 저장된 XSS {len(self.stored_xss_results)}개 발견! (고유 {len(self.stored_index)}개)", 'danger')
+            for finding in self.stored_index.repeated():
+                self.log(f"   {finding.count}개 페이지에 반복: {finding.pattern_name}: {finding.matched_content[:50]}", 'warning')
         else: self.log(f"\n✅ 저장된 XSS 패턴 없음", 'success')
+        if self.partial_pages:
+            self.log(f"⏱️ 시간 예산 초과로 일부만 분석한 페이지 {len(self.partial_pages)}개", 'warning')
+        if refetched:
+            self.log(f"   (캐시에 없어 다시 요청한 페이지 {refetched}개)", 'info')
+        if memo is not None and memo.hits > memo_hits:
+            hits = memo.hits - memo_hits
+            self.log(f"   (템플릿 블록 캐시 적중 {hits}/{hits + memo.misses - memo_misses})", 'info')
         return self.stored_xss_results
     
-    def check_reflection(self, response_text: str, payload: str) -> tuple:
-        if payload in response_text:
-            idx = response_text.find(payload)
-            start = max(0, idx - 30)
-            end = min(len(response_text), idx + len(payload) + 30)
-            return True, response_text[start:end]
-        return False, None
-    
-    def check_vulnerability(self, response_text: str, payload: str) -> bool:
-        patterns = [
-            r'<script[^>]*>', r'onerror\s*=', r'onload\s*=', r'onclick\s*=', 
-            r'onmouseover\s*=', r'onfocus\s*=', r'javascript:', r'<img[^>]+onerror', r'<svg[^>]+onload'
-        ]
-        for pattern in patterns:
-            if re.search(pattern, response_text, re.IGNORECASE):
-                if re.search(pattern, payload, re.IGNORECASE): return True
-        return False
+    def _track_changes(self, findings_db: FindingsDB, pages: List[PageInfo],
+                       per_page: List[List[StoredXSSResult]], digests: Dict[int, Optional[str]]):
+        """분석을 마친 페이지의 결과를 기록하고 새 결과 / 해결된 결과 보고"""
+        analyzed = []
+        for i, digest in sorted(digests.items()):
+            results = per_page[i]
+            partial = pages[i].url in self.partial_pages
+            statuses = findings_db.record_page(
+                pages[i].url, digest, [(r.pattern_name, r.matched_content, r.line_number) for r in results], partial)
+            for result, status in zip(results, statuses):
+                result.status = status
+            if not partial:
+                analyzed.append(pages[i].url)
+        self.resolved_findings = findings_db.finish_run(analyzed)
+        counts = findings_db.counts()
+        self.log(f"\n🗂️ 변경 추적: 새 결과 {counts['new']}개, 이전 결과 {counts['known']}개, "
+                 f"해결 {len(self.resolved_findings)}개 (본문이 같아 분석 생략 {self.unchanged_pages}개 페이지)", 'info')
+        for finding in self.resolved_findings:
+            self.log(f"   ✅ 해결: {finding['pattern_name']}: {finding['matched_content'][:50]} ({finding['url'][:50]})", 'success')
+    
+    def locate_reflection(self, response_body: bytes, payload: str, encoding: Optional[str] = None,
+                          start: int = 0) -> Tuple[int, bytes]:
+        """응답 바이트에서 페이로드 위치 검색 -> (offset, 일치한 바이트), 없으면 (-1, b'')"""
+        for needle in encode_payload(payload, encoding):
+            idx = response_body.find(needle, start)
+            if idx >= 0:
+                return idx, needle
+        return -1, b''
+    
+    def check_reflection(self, response_body, payload: str, encoding: Optional[str] = None) -> tuple:
+        if isinstance(response_body, str):
+            response_body = response_body.encode('utf-8')
+            encoding = 'utf-8'
+        idx, needle = self.locate_reflection(response_body, payload, encoding)
+        if idx < 0:
+            return False, None
+        return True, self._snippet(response_body, idx, payload, needle, encoding)
+    
+    @staticmethod
+    def _snippet(response_body: bytes, idx: int, payload: str, needle: bytes, encoding: Optional[str]) -> str:
+        # 양성 결과의 스니펫만 디코딩 (선언된 charset 이 아니라 실제로 일치한 인코딩 사용)
+        start = max(0, idx - 30)
+        end = min(len(response_body), idx + len(needle) + 30)
+        return response_body[start:end].decode(needle_encoding(payload, needle, encoding), errors='replace')
+    
+    def check_vulnerability(self, response_body, payload: str, baseline: Optional[bytes] = None,
+                            offset: Optional[int] = None, encoding: Optional[str] = None) -> bool:
+        """
+        반사된 페이로드의 위험 구문 판정
+        
+        미리 컴파일된 단일 정규식을 반사 위치(offset) 앞뒤 VULN_WINDOW 바이트에만 적용합니다.
+        baseline 이 주어지면 기준 응답과 달라진 구간의 반사만 보고,
+        기준 응답의 같은 위치에 원래 있던 위험 구문은 취약점으로 세지 않습니다.
+        """
+        kinds = payload_constructs(payload)
+        if not kinds:
+            return False
+        if isinstance(response_body, str):
+            response_body, encoding = response_body.encode('utf-8'), 'utf-8'
+        
+        prefix = 0
+        if baseline is not None:
+            prefix = changed_region(response_body, baseline)[0]
+        
+        needle_len = max(len(n) for n in encode_payload(payload, encoding))
+        if offset is None or offset + needle_len <= prefix:
+            # 기준 응답에도 있던 위치(정적 텍스트)의 일치는 반사로 보지 않음
+            offset, needle = self.locate_reflection(response_body, payload, encoding, max(0, prefix - needle_len + 1))
+            if offset < 0:
+                return False
+            needle_len = len(needle)
+        
+        start, end = offset - VULN_WINDOW, offset + needle_len + VULN_WINDOW
+        found = count_constructs(response_body, start, end, kinds)
+        if baseline is None or not found:
+            return bool(found)
+        
+        # 기준 응답의 대응 구간: 시작은 같은 위치, 끝은 길이 차이만큼 이동하되 응답 쪽 창의 끝(end)을 넘지 않음
+        # -> 기준 응답의 구간이 응답 쪽 창([max(0, start), end])보다 넓어지지 않으므로
+        #    반사 위치보다 앞의 요청별 토큰(CSRF/nonce)이 달라도 멀리 있는 기존 구문은 세지 않음
+        shift = len(response_body) - len(baseline)
+        base_start = max(0, start)
+        base_end = min(end - shift, end)
+        existing = count_constructs(baseline, base_start, base_end, kinds)
+        return any(count > existing.get(kind, 0) for kind, count in found.items())
+    
+    def _analyze_response(self, response, payload: str, baseline_key: tuple = None, baseline_fetch=None) -> Tuple[bool, bool, Optional[str]]:
+        """response.text 대신 response.content 바이트로 반사/취약 여부 판정"""
+        body = response.content
+        encoding = declared_charset(response.headers.get('Content-Type', ''))
+        idx, needle = self.locate_reflection(body, payload, encoding)
+        if idx < 0:
+            return False, False, None
+        snippet = self._snippet(body, idx, payload, needle, encoding)
+        # 기준 응답은 반사가 확인된 엔드포인트에 대해서만 요청
+        baseline = None
+        if self.baseline_diff and baseline_fetch is not None:
+            baseline = self.get_baseline(baseline_key, baseline_fetch)
+        return True, self.check_vulnerability(body, payload, baseline, idx, encoding), snippet
     
     def inject_url_param(self, url: str, param: str, payload: str) -> str:
         parsed = urlparse(url)
@@ -393,65 +781,212 @@ class XSSScanner:
         if self.stop_flag: return None
         injected_url = self.inject_url_param(url, param, payload)
         try:
-            response = self.session.get(injected_url, timeout=self.timeout)
-            reflected, snippet = self.check_reflection(response.text, payload)
-            vulnerable = reflected and self.check_vulnerability(response.text, payload)
+            response = self._get(injected_url)
+            reflected, vulnerable, snippet = self._analyze_response(
+                response, payload, ('get', url), lambda: self._get(url))
             return ScanResult(injected_url, param, payload, reflected, vulnerable, snippet, response.status_code)
+        except CircuitOpenError:
+            return ScanResult(injected_url, param, payload, False, False, CIRCUIT_OPEN_ERROR)
         except Exception as e:
             return ScanResult(injected_url, param, payload, False, False, f"Error: {str(e)[:30]}")
     
+    def _get(self, url: str):
+        """호스트 차단기 + 일시적 오류 재시도를 거친 GET"""
+        return self.breakers.call(url, lambda: self.session.get(url, timeout=self.timeout))
+    
+    def _submit_form(self, form: Dict, data: Dict):
+        if form['method'] == 'post':
+            send = lambda: self.session.post(form['action'], data=data, timeout=self.timeout)
+        else:
+            send = lambda: self.session.get(form['action'], params=data, timeout=self.timeout)
+        # POST 제출은 중복 제출을 막기 위해 재시도하지 않음
+        return self.breakers.call(form['action'], send, idempotent=form['method'] != 'post')
+    
     # 개별 폼 스캔 작업 (결과를 리턴하도록 수정)
     def scan_form(self, form: Dict, payload: str, input_field: Dict) -> ScanResult:
         if self.stop_flag: return None
         data = {}
         for inp in form['inputs']:
             data[inp['name']] = payload if inp['name'] == input_field['name'] else inp.get('value', 'test')
+        # 오류/차단 결과도 같은 이름으로 집계 (엔드포인트별 통계가 한 행으로 묶임)
+        parameter = f"{input_field['name']} ({form['method'].upper()})"
         try:
-            if form['method'] == 'post':
-                response = self.session.post(form['action'], data=data, timeout=self.timeout)
-            else:
-                response = self.session.get(form['action'], params=data, timeout=self.timeout)
-            reflected, snippet = self.check_reflection(response.text, payload)
-            vulnerable = reflected and self.check_vulnerability(response.text, payload)
-            return ScanResult(form['action'], f"{input_field['name']} ({form['method'].upper()})", payload, reflected, vulnerable, snippet, response.status_code)
+            response = self._submit_form(form, data)
+            # 기준 응답: 모든 필드를 기본값으로 제출
+            baseline_key = (form['method'], form['action'], tuple(inp['name'] for inp in form['inputs']))
+            baseline_data = {inp['name']: inp.get('value', 'test') for inp in form['inputs']}
+            reflected, vulnerable, snippet = self._analyze_response(
+                response, payload, baseline_key, lambda: self._submit_form(form, baseline_data))
+            return ScanResult(form['action'], parameter, payload, reflected, vulnerable, snippet, response.status_code)
+        except CircuitOpenError:
+            return ScanResult(form['action'], parameter, payload, False, False, CIRCUIT_OPEN_ERROR)
         except Exception as e:
-            return ScanResult(form['action'], input_field['name'], payload, False, False, f"Error: {str(e)[:30]}")
+            return ScanResult(form['action'], parameter, payload, False, False, f"Error: {str(e)[:30]}")
     
-    def scan_pages(self, pages: List[PageInfo], quick_mode: bool = False) -> List[ScanResult]:
-        self.results = []
+    def build_tasks(self, pages: List[PageInfo], payloads: List[str]) -> List[tuple]:
+        """
+        스캔 작업 목록 생성
+        
+        Returns:
+            [(저널 키, 함수, 인자 튜플), ...]
+        """
+        tasks = []
+        for page in pages:
+            # 1. URL 파라미터 작업
+            for param in page.params:
+                for payload in payloads:
+                    key = task_key('url', 'get', page.url, param, payload)
+                    tasks.append((key, self.scan_url_param, (page.url, param, payload)))
+            
+            # 2. 폼 작업
+            for form in page.forms:
+                for input_field in form['inputs']:
+                    for payload in payloads:
+                        key = task_key('form', form['method'], form['action'], input_field['name'], payload)
+                        tasks.append((key, self.scan_form, (form, payload, input_field)))
+        return tasks
+    
+    def build_plan_tasks(self, plan) -> List[tuple]:
+        """스캔 계획(ScanPlan) -> 기대 수익 순 작업 목록 (build_tasks 와 같은 형식)"""
+        tasks = []
+        for test in plan.tests():
+            ep = test.endpoint
+            key = task_key(ep.kind, ep.method, ep.url, ep.parameter, test.payload)
+            if ep.kind == 'url':
+                tasks.append((key, self.scan_url_param, (ep.url, ep.parameter, test.payload)))
+            else:
+                tasks.append((key, self.scan_form, (ep.form, test.payload, ep.input_field)))
+        return tasks
+    
+    def measure_latency(self, pages: List[PageInfo], samples: int = 3) -> float:
+        """크롤링된 페이지 몇 개를 요청하여 요청당 지연(초) 측정 (스캔 계획용)"""
+        return measure_latency(lambda url: self.session.get(url, timeout=self.timeout),
+                               (p.url for p in pages), samples)
+    
+    def plan(self, pages: List[PageInfo], quick_mode: bool = False, budget: Optional[float] = None,
+             latency: Optional[float] = None) -> ScanPlan:
+        """스캔 계획 생성 (latency 가 없으면 측정)"""
+        if latency is None:
+            latency = self.measure_latency(pages)
+        return plan_scan(pages, XSS_PAYLOADS_QUICK, XSS_PAYLOADS_FULL, latency=latency,
+                         concurrency=self.threads, budget=budget, full=not quick_mode)
+    
+    def scan_pages(self, pages: List[PageInfo], quick_mode: bool = False, journal: ScanJournal = None,
+                   plan: ScanPlan = None) -> ResultStore:
+        """
+        반사형 XSS 스캔
+        
+        Args:
+            pages: 스캔할 페이지 목록
+            quick_mode: True면 빠른 스캔
+            journal: 스캔 저널 (주어지면 완료된 테스트는 건너뛰고 기록된 결과를 합침,
+                     처음 실행할 때 기록한 테스트 목록이 있으면 quick_mode/plan 대신 그 목록으로 재개)
+            plan: 스캔 계획 (주어지면 quick_mode 대신 계획의 페이로드 선택과 순서를 따름)
+        """
+        self.results = ResultStore()
+        self.reflected_tasks = []
         self.stop_flag = False
-        payloads = XSS_PAYLOADS_QUICK if quick_mode else XSS_PAYLOADS_FULL
         
-        # 총 작업 개수 계산
-        total_tasks = sum(len(p.params) * len(payloads) for p in pages) + \
-                      sum(len(f['inputs']) * len(payloads) for p in pages for f in p.forms)
+        recorded = journal.load_plan() if journal is not None else None
+        if recorded is not None:
+            quick_mode, keys = recorded
+            candidates = self.build_tasks(pages, XSS_PAYLOADS_QUICK + [p for p in XSS_PAYLOADS_FULL
+                                                                        if p not in XSS_PAYLOADS_QUICK])
+            by_key = {task[0]: task for task in candidates}
+            tasks = [by_key[key] for key in keys if key in by_key]
+            self.log(f"📒 저널의 테스트 목록으로 재개 ({'빠른' if quick_mode else '전체'} 스캔, {len(tasks)}개 테스트)", 'info')
+        elif plan is not None:
+            self.log(plan.describe(), 'info')
+            tasks = self.build_plan_tasks(plan)
+        else:
+            payloads = XSS_PAYLOADS_QUICK if quick_mode else XSS_PAYLOADS_FULL
+            tasks = self.build_tasks(pages, payloads)
+        total_tasks = len(tasks)
         
         if total_tasks == 0:
             self.log("⚠️ 스캔할 입력필드가 없습니다.", 'warning')
-            return []
+            return self.results
+        
+        # 저널에서 완료된 테스트 복원
+        completed_tasks = 0
+        if journal is not None:
+            completed = journal.load()
+            if journal.load_pages() is None:
+                journal.record_pages(pages)
+            if recorded is None:
+                journal.record_plan([task[0] for task in tasks], quick_mode)
+            pending = []
+            for task in tasks:
+                restored = completed.get(task[0])
+                if restored is None:
+                    pending.append(task)
+                else:
+                    record = self.results.add(restored)
+                    if record is not None:
+                        self.reflected_tasks.append((task, record))
+            completed_tasks = total_tasks - len(pending)
+            tasks = pending
+            if completed_tasks:
+                self.log(f"📒 저널에서 {completed_tasks}개 테스트 복원 (남은 테스트: {len(tasks)})", 'info')
         
         self.log(f"\n🚀 고속 XSS 스캔 시작 (멀티스레드: {self.threads}, 총 {total_tasks}개 테스트)", 'info')
         
-        completed_tasks = 0
+        completed_tasks, deferred = self._run_tasks(tasks, journal, completed_tasks, total_tasks, defer=True)
+        
+        # 차단기가 열려 즉시 실패한 작업은 탐색 대기 시간 후 다시 실행
+        # 반열림 상태는 탐색 요청 1개만 허용 -> 호스트마다 하나를 먼저 보내고, 차단기가 닫힌 호스트의 작업만 실행
+        # (DEFER_ROUNDS 번 후에도 열려 있으면 남은 작업은 오류로 집계)
+        for _ in range(DEFER_ROUNDS):
+            if not deferred or self.stop_flag:
+                break
+            wait = max(self.breakers.open_hosts().values(), default=0.0)
+            self.log(f"⏸ 응답 없는 호스트의 작업 {len(deferred)}개 보류 -> {wait:.0f}초 후 재시도", 'warning')
+            deadline = time.time() + wait
+            while time.time() < deadline and not self.stop_flag:
+                time.sleep(min(0.5, deadline - time.time()))
+            
+            probes, held = {}, []
+            for task in deferred:
+                breaker = self.breakers.get(self._task_url(task))
+                if breaker.state != CLOSED and id(breaker) not in probes:
+                    probes[id(breaker)] = task
+                else:
+                    held.append(task)
+            completed_tasks, waiting = self._run_tasks(list(probes.values()), journal, completed_tasks,
+                                                       total_tasks, defer=True)
+            ready = []
+            for task in held:
+                (ready if self.breakers.get(self._task_url(task)).state == CLOSED else waiting).append(task)
+            completed_tasks, deferred = self._run_tasks(ready, journal, completed_tasks, total_tasks, defer=True)
+            deferred += waiting
+        if deferred and not self.stop_flag:
+            self._run_tasks(deferred, journal, completed_tasks, total_tasks, defer=False)
         
+        return self.results
+    
+    @staticmethod
+    def _task_url(task: tuple) -> str:
+        """작업 (키, 함수, 인자)의 요청 URL (URL 파라미터 테스트는 URL, 폼 테스트는 action)"""
+        target = task[2][0]
+        return target if isinstance(target, str) else target['action']
+    
+    def _run_tasks(self, tasks: List[tuple], journal: Optional[ScanJournal], completed_tasks: int,
+                   total_tasks: int, defer: bool) -> Tuple[int, List[tuple]]:
+        """
+        작업 병렬 실행
+        
+        Returns:
+            (완료된 작업 수, 보류된 작업 목록) - defer=True 면 차단기로 즉시 실패한 작업은 집계하지 않고 보류
+        """
+        deferred = []
         # 스레드 풀 실행기 사용
         with ThreadPoolExecutor(max_workers=self.threads) as executor:
-            futures = []
-            
             # 작업 등록 (Submission)
-            for page in pages:
+            futures = {}
+            for task in tasks:
                 if self.stop_flag: break
-                
-                # 1. URL 파라미터 작업 등록
-                for param in page.params:
-                    for payload in payloads:
-                        futures.append(executor.submit(self.scan_url_param, page.url, param, payload))
-                
-                # 2. 폼 작업 등록
-                for form in page.forms:
-                    for input_field in form['inputs']:
-                        for payload in payloads:
-                            futures.append(executor.submit(self.scan_form, form, payload, input_field))
+                key, func, args = task
+                futures[executor.submit(func, *args)] = task
             
             # 작업 완료 처리 (As Completed)
             for future in as_completed(futures):
@@ -460,10 +995,20 @@ class XSSScanner:
                     break
                 
                 result = future.result()
+                if defer and result is not None and result.response_snippet == CIRCUIT_OPEN_ERROR:
+                    deferred.append(futures[future])
+                    continue
                 completed_tasks += 1
                 
+                # 음성 결과는 집계만 하고 버림 (양성만 레코드로 보관)
                 if result:
-                    self.results.append(result)
+                    record = self.results.add(result)
+                    if record is not None:
+                        self.reflected_tasks.append((futures[future], record))
+                        if self.callback:
+                            self.callback(None, 'scan_result', record)
+                    if journal is not None:
+                        journal.record(futures[future][0], result)
                     
                     # 로그 출력 (취약점 발견 시에만 강조, 나머지는 생략하여 속도 향상)
                     if result.vulnerable:
@@ -475,8 +1020,7 @@ class XSSScanner:
                 if self.callback:
                     progress = int((completed_tasks / total_tasks) * 100)
                     self.callback(None, 'scan_progress', progress)
-
-        return self.results
+        return completed_tasks, deferred
     
     def stop(self):
         self.stop_flag = True
\ No newline at end of file
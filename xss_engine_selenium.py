@@ -5,10 +5,17 @@ XSS Scanner Engine - Selenium 기반 (v5.5 - Alert 모드 추가)
 2. 페이지 로드 전략 Normal로 복구 (onload 이벤트 보장)
 3. 대기 시간 0.8초 -> 2.0초로 안정화
 4. [v5.5] Alert 모드 추가 - 팝업으로 XSS 실행 확인 가능
+5. 실행 감지 훅 - 문서 시작 시 주입한 훅이 실행 즉시 알림 (깨끗한 페이지는 로드 + EXECUTION_QUIET)
 """
 
+import json
+import os
+import queue
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Set, Tuple
@@ -19,7 +26,13 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoAlertPresentException
+from selenium.common.exceptions import (TimeoutException, WebDriverException, NoAlertPresentException,
+                                        UnexpectedAlertPresentException)
+
+from config import Config
+from result_store import ResultStore, FindingIndex
+from scan_journal import ScanJournal, task_key
+from scan_planner import DEFAULT_LATENCY, ScanPlan, plan_scan
 
 
 # ============== XSS 페이로드 생성 함수 ==============
@@ -93,6 +106,122 @@ STORED_XSS_PATTERNS = [
     (r'XSS[_\-]?(ATTACK|TEST|SUCCESS|PAYLOAD)', 'XSS 테스트 흔적'),
 ]
 
+# 문서 시작 시 모든 프레임에 주입하는 실행 감지 훅 (Page.addScriptToEvaluateOnNewDocument)
+# - alert/confirm/prompt 는 대화상자를 띄우지 않고 기록, console.log 는 마커가 있을 때 기록
+#   (화면에 보이는 Alert 모드의 훅 ALERT_MODE_HOOK 은 대화상자를 그대로 띄움 -> 드라이버가 감지)
+# - 기록 즉시 대기 중인 execute_async_script 를 깨움 -> 폴링 없이 실행 감지
+# - fetch/XHR 진행 중 요청 수와 IDLE_TIMER_HORIZON 이하의 대기 중 타이머 수를 추적 (네트워크 IDLE 판단)
+# - 자식 프레임(javascript: iframe 등)의 기록과 요청은 최상위 문서로 모음
+IDLE_TIMER_HORIZON = 1.0   # 이보다 긴 타이머(폴링/광고 순환 등)는 IDLE 판단에서 제외 (초)
+
+_EXECUTION_HOOK = '''
+(function () {
+    if (window.__xssHook) return;
+    var markers = %(markers)s, horizon = %(horizon)d;
+    var root = null;
+    try { if (window.top !== window && window.top.__xssHook) root = window.top.__xssHook; } catch (e) {}
+    var hook = root || { hits: [], waiters: [], inflight: 0, timers: 0, last: Date.now(),
+                         setTimeout: window.setTimeout.bind(window) };
+    window.__xssHook = hook;
+    function record(text) {
+        hook.hits.push(text);
+        hook.waiters.splice(0).forEach(function (wake) { wake(); });
+    }
+    function text(args) {
+        return Array.prototype.map.call(args, function (a) { return String(a); }).join(' ');
+    }
+    function touch() { hook.last = Date.now(); }
+    var log = console.log;
+    console.log = function () {
+        var message = text(arguments);
+        if (markers.some(function (m) { return message.indexOf(m) >= 0; })) record(message);
+        return log.apply(this, arguments);
+    };
+%(dialogs)s
+    // 네트워크 요청 추적
+    function started() { hook.inflight++; touch(); }
+    function ended() { hook.inflight = Math.max(0, hook.inflight - 1); touch(); }
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            started();
+            try {
+                var result = fetch.apply(this, arguments);
+                result.then(ended, ended);
+                return result;
+            } catch (e) { ended(); throw e; }
+        };
+    }
+    if (window.XMLHttpRequest) {
+        var send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            started();
+            this.addEventListener('loadend', ended);
+            try { return send.apply(this, arguments); } catch (e) { ended(); throw e; }
+        };
+    }
+
+    // 짧은 타이머 추적 (IDLE 대기 스크립트는 원래 setTimeout 을 사용하므로 제외됨)
+    var setTimer = window.setTimeout, clearTimer = window.clearTimeout, pending = {};
+    function settled(id) { if (pending[id]) { delete pending[id]; hook.timers--; touch(); } }
+    window.setTimeout = function (callback, delay) {
+        if (typeof callback !== 'function' || (Number(delay) || 0) > horizon) return setTimer.apply(window, arguments);
+        var args = Array.prototype.slice.call(arguments), id;
+        args[0] = function () { settled(id); return callback.apply(this, arguments); };
+        id = setTimer.apply(window, args);
+        pending[id] = true;
+        hook.timers++;
+        return id;
+    };
+    window.clearTimeout = function (id) { settled(id); return clearTimer.apply(window, arguments); };
+    window.addEventListener('load', touch);
+})();
+'''
+
+_DIALOG_HOOK = '''    ['alert', 'confirm', 'prompt'].forEach(function (name) {
+        window[name] = function () { record('Alert: ' + text(arguments)); return name === 'confirm' ? true : null; };
+    });
+'''
+
+
+def execution_hook(native_dialogs: bool = False) -> str:
+    """실행 감지 훅 소스 (native_dialogs 면 alert/confirm/prompt 를 가로채지 않음)"""
+    return _EXECUTION_HOOK % {'markers': json.dumps(XSS_MARKERS), 'horizon': int(IDLE_TIMER_HORIZON * 1000),
+                              'dialogs': '' if native_dialogs else _DIALOG_HOOK}
+
+
+EXECUTION_HOOK = execution_hook()
+ALERT_MODE_HOOK = execution_hook(native_dialogs=True)
+
+# 문서 로드 완료 + 진행 중 요청/짧은 타이머 없음이 idle 초 동안 유지되면 true (cap 초가 지나면 false)
+WAIT_FOR_IDLE = '''
+var done = arguments[arguments.length - 1], idle = arguments[0] * 1000, cap = arguments[1] * 1000;
+var hook = window.__xssHook, start = Date.now();
+if (!hook) { done(null); return; }
+(function check() {
+    var quiet = document.readyState === 'complete' && hook.inflight <= 0 && hook.timers <= 0;
+    if (quiet && Date.now() - hook.last >= idle) { done(true); return; }
+    if (Date.now() - start >= cap) { done(false); return; }
+    hook.setTimeout(check, Math.max(5, Math.min(idle, 25)));
+})();
+'''
+
+# 실행 기록 또는 (네트워크 IDLE 이 quiet 초 유지) 또는 cap 초 중 먼저 오는 시점에 반환
+WAIT_FOR_EXECUTION = '''
+var done = arguments[arguments.length - 1], quiet = arguments[0] * 1000, cap = arguments[1] * 1000;
+var hook = window.__xssHook, finished = false, start = Date.now();
+if (!hook) { done(null); return; }
+function finish() { if (!finished) { finished = true; done(hook.hits.slice()); } }
+if (hook.hits.length) { finish(); return; }
+hook.waiters.push(finish);
+(function check() {
+    if (finished) return;
+    var idle = document.readyState === 'complete' && hook.inflight <= 0 && hook.timers <= 0;
+    if ((idle && Date.now() - hook.last >= quiet) || Date.now() - start >= cap) { finish(); return; }
+    hook.setTimeout(check, 25);
+})();
+'''
+
 SAFE_DOMAINS = ['cdn.cloudflare.com', 'cdnjs.cloudflare.com', 'code.jquery.com', 
                 'unpkg.com', 'cdn.jsdelivr.net', 'fonts.googleapis.com', 'google.com']
 
@@ -151,13 +280,33 @@ class ScanResult:
 
 # ============== Selenium 브라우저 관리 (탐지율 복구) ==============
 
+_INSTALL_LOCK = threading.Lock()
+_DRIVER_INSTALLED = False
+
+
+def install_driver() -> None:
+    """chromedriver 설치/버전 확인 (프로세스당 한 번)"""
+    global _DRIVER_INSTALLED
+    # 풀에서 동시에 시작해도 설치는 한 번에 하나씩
+    with _INSTALL_LOCK:
+        if _DRIVER_INSTALLED:
+            return
+        try:
+            import chromedriver_autoinstaller
+            chromedriver_autoinstaller.install()
+        except: pass
+        _DRIVER_INSTALLED = True
+
 class BrowserManager:
     """Selenium WebDriver 관리 - 탐지율 우선 설정"""
     
-    def __init__(self, headless: bool = True, timeout: int = 10):
+    def __init__(self, headless: bool = True, timeout: int = 10, native_dialogs: bool = False):
         self.headless = headless
         self.timeout = timeout
+        # 화면에 보이는 Alert 모드: 대화상자를 훅으로 가로채지 않고 그대로 띄움 (헤드리스면 보이지 않으므로 훅으로 기록)
+        self.native_dialogs = native_dialogs and not headless
         self.driver = None
+        self.hooked = False  # 실행 감지 훅 설치 여부 (없으면 alert/콘솔 폴링)
     
     def start(self) -> webdriver.Chrome:
         """브라우저 시작"""
@@ -192,24 +341,100 @@ class BrowserManager:
         # 콘솔 로그 캡처 활성화
         options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
         
+        # 대화상자가 열리면 다음 명령에서 수락하고 내용과 함께 알림 (UnexpectedAlertPresentException)
+        if self.native_dialogs:
+            options.set_capability('unhandledPromptBehavior', 'accept and notify')
+        
         try:
-            try:
-                import chromedriver_autoinstaller
-                chromedriver_autoinstaller.install()
-            except: pass
-            
+            install_driver()
             self.driver = webdriver.Chrome(options=options)
             self.driver.set_page_load_timeout(self.timeout)
+            self.hooked = self.install_hook()
             return self.driver
         except Exception as e:
             raise Exception(f"Chrome 드라이버 시작 실패: {e}")
     
-    def wait_for_ready(self, timeout=5):
+    def install_hook(self) -> bool:
+        """모든 새 문서(프레임 포함)에 실행 감지 훅 주입 (CDP 를 쓸 수 없으면 False)"""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            source = ALERT_MODE_HOOK if self.native_dialogs else EXECUTION_HOOK
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': source})
+            self.driver.set_script_timeout(max(Config.PAGE_LOAD_WAIT, Config.READY_TIMEOUT) + self.timeout)
+            return True
+        except Exception:
+            return False
+    
+    def wait_for_execution(self, quiet: float = Config.EXECUTION_QUIET,
+                           cap: float = Config.PAGE_LOAD_WAIT) -> Optional[Tuple[bool, str]]:
+        """
+        실행 감지 훅으로 XSS 실행 대기 -> (실행됨, 증거), 훅이 없으면 None
+        
+        실행이 기록되는 즉시, 아니면 로드 후 요청/짧은 타이머 없이 quiet 초 동안 조용하면
+        반환 (최대 cap 초).
+        폼 제출 직후처럼 대기 중 문서가 바뀌면 새 문서에서 한 번 더 대기.
+        대화상자를 그대로 띄우는 모드에서는 대화상자가 열리면 대기가 중단되고 그 내용이 증거
+        """
+        if not self.hooked:
+            return None
+        hits = None
+        for _ in range(2):
+            try:
+                hits = self.driver.execute_async_script(WAIT_FOR_EXECUTION, quiet, cap)
+                break
+            except UnexpectedAlertPresentException as e:
+                evidence = f"Alert: {e.alert_text}" if e.alert_text is not None else self.take_alert()
+                return (True, evidence) if evidence else None
+            except WebDriverException:
+                self.wait_for_ready()
+        if hits is None:
+            return None
+        return (True, hits[0]) if hits else (False, "")
+    
+    def take_alert(self) -> Optional[str]:
+        """열린 대화상자를 수락하고 증거 반환 (없으면 None)"""
+        try:
+            alert = self.driver.switch_to.alert
+            evidence = f"Alert: {alert.text}"
+            alert.accept()
+            return evidence
+        except NoAlertPresentException:
+            return None
+    
+    def is_alive(self) -> bool:
+        """드라이버가 응답하는지 (크래시/종료 확인)"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+    
+    def restart(self) -> webdriver.Chrome:
+        self.close()
+        return self.start()
+    
+    def wait_for_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        페이지 준비 대기 -> 준비됐는지 (timeout 초가 지나면 False)
+        
+        훅이 있으면 로드 완료 + 진행 중인 요청/짧은 타이머가 NETWORK_IDLE 초 동안 없을 때
+        (WebDriver 호출 1회), 없으면 document.readyState 폴링
+        """
+        timeout = Config.READY_TIMEOUT if timeout is None else timeout
+        if self.hooked:
+            try:
+                settled = self.driver.execute_async_script(WAIT_FOR_IDLE, Config.NETWORK_IDLE, timeout)
+                if settled is not None:
+                    return settled
+            except WebDriverException:
+                pass  # 대기 중 문서 전환 등 -> readyState 로 확인
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=Config.POLL_INTERVAL).until(
                 lambda d: d.execute_script('return document.readyState') == 'complete'
             )
-        except: pass
+            return True
+        except: return False
 
     def get_console_logs(self) -> List[str]:
         logs = []
@@ -260,11 +485,246 @@ class BrowserManager:
                 except: pass
 
 
+# ============== 브라우저 풀 ==============
+
+def available_memory() -> Optional[int]:
+    """사용 가능한 메모리 (바이트, 알 수 없으면 None)"""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def default_browser_count(limit: Optional[int] = None) -> int:
+    """CPU 수와 사용 가능한 메모리(브라우저당 BROWSER_MEMORY_MB)로 정한 브라우저 수 (1 ~ limit)"""
+    limit = Config.MAX_BROWSERS if limit is None else limit
+    count = os.cpu_count() or 1
+    memory = available_memory()
+    if memory is not None:
+        count = min(count, memory // (Config.BROWSER_MEMORY_MB * 1024 * 1024))
+    return max(1, min(count, limit))
+
+
+def site_origin(url: str) -> str:
+    """URL 의 origin (쿠키를 넣기 전에 열 주소)"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def login(browser: BrowserManager, cookies: Optional[Dict], origin: Optional[str]) -> None:
+    """쿠키가 있으면 대상 origin 을 열고 쿠키 추가 (쿠키는 현재 도메인에만 넣을 수 있음)"""
+    if cookies and origin:
+        try: browser.driver.get(origin)
+        except: pass
+        browser.add_cookies(cookies)
+
+
+class BrowserPool:
+    """
+    BrowserManager N개 - 작업 스레드가 하나씩 빌려 쓰고 돌려줌
+    
+    브라우저는 동시에 시작하며 시작에 실패한 브라우저는 빼고 사용 (하나도 없으면 예외).
+    cookies 가 있으면 새로 시작하거나 다시 시작한 브라우저마다 origin 을 열고 쿠키를 넣음
+    (어느 브라우저가 테스트를 맡아도 같은 로그인 상태).
+    close() 후에는 빌리기가 즉시 None 을 반환하고 사용 중인 브라우저도 종료됨.
+    """
+    
+    def __init__(self, size: int, headless: bool = True, timeout: int = 10, factory=BrowserManager,
+                 initial: List[BrowserManager] = (), native_dialogs: bool = False,
+                 cookies: Dict = None, origin: Optional[str] = None):
+        self.size = max(1, size)
+        self.headless = headless
+        self.timeout = timeout
+        self.native_dialogs = native_dialogs
+        self.cookies = cookies
+        self.origin = origin
+        self.factory = factory
+        self.restarts = 0
+        self.browsers: List[BrowserManager] = []
+        self._idle: 'queue.Queue[BrowserManager]' = queue.Queue()
+        self._closed = threading.Event()
+        # 이미 시작된 브라우저 (세션의 기본 브라우저 등)는 그대로 풀에 넣음
+        for browser in list(initial)[:self.size]:
+            self.browsers.append(browser)
+            self._idle.put(browser)
+    
+    def __len__(self) -> int:
+        return len(self.browsers)
+    
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+    
+    def start(self) -> int:
+        """모자란 브라우저 시작 -> 사용 가능한 브라우저 수"""
+        def launch(_):
+            browser = self.factory(headless=self.headless, timeout=self.timeout, native_dialogs=self.native_dialogs)
+            browser.start()
+            login(browser, self.cookies, self.origin)
+            return browser
+        
+        missing = self.size - len(self.browsers)
+        if missing <= 0:
+            return len(self.browsers)
+        errors = []
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            for future in as_completed([executor.submit(launch, i) for i in range(missing)]):
+                try:
+                    browser = future.result()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                self.browsers.append(browser)
+                self._idle.put(browser)
+        if not self.browsers:
+            raise errors[0]
+        return len(self.browsers)
+    
+    def acquire(self) -> Optional[BrowserManager]:
+        """쉬는 브라우저 하나 (없으면 대기, 풀이 닫히면 None)"""
+        while not self._closed.is_set():
+            try:
+                return self._idle.get(timeout=0.2)
+            except queue.Empty:
+                continue
+        return None
+    
+    def release(self, browser: BrowserManager) -> None:
+        if not self._closed.is_set():
+            self._idle.put(browser)
+    
+    def revive(self, browser: BrowserManager) -> bool:
+        """크래시한 브라우저 재시작 (살아 있으면 그대로) -> 사용 가능한지"""
+        if self.closed:
+            return False
+        if browser.is_alive():
+            return True
+        try:
+            browser.restart()
+        except Exception:
+            return False
+        login(browser, self.cookies, self.origin)
+        self.restarts += 1
+        return True
+    
+    @contextmanager
+    def lease(self):
+        browser = self.acquire()
+        try:
+            yield browser
+        finally:
+            if browser is not None:
+                self.release(browser)
+    
+    def close(self) -> None:
+        self._closed.set()
+        for browser in self.browsers:
+            browser.close()
+
+
+class BrowserSession:
+    """
+    스캔 작업 하나가 크롤링 -> 저장된 XSS 분석 -> 반사형 스캔 단계에서 함께 쓰는 브라우저
+    
+    단계마다 Chrome 을 새로 띄우지 않고, 크래시했을 때만 다시 시작합니다.
+    반사형 스캔의 브라우저 풀도 기본 브라우저를 포함하여 만들고 작업이 끝날 때까지 유지합니다.
+    set_login() 으로 쿠키를 알려주면 기본 브라우저를 (다시) 시작할 때마다 로그인 쿠키를 넣고
+    풀 브라우저에도 같은 쿠키를 넣습니다.
+    
+    사용법:
+        with BrowserSession(headless=True) as session:
+            crawler = SeleniumCrawler(url, session=session)
+            scanner = SeleniumXSSScanner(session=session)
+            pages = crawler.crawl()
+            scanner.scan_page_content(pages)
+            scanner.scan_pages(pages)
+    """
+    
+    def __init__(self, headless: bool = True, timeout: int = 10, factory=BrowserManager,
+                 native_dialogs: bool = False):
+        """native_dialogs: 대화상자를 가로채지 않고 그대로 띄움 (화면에 보이는 Alert 모드)"""
+        self.headless = headless
+        self.timeout = timeout
+        self.native_dialogs = native_dialogs
+        self.factory = factory
+        self.starts = 0
+        self.restarts = 0
+        self.cookies: Optional[Dict] = None
+        self.origin: Optional[str] = None
+        self._browser: Optional[BrowserManager] = None
+        self._pool: Optional[BrowserPool] = None
+        self._lock = threading.Lock()
+    
+    def set_login(self, cookies: Dict, url: str) -> None:
+        """로그인 쿠키와 대상 URL 기록 (실행 중인 기본 브라우저에는 바로 넣고, 이후 시작/재시작 때마다 다시 넣음)"""
+        origin = site_origin(url)
+        with self._lock:
+            if not cookies or (cookies, origin) == (self.cookies, self.origin):
+                return
+            self.cookies, self.origin = dict(cookies), origin
+            browser = self._browser
+            if browser is not None and browser.is_alive():
+                login(browser, self.cookies, self.origin)
+    
+    def ensure(self) -> BrowserManager:
+        """살아 있는 기본 브라우저 (처음이면 시작, 크래시했으면 다시 시작)"""
+        with self._lock:
+            browser = self._browser
+            if browser is not None and browser.is_alive():
+                return browser
+            if browser is None:
+                browser = self._browser = self.factory(headless=self.headless, timeout=self.timeout,
+                                                       native_dialogs=self.native_dialogs)
+            else:
+                browser.close()
+                self.restarts += 1
+            browser.start()
+            login(browser, self.cookies, self.origin)
+            self.starts += 1
+            return browser
+    
+    def pool(self, size: int, cookies: Dict = None, origin: Optional[str] = None) -> BrowserPool:
+        """기본 브라우저를 포함한 브라우저 풀 (열려 있으면 재사용, 추가 브라우저는 cookies 로 로그인)"""
+        browser = self.ensure()
+        with self._lock:
+            if cookies is None or origin is None:
+                cookies, origin = self.cookies, self.origin
+            if self._pool is None or self._pool.closed:
+                self._pool = BrowserPool(size, headless=self.headless, timeout=self.timeout,
+                                         factory=self.factory, initial=[browser],
+                                         native_dialogs=self.native_dialogs, cookies=cookies, origin=origin)
+                self._pool.start()
+            return self._pool
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+            if self._browser is not None:
+                self._browser.close()
+                self._browser = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
 # ============== 크롤러 ==============
 
 class SeleniumCrawler:
     def __init__(self, base_url: str, cookies: Dict = None, max_pages: int = 30, 
-                 max_depth: int = 3, headless: bool = True, timeout: int = 10, callback=None):
+                 max_depth: int = 3, headless: bool = True, timeout: int = 10, callback=None,
+                 session: BrowserSession = None):
         self.base_url = self._normalize_url(base_url)
         self.cookies = cookies
         self.max_pages = max_pages
@@ -277,7 +737,10 @@ class SeleniumCrawler:
         self.domain = parsed.netloc
         self.scheme = parsed.scheme
         
-        self.browser = BrowserManager(headless=headless, timeout=timeout)
+        # 브라우저 세션 (넘겨받으면 다음 단계에서 같은 브라우저 사용, 아니면 크롤링 후 종료)
+        self.session = session if session is not None else BrowserSession(headless=headless, timeout=timeout)
+        self._owns_session = session is None
+        self.browser: Optional[BrowserManager] = None
         self.visited: Set[str] = set()
         self.pages: List[PageInfo] = []
         self.stop_flag = False
@@ -361,7 +824,11 @@ class SeleniumCrawler:
         self.log(f"\n🌐 크롤링 시작: {self.base_url}", 'info')
         
         try:
-            driver = self.browser.start()
+            # 세션이 시작/재시작할 때마다 로그인 쿠키를 넣음
+            if self.cookies:
+                self.session.set_login(self.cookies, self.base_url)
+            self.browser = self.session.ensure()
+            driver = self.browser.driver
         except Exception as e:
             self.log(f"❌ 브라우저 시작 실패: {e}", 'danger')
             return []
@@ -370,17 +837,12 @@ class SeleniumCrawler:
             driver.get(self.base_url)
             self.browser.wait_for_ready()
             
-            if self.cookies:
-                self.browser.add_cookies(self.cookies)
-                driver.refresh()
-                self.browser.wait_for_ready()
-            
             xss_found, evidence = self.browser.check_xss_in_console()
             if xss_found:
                 self.log(f"   🔴 초기 페이지 XSS 감지!", 'danger')
                 
         except Exception as e:
-            self.browser.close()
+            self._close_browser()
             return []
         
         queue = deque([(self.base_url, 0)])
@@ -393,7 +855,10 @@ class SeleniumCrawler:
             try:
                 driver.get(url)
                 self.browser.wait_for_ready()
-            except: continue
+            except:
+                driver = self._recover()
+                if driver is None: break
+                continue
             
             page_info = self._extract_page_info(url)
             if page_info:
@@ -410,20 +875,42 @@ class SeleniumCrawler:
                         self.visited.add(normalized)
                         queue.append((link, depth + 1))
         
-        self.browser.close()
+        self._close_browser()
         self.log(f"\n✅ 크롤링 완료: {len(self.pages)}개 페이지", 'success')
         return self.pages
     
+    def _recover(self):
+        """페이지 로드 실패 후 브라우저가 크래시했으면 다시 시작 -> 드라이버 (중단/재시작 실패 시 None)"""
+        if self.stop_flag:
+            return None
+        try:
+            restarts = self.session.restarts
+            self.browser = self.session.ensure()
+        except Exception as e:
+            self.log(f"❌ 브라우저 재시작 실패: {e}", 'danger')
+            return None
+        if self.session.restarts > restarts:
+            self.log("  ♻️ 브라우저 크래시 -> 다시 시작 (로그인 쿠키는 세션이 다시 넣음)", 'warning')
+        return self.browser.driver
+    
+    def _close_browser(self):
+        # 넘겨받은 세션은 다음 단계에서 계속 사용
+        if self._owns_session:
+            self.session.close()
+    
     def stop(self):
         self.stop_flag = True
-        self.browser.close()
+        # 넘겨받은 세션은 다음 단계/소유자가 계속 사용 -> 크롤링 루프가 stop_flag 로 멈춤
+        if self._owns_session:
+            self.session.close()
 
 
 # ============== XSS 스캐너 ==============
 
 class SeleniumXSSScanner:
     def __init__(self, cookies: Dict = None, headless: bool = True, timeout: int = 10, 
-                 callback=None, alert_mode: bool = False):
+                 callback=None, alert_mode: bool = False, browsers: Optional[int] = None,
+                 session: BrowserSession = None):
         """
         XSS 스캐너 초기화
         
@@ -433,61 +920,97 @@ class SeleniumXSSScanner:
             timeout: 타임아웃 (초)
             callback: GUI 콜백 함수
             alert_mode: True면 alert() 사용, False면 console.log() 사용
+            browsers: 반사형 스캔 브라우저 수 (None 이면 CPU/메모리로 결정)
+            session: 브라우저 세션 (크롤러와 공유하면 단계마다 Chrome 을 새로 띄우지 않음)
         """
         self.cookies = cookies
         self.headless = headless
         self.timeout = timeout
         self.callback = callback
         self.alert_mode = alert_mode  # [v5.5] Alert 모드 추가
-        self.browser = None
-        self.results: List[ScanResult] = []
+        self.browsers = browsers
+        # 넘겨받은 세션은 닫지 않음 (작업을 소유한 쪽에서 닫음), 없으면 반사형 스캔 후 종료
+        self.session = session if session is not None else BrowserSession(headless=headless, timeout=timeout,
+                                                                          native_dialogs=alert_mode)
+        self._owns_session = session is None
+        self.browser: Optional[BrowserManager] = None
+        self.pool: Optional[BrowserPool] = None
+        self.results = ResultStore()
         self.stored_xss_results: List[StoredXSSResult] = []
+        self.stored_index = FindingIndex()  # 페이지 간 같은 결과를 묶은 색인
         self.stop_flag = False
     
     def log(self, message: str, level: str = 'info'):
         if self.callback: self.callback(message, level)
     
-    def _start_browser(self):
+    def _start_browser(self, url: Optional[str] = None):
         if not self.browser:
-            self.browser = BrowserManager(headless=self.headless, timeout=self.timeout)
-            self.browser.start()
-            if self.cookies:
-                try: self.browser.driver.get('about:blank')
-                except: pass
+            # 크롤러와 공유하는 세션이면 이미 같은 쿠키가 기록됨, 자체 세션이면 대상 URL 에서 로그인
+            if self.cookies and url:
+                self.session.set_login(self.cookies, url)
+            self.browser = self.session.ensure()
+    
+    def _recover(self) -> bool:
+        """오류 후 브라우저가 크래시했으면 다시 시작 -> 계속할 수 있는지"""
+        if self.stop_flag:
+            return False
+        try:
+            restarts = self.session.restarts
+            self.browser = self.session.ensure()
+        except Exception as e:
+            self.log(f"❌ 브라우저 재시작 실패: {e}", 'danger')
+            return False
+        if self.session.restarts > restarts:
+            self.log("  ♻️ 브라우저 크래시 -> 다시 시작", 'warning')
+        return True
     
     def _close_browser(self):
-        if self.browser:
-            self.browser.close()
-            self.browser = None
+        self.browser = None
+        self.pool = None
+        if self._owns_session:
+            self.session.close()
+    
+    def browser_count(self) -> int:
+        return self.browsers if self.browsers is not None else default_browser_count()
+    
+    def _start_pool(self, tests: int, url: Optional[str] = None):
+        """
+        반사형 스캔 브라우저 풀 (세션 기본 브라우저 포함, 테스트 수보다 많이 띄우지 않음)
+        
+        추가로 띄운 브라우저도 세션에 기록된 (없으면 url 의 origin 에서) 로그인 쿠키를 받음
+        """
+        if self.pool is None:
+            if self.cookies and url:
+                self.session.set_login(self.cookies, url)
+            self.pool = self.session.pool(min(self.browser_count(), max(1, tests)))
     
     def scan_page_content(self, pages: List[PageInfo]) -> List[StoredXSSResult]:
         self.stored_xss_results = []
         self.log(f"\n🔎 저장된 XSS 분석 ({len(pages)}개 페이지)", 'info')
         
         if not pages: return []
-        self._start_browser()
+        self._start_browser(pages[0].url)
+        # 공유 세션이면 크롤링 중 쌓인 콘솔 로그를 비움 (폴링 감지 시 다른 페이지 결과로 오인 방지)
+        self.browser.get_console_logs()
         
         for i, page in enumerate(pages):
             if self.stop_flag: break
             try:
                 self.browser.driver.get(page.url)
-                self.browser.wait_for_ready()
+                if not self.browser.hooked:
+                    self.browser.wait_for_ready()
+                
+                xss_found, evidence = self._detect_execution(self.browser, 0)
                 
                 # Alert 확인 (저장된 XSS가 alert를 실행했을 수 있음)
-                try:
-                    alert = self.browser.driver.switch_to.alert
-                    evidence = f"Alert: {alert.text}"
-                    alert.accept()
+                if xss_found and evidence.startswith('Alert: '):
                     self.log(f"  [{i+1}] 🔴 XSS Alert 감지!", 'danger')
                     self.stored_xss_results.append(StoredXSSResult(
                         url=page.url, pattern_name='🔴 XSS Alert 실행됨!', 
                         matched_content=evidence[:100], console_evidence=evidence
                     ))
                     continue
-                except NoAlertPresentException:
-                    pass
                 
-                xss_found, evidence = self.browser.check_xss_in_console()
                 if xss_found:
                     self.log(f"  [{i+1}] 🔴 XSS 실행됨! (콘솔)", 'danger')
                     self.stored_xss_results.append(StoredXSSResult(
@@ -508,16 +1031,21 @@ class SeleniumXSSScanner:
                 if self.callback:
                     progress = int(((i + 1) / len(pages)) * 100)
                     self.callback(None, 'content_progress', progress)
-            except: pass
+            except:
+                if not self._recover(): break
         
-        if self.stored_xss_results: self.log(f"\n⚠️ 저장된 XSS {len(self.stored_xss_results)}개 발견", 'danger')
+        self.stored_index = FindingIndex(self.stored_xss_results)
+        if self.stored_xss_results:
+            self.log(f"\n⚠️ 저장된 XSS {len(self.stored_xss_results)}개 발견 (고유 {len(self.stored_index)}개)", 'danger')
         else: self.log(f"\n✅ 저장된 XSS 패턴 없음", 'success')
         return self.stored_xss_results
     
-    def _inject_and_check(self, url: str, param: str, payload: str, method: str = 'get', form_data: Dict = None) -> ScanResult:
+    def _inject_and_check(self, url: str, param: str, payload: str, method: str = 'get', form_data: Dict = None,
+                          browser: BrowserManager = None) -> ScanResult:
         result = ScanResult(url=url, parameter=param, payload=payload, reflected=False, vulnerable=False)
+        browser = browser or self.browser
         try:
-            driver = self.browser.driver
+            driver = browser.driver
             
             if method == 'get':
                 parsed = urlparse(url)
@@ -527,7 +1055,7 @@ class SeleniumXSSScanner:
                 driver.get(injected_url)
             else:
                 driver.get(url)
-                self.browser.wait_for_ready()
+                browser.wait_for_ready()
                 if form_data:
                     for k, v in form_data.items():
                         try: driver.find_element(By.NAME, k).send_keys(v)
@@ -535,29 +1063,7 @@ class SeleniumXSSScanner:
                 try: driver.find_element(By.CSS_SELECTOR, 'input[type="submit"], button[type="submit"]').click()
                 except: pass
             
-            # [복구] 충분한 대기 시간 확보 (0.8초 -> 2.0초)
-            # 네트워크가 느리거나 스크립트 실행이 지연될 경우를 대비
-            start_time = time.time()
-            executed = False
-            evidence = ""
-            
-            while time.time() - start_time < 2.0:
-                # Alert 확인 (alert 모드 또는 기존 alert 기반 페이로드)
-                try:
-                    alert = driver.switch_to.alert
-                    evidence = f"Alert: {alert.text}"
-                    alert.accept()
-                    executed = True
-                    break
-                except NoAlertPresentException: 
-                    pass
-                
-                # 콘솔 로그 확인 (console.log 모드)
-                if not self.alert_mode:
-                    executed, evidence = self.browser.check_xss_in_console()
-                    if executed: break
-                
-                time.sleep(0.1)
+            executed, evidence = self._detect_execution(browser, Config.PAGE_LOAD_WAIT)
 
             if executed:
                 result.executed = True
@@ -567,74 +1073,223 @@ class SeleniumXSSScanner:
                 result.reflected = True
                 
             return result
-        except: return result
+        except Exception as e:
+            # 오류 결과는 저널에 기록되지 않아 재개 시 다시 시도됨
+            result.response_snippet = f"Error: {str(e)[:30]}"
+            return result
     
-    def scan_pages(self, pages: List[PageInfo], quick_mode: bool = True) -> List[ScanResult]:
+    def _detect_execution(self, browser: BrowserManager, poll_for: float) -> Tuple[bool, str]:
+        """
+        페이지 로드 후 XSS 실행 감지 -> (실행됨, 증거)
+        
+        실행 감지 훅이 있으면 실행 즉시 또는 로드 + EXECUTION_QUIET 초 후 반환 (WebDriver 호출 1회).
+        훅을 쓸 수 없으면 poll_for 초 동안 alert/콘솔 폴링 (0 이면 한 번만 확인)
         """
-        반사형 XSS 스캔
+        detected = browser.wait_for_execution()
+        if detected is not None:
+            return detected
+        
+        deadline = time.time() + poll_for
+        while True:
+            # Alert 확인 (alert 모드 또는 기존 alert 기반 페이로드)
+            evidence = browser.take_alert()
+            if evidence is not None:
+                return True, evidence
+            
+            # 콘솔 로그 확인 (console.log 모드)
+            if not self.alert_mode:
+                executed, evidence = browser.check_xss_in_console()
+                if executed: return True, evidence
+            
+            if time.time() >= deadline:
+                return False, ""
+            time.sleep(Config.POLL_INTERVAL)
+    
+    def plan(self, pages: List[PageInfo], quick_mode: bool = True, budget: Optional[float] = None,
+             latency: Optional[float] = None) -> ScanPlan:
+        """
+        스캔 계획 생성 (동시성 = 브라우저 풀 크기)
+        
+        latency 가 없으면 깨끗한 페이지의 실행 대기 시간(EXECUTION_QUIET) + 기본 지연으로 추정
+        """
+        if latency is None:
+            latency = Config.EXECUTION_QUIET + DEFAULT_LATENCY
+        return plan_scan(pages, get_payloads(True, self.alert_mode), get_payloads(False, self.alert_mode),
+                         latency=latency, concurrency=self.browser_count(), budget=budget, full=not quick_mode)
+    
+    def scan_pages(self, pages: List[PageInfo], quick_mode: bool = True, journal: ScanJournal = None,
+                   plan: ScanPlan = None) -> ResultStore:
+        """
+        반사형 XSS 스캔 - 테스트를 브라우저 풀에 나누어 병렬 실행
         
         Args:
             pages: 스캔할 페이지 목록
             quick_mode: True면 빠른 스캔 (7개 페이로드)
+            journal: 스캔 저널 (주어지면 완료된 테스트는 건너뛰고 기록된 결과를 합침,
+                     처음 실행할 때 기록한 테스트 목록이 있으면 quick_mode/plan 대신 그 목록으로 재개)
+            plan: 스캔 계획 (주어지면 quick_mode 대신 계획의 페이로드 선택과 순서를 따름)
         
         Returns:
-            ScanResult 목록
+            ResultStore (양성 결과 + 엔드포인트별 집계)
         """
-        self.results = []
-        self.stop_flag = False
-        
-        # [v5.5] Alert 모드에 따라 페이로드 선택
-        payloads = get_payloads(quick_mode=quick_mode, alert_mode=self.alert_mode)
-        
         # 모드 로그 출력
         mode_text = "🔔 Alert 모드 (팝업)" if self.alert_mode else "📋 Console 모드 (로그)"
         self.log(f"   {mode_text}", 'info')
         
-        tasks = []
+        # 테스트 목록: (종류, URL/action, 대상 파라미터/입력 필드, 폼, 페이로드)
+        tests = []
+        recorded = journal.load_plan() if journal is not None else None
+        if recorded is not None:
+            quick_mode, keys = recorded
+            # 처음 실행 때의 페이로드 (빠른/전체, Alert/Console 모드) 중 기록된 테스트만 같은 순서로
+            payloads = []
+            for quick, alert in ((True, False), (False, False), (True, True), (False, True)):
+                payloads.extend(p for p in get_payloads(quick_mode=quick, alert_mode=alert) if p not in payloads)
+            by_key = {self.test_key(test): test for test in self._build_tests(pages, payloads)}
+            tests = [by_key[key] for key in keys if key in by_key]
+            self.log(f"📒 저널의 테스트 목록으로 재개 ({'빠른' if quick_mode else '전체'} 스캔, {len(tests)}개 테스트)", 'info')
+        elif plan is not None:
+            self.log(plan.describe(), 'info')
+            for test in plan.tests():
+                ep = test.endpoint
+                if ep.kind == 'url':
+                    tests.append(('url', ep.url, ep.parameter, None, test.payload))
+                else:
+                    tests.append(('form', ep.url, ep.input_field, ep.form, test.payload))
+        else:
+            # [v5.5] Alert 모드에 따라 페이로드 선택
+            tests = self._build_tests(pages, get_payloads(quick_mode=quick_mode, alert_mode=self.alert_mode))
+        
+        if journal is not None and recorded is None:
+            journal.record_plan([self.test_key(test) for test in tests], quick_mode)
+        return self.run_tests(tests, pages, journal)
+    
+    @staticmethod
+    def _build_tests(pages: List[PageInfo], payloads: List[str]) -> List[tuple]:
+        tests = []
         for p in pages:
-            for param in p.params: tasks.append(('url', p.url, param, None))
+            for param in p.params:
+                tests.extend(('url', p.url, param, None, payload) for payload in payloads)
             for form in p.forms:
-                for inp in form['inputs']: tasks.append(('form', form['action'], inp, form))
+                for inp in form['inputs']:
+                    tests.extend(('form', form['action'], inp, form, payload) for payload in payloads)
+        return tests
+    
+    @staticmethod
+    def test_key(test: tuple) -> tuple:
+        """테스트 (종류, URL/action, 대상, 폼, 페이로드)의 저널 키"""
+        type_, url, target, extra, payload = test
+        if type_ == 'url':
+            return task_key('url', 'get', url, target, payload)
+        return task_key('form', extra['method'], extra['action'], target['name'], payload)
+    
+    def run_tests(self, tests: List[tuple], pages: List[PageInfo] = (), journal: ScanJournal = None,
+                  on_result=None) -> ResultStore:
+        """
+        테스트 목록을 브라우저 풀에 나누어 병렬 실행
         
-        if not tasks:
-            self.log("⚠️ 스캔할 대상이 없습니다.", 'warning')
-            return []
+        Args:
+            tests: [(종류, URL/action, 대상 파라미터/입력 필드, 폼, 페이로드), ...]
+            pages: 저널에 기록할 페이지 목록
+            journal: 스캔 저널
+            on_result: 결과마다 on_result(테스트, 결과) 호출 (스캔 스레드, 복원된 결과 제외)
+        """
+        self.results = ResultStore()
+        self.stop_flag = False
         
-        self.log(f"\n🚀 스캔 시작 (총 {len(tasks) * len(payloads)}개 테스트)", 'info')
-        self._start_browser()
+        if not tests:
+            self.log("⚠️ 스캔할 대상이 없습니다.", 'warning')
+            return self.results
         
-        total = len(tasks) * len(payloads)
+        total = len(tests)
         current = 0
         
-        for type_, url, target, extra in tasks:
-            if self.stop_flag: break
-            
-            for payload in payloads:
-                if self.stop_flag: break
+        # 저널에서 완료된 테스트 복원
+        completed = {}
+        if journal is not None:
+            completed = journal.load()
+            if journal.load_pages() is None:
+                journal.record_pages(pages)
+            if completed:
+                self.log(f"📒 저널에서 완료된 테스트 복원 ({len(completed)}개 기록)", 'info')
+        
+        pending = []  # (저널 키, 테스트)
+        for test in tests:
+            key = self.test_key(test)
+            restored = completed.get(key)
+            if restored is not None:
+                self.results.add(restored)
                 current += 1
-                
-                if type_ == 'url':
-                    res = self._inject_and_check(url, target, payload, 'get')
-                else:
-                    form_data = {inp['name']: (payload if inp['name'] == target['name'] else inp.get('value', 'test')) for inp in extra['inputs']}
-                    res = self._inject_and_check(extra['action'], f"{target['name']}", payload, extra['method'], form_data)
-                
-                self.results.append(res)
-                
-                if res.executed:
-                    self.log(f"  🔴 XSS 성공! [{res.parameter}]", 'danger')
-                elif res.vulnerable:
-                    self.log(f"  🟠 취약점 의심 [{res.parameter}]", 'warning')
-                
-                if self.callback and current % 5 == 0:
-                    self.callback(None, 'scan_progress', int((current / total) * 100))
+            else:
+                pending.append((key, test))
+        if not pending:
+            return self.results
         
-        self._close_browser()
+        self._start_pool(len(pending), pending[0][1][1])
+        pool = self.pool
+        self.log(f"\n🚀 스캔 시작 (총 {total}개 테스트, 브라우저 {len(pool)}개)", 'info')
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(pool)) as executor:
+                futures = {executor.submit(self._run_test, pool, test): (key, test) for key, test in pending}
+                for future in as_completed(futures):
+                    res = future.result()
+                    # 중단 중 브라우저가 닫혀 실패한 테스트는 기록하지 않음
+                    if self.stop_flag or res is None: break
+                    current += 1
+                    key, test = futures[future]
+                    
+                    record = self.results.add(res)
+                    if record is not None and self.callback:
+                        self.callback(None, 'scan_result', record)
+                    if journal is not None:
+                        journal.record(key, res)
+                    if on_result is not None:
+                        on_result(test, res)
+                    
+                    if res.executed:
+                        self.log(f"  🔴 XSS 성공! [{res.parameter}]", 'danger')
+                    elif res.vulnerable:
+                        self.log(f"  🟠 취약점 의심 [{res.parameter}]", 'warning')
+                    
+                    if self.callback and current % 5 == 0:
+                        self.callback(None, 'scan_progress', int((current / total) * 100))
+                if self.stop_flag:
+                    for future in futures:
+                        future.cancel()
+        finally:
+            self._close_browser()
+        if pool.restarts:
+            self.log(f"   (크래시한 브라우저 {pool.restarts}회 다시 시작)", 'warning')
         return self.results
     
+    def _run_test(self, pool: BrowserPool, test: tuple) -> Optional[ScanResult]:
+        """테스트 하나를 풀의 브라우저로 실행 (작업 스레드, 중단되면 None)"""
+        type_, url, target, extra, payload = test
+        if self.stop_flag:
+            return None
+        with pool.lease() as browser:
+            if browser is None or self.stop_flag:
+                return None
+            if type_ == 'url':
+                result = self._inject_and_check(url, target, payload, 'get', browser=browser)
+            else:
+                form_data = {inp['name']: (payload if inp['name'] == target['name'] else inp.get('value', 'test')) for inp in extra['inputs']}
+                result = self._inject_and_check(extra['action'], f"{target['name']}", payload, extra['method'], form_data,
+                                                browser=browser)
+            # 오류 결과는 저널에 기록되지 않아 재개 시 다시 시도됨, 크래시한 브라우저는 다시 시작
+            if result.response_snippet and not self.stop_flag:
+                pool.revive(browser)
+            return result
+    
     def stop(self):
         self.stop_flag = True
-        self._close_browser()
+        # 자체 세션만 닫아 즉시 중단, 넘겨받은 세션은 소유자가 닫음
+        # (작업 스레드는 stop_flag 를 보고 풀에서 브라우저를 빌리지 않고 끝남, 진행 중인 테스트는 결과를 버림)
+        if self._owns_session:
+            self.session.close()
+            self.browser = None
+            self.pool = None
 
 # 하위 호환성
 SiteCrawler = SeleniumCrawler
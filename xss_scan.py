@@ -0,0 +1,279 @@
+"""
+================================================================================
+XSS Scanner - 헤드리스 CLI (xss_scan.py)
+================================================================================
+
+GUI 없이 크롤링 -> 저장된 XSS 분석 -> 폼/파라미터 스캔을 실행하고
+결과를 JSONL (한 줄에 이벤트 하나) 로 stdout 에 스트리밍합니다.
+
+- tkinter 를 사용하지 않음
+- 엔진 모듈(requests/bs4, selenium)은 인자 파싱 후 선택된 엔진만 지연 로드
+  -> 작업 실행기에서 수백 개의 짧은 스캔을 띄워도 시작 비용이 작음
+- 로그는 stderr, 결과는 stdout (또는 --output 파일)
+
+이벤트:
+    {"event": "page",   "url": ..., "forms": n, "params": [...]}
+    {"event": "stored", "url": ..., "pattern_name": ..., "line_number": ..., "status": ...}
+    {"event": "resolved", "template": ..., "pattern_name": ..., "first_seen": ...}  (--findings-db)
+    {"event": "result", "url": ..., "parameter": ..., "payload": ..., "vulnerable": ...}
+    {"event": "plan",   "target": ..., "tests": n, "estimated_seconds": ...}  (--budget/--dry-run)
+    {"event": "summary", "target": ..., "tests": n, "vulnerable": n, "partial_pages": n, ...}
+
+종료 코드: 0 = 취약점 없음, 1 = 취약점 발견, 2 = 인자 오류,
+          3 = 취약점은 없지만 스캔하지 못한 대상이 있음 (error 이벤트)
+
+사용법:
+    python -m xss_scan http://localhost:5000
+    python -m xss_scan --engine selenium --full http://a.com http://b.com
+    python -m xss_scan --engine hybrid http://a.com    # HTTP 로 전체 테스트, 반사된 것만 브라우저 확인
+    python -m xss_scan --targets targets.txt --output results.jsonl
+    python -m xss_scan --dry-run http://a.com          # 계획/예상 시간만 확인
+    python -m xss_scan --budget 1800 http://a.com      # 30분 안에 끝나도록 계획
+    python -m xss_scan --findings-db findings.db http://a.com   # 이전 실행 대비 새/해결된 결과
+================================================================================
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config import Config, __version__
+
+
+ENGINES = ('requests', 'selenium', 'hybrid')
+
+
+def parse_cookies(cookie_str: Optional[str]) -> Optional[Dict[str, str]]:
+    """'a=1; b=2' 형식의 쿠키 문자열 파싱"""
+    if not cookie_str:
+        return None
+    cookies = {}
+    for item in cookie_str.split(';'):
+        if '=' in item:
+            k, v = item.strip().split('=', 1)
+            cookies[k] = v
+    return cookies or None
+
+
+def load_engine(name: str):
+    """선택된 엔진의 (크롤러, 스캐너) 클래스를 지연 로드"""
+    if name == 'selenium':
+        from xss_engine_selenium import SeleniumCrawler, SeleniumXSSScanner
+        return SeleniumCrawler, SeleniumXSSScanner
+    if name == 'hybrid':
+        from xss_engine import SiteCrawler
+        from hybrid_engine import HybridXSSScanner
+        return SiteCrawler, HybridXSSScanner
+    from xss_engine import SiteCrawler, XSSScanner
+    return SiteCrawler, XSSScanner
+
+
+# ==============================================================================
+# 출력
+# ==============================================================================
+
+class JsonlWriter:
+    """이벤트를 JSONL 로 출력 (스레드 안전, 줄 단위 flush)"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **data) -> None:
+        line = json.dumps({'event': event, **data}, ensure_ascii=False, default=str)
+        with self._lock:
+            self.stream.write(line + '\n')
+            self.stream.flush()
+
+
+def make_callback(out: JsonlWriter, quiet: bool = False):
+    """엔진 콜백 -> 로그는 stderr, 양성 결과는 즉시 JSONL 로 출력"""
+    def callback(message, level, data=None):
+        if level == 'scan_result':
+            out.emit('result', **data.to_dict())
+        elif message and not quiet:
+            print(message, file=sys.stderr, flush=True)
+    return callback
+
+
+# ==============================================================================
+# 실행
+# ==============================================================================
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='xss_scan', description='XSS 취약점 탐지 도구 (헤드리스 CLI)')
+    parser.add_argument('urls', nargs='*', metavar='URL', help='스캔할 기본 URL')
+    parser.add_argument('-t', '--targets', help='대상 파일 (한 줄에 URL 하나, # 주석 허용)')
+    parser.add_argument('-e', '--engine', choices=ENGINES, default='requests',
+                        help='스캔 엔진 (기본값: requests, hybrid: 반사된 테스트만 브라우저에서 실행 확인)')
+    parser.add_argument('--max-pages', type=int, default=Config.DEFAULT_MAX_PAGES, help='최대 크롤링 페이지 수')
+    parser.add_argument('--max-depth', type=int, default=Config.DEFAULT_MAX_DEPTH, help='최대 크롤링 깊이')
+    parser.add_argument('--timeout', type=int, default=Config.DEFAULT_TIMEOUT, help='요청 타임아웃 (초)')
+    parser.add_argument('--threads', type=int, default=20, help='requests 엔진 스레드 수')
+    parser.add_argument('--full', action='store_true', help='전체 페이로드 사용 (기본값: 빠른 스캔)')
+    parser.add_argument('--cookie', help="로그인 쿠키 ('name=value; name2=value2')")
+    parser.add_argument('--alert-mode', action='store_true', help='selenium 엔진에서 alert() 페이로드 사용')
+    parser.add_argument('--no-headless', action='store_true', help='selenium/hybrid 엔진에서 브라우저 창 표시')
+    parser.add_argument('--browsers', type=int, metavar='N',
+                        help='selenium/hybrid 엔진 병렬 브라우저 수 (기본값: CPU/메모리로 결정)')
+    parser.add_argument('--budget', type=float, metavar='SECONDS',
+                        help='시간 예산 (초). 엔드포인트별 빠른/전체 페이로드를 예산에 맞게 선택')
+    parser.add_argument('--content-analysis', choices=('regex', 'dom'), default=Config.CONTENT_ANALYSIS,
+                        help='requests/hybrid 엔진 저장된 XSS 분석 방식 (dom: 크롤링 때 파싱한 트리 순회)')
+    parser.add_argument('--dry-run', action='store_true', help='크롤링 후 스캔 계획/예상 시간만 출력')
+    parser.add_argument('--journal', help='스캔 저널 경로 (단일 대상, 중단 후 같은 경로로 재개)')
+    parser.add_argument('--findings-db', metavar='PATH',
+                        help='저장된 XSS 변경 추적 DB (requests/hybrid 엔진, 바뀌지 않은 페이지는 분석 생략)')
+    parser.add_argument('-o', '--output', help='JSONL 출력 파일 (기본값: stdout)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='stderr 진행 로그 생략')
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    return parser
+
+
+def scan_target(args, base_url: str, out: JsonlWriter, callback) -> dict:
+    """대상 하나를 크롤링/분석/스캔하고 요약 반환"""
+    Crawler, Scanner = load_engine(args.engine)
+    cookies = parse_cookies(args.cookie)
+    started = time.time()
+
+    session = None
+    if args.engine == 'selenium':
+        from xss_engine_selenium import BrowserSession
+        # 크롤링/분석/스캔 단계가 하나의 브라우저 세션을 공유 (크래시했을 때만 다시 시작)
+        session = BrowserSession(headless=not args.no_headless, timeout=args.timeout, native_dialogs=args.alert_mode)
+        crawler = Crawler(base_url, cookies=cookies, max_pages=args.max_pages, max_depth=args.max_depth,
+                          headless=not args.no_headless, timeout=args.timeout, callback=callback, session=session)
+        scanner = Scanner(cookies=cookies, headless=not args.no_headless, timeout=args.timeout,
+                          callback=callback, alert_mode=args.alert_mode, browsers=args.browsers, session=session)
+    else:
+        from http_transport import HttpTransport
+        # 크롤링/분석/스캔 단계가 하나의 세션과 커넥션 풀을 공유
+        transport = HttpTransport(cookies=cookies, pool_size=args.threads)
+        crawler = Crawler(base_url, max_pages=args.max_pages, max_depth=args.max_depth,
+                          timeout=args.timeout, callback=callback, transport=transport,
+                          content_analysis=args.content_analysis)
+        if args.engine == 'hybrid':
+            # 반사된 테스트만 브라우저에서 확인 (브라우저는 후보가 있을 때만 시작)
+            scanner = Scanner(timeout=args.timeout, callback=callback, threads=args.threads, transport=transport,
+                              content_analysis=args.content_analysis, cookies=cookies,
+                              headless=not args.no_headless, browsers=args.browsers)
+        else:
+            scanner = Scanner(timeout=args.timeout, callback=callback, threads=args.threads, transport=transport,
+                              content_analysis=args.content_analysis)
+
+    try:
+        return run_phases(args, base_url, out, crawler, scanner, started)
+    finally:
+        if session is not None:
+            session.close()
+
+
+def run_phases(args, base_url: str, out: JsonlWriter, crawler, scanner, started: float) -> dict:
+    """크롤링 -> 저장된 XSS 분석 -> 폼/파라미터 스캔 (이벤트 출력) 후 요약 반환"""
+    pages = crawler.crawl()
+    for page in pages:
+        out.emit('page', url=page.url, title=page.title, forms=len(page.forms), params=sorted(page.params))
+
+    # 시간 예산 / dry-run: 스캔 계획 생성 (dry-run 은 계획만 출력하고 종료)
+    plan = None
+    if args.budget is not None or args.dry_run:
+        plan = scanner.plan(pages, quick_mode=not args.full, budget=args.budget)
+        out.emit('plan', target=base_url, **plan.summary())
+        if not args.quiet:
+            print(plan.describe(), file=sys.stderr)
+        if args.dry_run:
+            return {'target': base_url, 'dry_run': True, 'vulnerable': 0, 'stored_xss': 0}
+
+    findings_db = None
+    if args.findings_db:
+        from findings_db import FindingsDB
+        findings_db = FindingsDB(args.findings_db, target=base_url)
+    try:
+        if findings_db is not None:
+            stored_results = scanner.scan_page_content(pages, findings_db=findings_db)
+        else:
+            stored_results = scanner.scan_page_content(pages)
+    finally:
+        if findings_db is not None:
+            findings_db.close()
+    for stored in stored_results:
+        out.emit('stored', **stored.to_dict())
+    for resolved in getattr(scanner, 'resolved_findings', []):
+        out.emit('resolved', target=base_url, **resolved)
+
+    journal = None
+    if args.journal:
+        from scan_journal import ScanJournal
+        journal = ScanJournal(args.journal)
+    try:
+        results = scanner.scan_pages(pages, quick_mode=not args.full, journal=journal, plan=plan)
+    finally:
+        if journal is not None:
+            journal.close()
+
+    summary = {
+        'target': base_url,
+        'engine': args.engine,
+        'pages_crawled': len(pages),
+        'stored_xss': len(stored_results),
+        'stored_unique': len(getattr(scanner, 'stored_index', stored_results)),
+        'partial_pages': len(getattr(scanner, 'partial_pages', [])),
+        **({'stored_new': sum(1 for r in stored_results if r.status == 'new'),
+            'stored_resolved': len(scanner.resolved_findings),
+            'unchanged_pages': scanner.unchanged_pages} if findings_db is not None else {}),
+        **({'browser_tests': scanner.browser_tests,
+            'executed': scanner.confirmed} if args.engine == 'hybrid' else {}),
+        'elapsed': round(time.time() - started, 2),
+        **results.stats(),
+    }
+    out.emit('summary', **summary)
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    targets = list(args.urls)
+    if args.targets:
+        from batch_scan import load_targets
+        targets += [url for url in load_targets(args.targets) if url not in targets]
+    if not targets:
+        parser.error("URL 또는 --targets 를 지정하세요.")
+    if args.journal and len(targets) > 1:
+        parser.error("--journal 은 대상이 하나일 때만 사용할 수 있습니다.")
+    if args.findings_db and args.engine == 'selenium':
+        parser.error("--findings-db 는 requests/hybrid 엔진에서만 사용할 수 있습니다.")
+
+    stream = open(args.output, 'a', encoding='utf-8') if args.output else sys.stdout
+    out = JsonlWriter(stream)
+    callback = make_callback(out, args.quiet)
+
+    vulnerable = failed = 0
+    try:
+        for base_url in targets:
+            try:
+                summary = scan_target(args, base_url, out, callback)
+            except Exception as e:
+                out.emit('error', target=base_url, message=str(e))
+                failed += 1
+                continue
+            vulnerable += summary['vulnerable'] + summary['stored_xss']
+    except KeyboardInterrupt:
+        out.emit('error', message='interrupted')
+        return 130
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    if vulnerable:
+        return 1
+    return 3 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())